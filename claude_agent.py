@@ -4,6 +4,7 @@ from claude_agent_sdk import ClaudeSDKClient, ClaudeAgentOptions, AssistantMessa
 import subprocess
 import os
 from pathlib import Path
+from profiling import profiled
 
 async def main():
     # Skills and CLAUDE.md are loaded automatically by Claude SDK from cwd
@@ -65,6 +66,7 @@ async def main():
     @tool("deploy_to_github",
     "Initializes Git, commits EVERYTHING, and pushes it to the configured repository. Use this ONLY at the very end.",
     {})
+    @profiled("deploy_to_github")
     async def deploy_to_github(args):
         import time
         t_deploy_start = time.time()
@@ -90,26 +92,31 @@ async def main():
                 run_git_cmd(f"git remote add origin {git_push_url}")
             
             # Mit HOME=/home/user/app schreibt das SDK direkt nach /home/user/app/.claude/
-            # Kein Kopieren nötig! .claude ist bereits im Repo-Ordner.
-            print("[DEPLOY] 💾 Session wird mit Code gepusht (HOME=/home/user/app)")
+            # Session-Transkripte landen (außer im inline-Modus) NICHT im Deploy-Commit,
+            # sondern komprimiert + content-addressed im Session Store
+            from session_artifacts import SessionArtifactManager
+            session_store = SessionArtifactManager()
             
             # Session ID wird später von ResultMessage gespeichert
             # Hier nur prüfen ob .claude existiert
-            check_result = subprocess.run(
-                "ls /home/user/app/.claude 2>&1",
-                shell=True,
-                capture_output=True,
-                text=True
-            )
-            if check_result.returncode == 0:
-                print("[DEPLOY] ✅ .claude/ vorhanden - wird mit gepusht")
+            if session_store.claude_dir.exists():
+                print(f"[DEPLOY] ✅ .claude/ vorhanden - Session Store: {session_store.mode}")
             else:
                 print("[DEPLOY] ⚠️ .claude/ nicht gefunden")
             
-            # Neuen Code committen (includes .claude/ direkt im Repo)
+            # Neuen Code committen
             run_git_cmd("git add -A")
-            # Force add .claude (exclude debug/ - may contain secrets)
-            subprocess.run("git add -f .claude ':!.claude/debug' .claude_session_id 2>/dev/null", shell=True, cwd="/home/user/app")
+            if session_store.mode == "inline":
+                # Force add .claude (exclude debug/ - may contain secrets)
+                subprocess.run("git add -f .claude ':!.claude/debug' .claude_session_id 2>/dev/null", shell=True, cwd="/home/user/app")
+            else:
+                # Früher mitgepushte Transkripte aus dem Index entfernen (bleiben auf der Platte)
+                run_git_cmd("git rm -r -q --cached --ignore-unmatch .claude")
+                subprocess.run("git add -f .claude_session_id 2>/dev/null", shell=True, cwd="/home/user/app")
+                try:
+                    session_store.save()
+                except Exception as e:
+                    print(f"[DEPLOY] ⚠️ Session Store fehlgeschlagen: {e}")
             run_git_cmd("git commit -m 'Lilo Auto-Deploy' --allow-empty")
             run_git_cmd("git push origin main")
             
@@ -231,6 +238,7 @@ async def main():
             "required": ["apps"]
         }
     )
+    @profiled("create_apps")
     async def create_apps(args):
         """Create LivingApps apps and return metadata for TypeScript generation."""
         import httpx
@@ -436,6 +444,7 @@ async def main():
             "required": []
         }
     )
+    @profiled("generate_typescript")
     async def generate_typescript(args):
         """Generate TypeScript files and optionally React CRUD scaffolds from app metadata."""
         crud_scaffolds = args.get("crud_scaffolds", [])
@@ -452,27 +461,17 @@ async def main():
         
         try:
             # Import the generator (copied to sandbox by sandbox.py)
-            from typescript_generator import TypeScriptGenerator
+            from typescript_generator import TypeScriptGenerator, write_streamed
             
             generator = TypeScriptGenerator(metadata)
-            types_code = generator.generate_types()
-            service_code = generator.generate_service()
-            
-            # Ensure directories exist
-            Path("src/types").mkdir(parents=True, exist_ok=True)
-            Path("src/services").mkdir(parents=True, exist_ok=True)
+            for collision in generator.names.collisions:
+                print(f"[TYPESCRIPT] ⚠️ Name collision: {collision}")
             
-            # Write files
-            with open("src/types/app.ts", "w") as f:
-                f.write(types_code)
-            
-            with open("src/services/livingAppsService.ts", "w") as f:
-                f.write(service_code)
-            
-            generated_files = ["src/types/app.ts", "src/services/livingAppsService.ts"]
-            
-            print("[TYPESCRIPT] ✅ Generated src/types/app.ts")
-            print("[TYPESCRIPT] ✅ Generated src/services/livingAppsService.ts")
+            # Files are streamed straight to disk (one file in memory at a time)
+            generated_files = write_streamed(
+                generator.iter_files(),
+                on_written=lambda path: print(f"[TYPESCRIPT] ✅ Generated {path}")
+            )
             
             # Generate React CRUD scaffolds if requested
             if crud_scaffolds:
@@ -481,14 +480,11 @@ async def main():
                     from react_component_generator import ReactComponentGenerator
                     
                     react_gen = ReactComponentGenerator(metadata, crud_scaffolds)
-                    react_files = react_gen.generate_all()
-                    
-                    for filepath, content in react_files.items():
-                        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-                        with open(filepath, "w") as f:
-                            f.write(content)
-                        generated_files.append(filepath)
-                        print(f"[SCAFFOLD] ✅ Generated {filepath}")
+                    react_files = write_streamed(
+                        react_gen.iter_files(),
+                        on_written=lambda path: print(f"[SCAFFOLD] ✅ Generated {path}")
+                    )
+                    generated_files.extend(react_files)
                     
                     print(f"[SCAFFOLD] ✅ Generated {len(react_files)} React scaffold files")
                 except ImportError:
@@ -574,13 +570,119 @@ async def main():
                 "is_error": True
             }
 
+    # ============================================================
+    # NEW TOOL: seed_sample_data
+    # Bulk-loads realistic synthetic records (parents first)
+    # ============================================================
+    @tool("seed_sample_data",
+        "Fill the LivingApps apps with realistic synthetic records so pages can be tested with real data volumes. "
+        "Call AFTER create_apps. Metadata is auto-read from app_metadata.json. "
+        "Values follow each field's type, lookup keys and required flags; applookup fields reference seeded parent records. "
+        "Only use this when the user asks for test/demo data — records are created in the real apps.",
+        {
+            "type": "object",
+            "properties": {
+                "counts": {
+                    "type": "object",
+                    "description": "Records per app identifier, e.g. {'kurse': 50, 'anmeldungen': 10000}. "
+                                  "Apps not listed are not seeded (existing records are used as applookup targets)."
+                },
+                "concurrency": {"type": "integer", "description": "Parallel create requests (default 8, max 32)"},
+                "seed": {"type": "integer", "description": "Random seed for reproducible data"}
+            },
+            "required": ["counts"]
+        }
+    )
+    @profiled("seed_sample_data")
+    async def seed_sample_data(args):
+        """Generate synthetic records from app metadata and create them with bounded concurrency."""
+        counts = args.get("counts", {})
+        concurrency = max(1, min(int(args.get("concurrency", 8)), 32))
+        api_key = os.environ.get("LIVINGAPPS_API_KEY")
+        
+        if not api_key:
+            return {"content": [{"type": "text", "text": "Error: LIVINGAPPS_API_KEY not set"}], "is_error": True}
+        
+        metadata_path = Path("app_metadata.json")
+        if not metadata_path.exists():
+            return {"content": [{"type": "text", "text": "Error: app_metadata.json not found. Call create_apps first."}], "is_error": True}
+        
+        with open(metadata_path) as f:
+            metadata = json.load(f)
+        
+        unknown = [k for k in counts if k not in metadata.get("apps", {})]
+        if unknown or not counts:
+            return {"content": [{"type": "text", "text": f"Error: Unknown app identifiers: {', '.join(unknown) or '(none given)'}"}], "is_error": True}
+        
+        try:
+            from sample_data import seed_sample_data as run_seed
+            
+            counts = {k: max(0, min(int(v), 50000)) for k, v in counts.items()}
+            print(f"[SEED] 🌱 Seeding {sum(counts.values())} records (concurrency {concurrency})...")
+            report = await run_seed(metadata, api_key, counts, concurrency=concurrency, seed=args.get("seed"))
+            print(f"[SEED] ✅ {report['total_created']} records in {report['seconds']}s ({report['records_per_second']} records/s)")
+            
+            return {
+                "content": [{"type": "text", "text": json.dumps(report, indent=2)}],
+                "is_error": report["total_created"] == 0
+            }
+        except Exception as e:
+            return {"content": [{"type": "text", "text": f"Error seeding sample data: {str(e)}"}], "is_error": True}
+
+    # ============================================================
+    # NEW TOOL: snapshot_records
+    # Exports all appgroup records to local NDJSON + columnar files
+    # ============================================================
+    @tool("snapshot_records",
+        "Export a local snapshot of all records of every app in app_metadata.json (for analysis or test fixtures). "
+        "Writes one NDJSON and one typed columnar file (Parquet if pyarrow is installed) per app; "
+        "applookup URLs are stored as record IDs. Use incremental=true to only re-process records changed since the last snapshot.",
+        {
+            "type": "object",
+            "properties": {
+                "out_dir": {"type": "string", "description": "Target directory (default: $SNAPSHOT_DIR or /home/user/snapshots — outside the deployed repo)"},
+                "incremental": {"type": "boolean", "description": "Reuse unchanged rows from the previous snapshot"},
+                "concurrency": {"type": "integer", "description": "Parallel app downloads (default 8)"}
+            },
+            "required": []
+        }
+    )
+    @profiled("snapshot_records")
+    async def snapshot_records(args):
+        """Fetch all apps' records concurrently and write them to local snapshot files."""
+        api_key = os.environ.get("LIVINGAPPS_API_KEY")
+        if not api_key:
+            return {"content": [{"type": "text", "text": "Error: LIVINGAPPS_API_KEY not set"}], "is_error": True}
+        
+        metadata_path = Path("app_metadata.json")
+        if not metadata_path.exists():
+            return {"content": [{"type": "text", "text": "Error: app_metadata.json not found. Call create_apps first."}], "is_error": True}
+        
+        with open(metadata_path) as f:
+            metadata = json.load(f)
+        
+        out_dir = args.get("out_dir") or os.getenv("SNAPSHOT_DIR", "/home/user/snapshots")
+        try:
+            from snapshot import snapshot_appgroup
+            
+            print(f"[SNAPSHOT] 📦 Exporting {len(metadata.get('apps', {}))} apps to {out_dir}...")
+            report = await snapshot_appgroup(
+                metadata, api_key, out_dir,
+                incremental=bool(args.get("incremental")),
+                concurrency=max(1, min(int(args.get("concurrency", 8)), 32)),
+            )
+            print(f"[SNAPSHOT] ✅ Snapshot done ({report['seconds']}s)")
+            return {"content": [{"type": "text", "text": json.dumps(report, indent=2)}]}
+        except Exception as e:
+            return {"content": [{"type": "text", "text": f"Error creating snapshot: {str(e)}"}], "is_error": True}
+
     # ============================================================
     # CREATE MCP SERVER WITH ALL TOOLS
     # ============================================================
     dashboard_tools_server = create_sdk_mcp_server(
         name="dashboard_tools",
         version="1.0.0",
-        tools=[deploy_to_github, create_apps, generate_typescript]
+        tools=[deploy_to_github, create_apps, generate_typescript, seed_sample_data, snapshot_records]
     )
 
     # 3. Optionen konfigurieren
@@ -597,7 +699,9 @@ async def main():
             "Bash", "Write", "Read", "Edit", "Glob", "Grep", "Task", "TodoWrite",
             "mcp__dashboard_tools__deploy_to_github",
             "mcp__dashboard_tools__create_apps",
-            "mcp__dashboard_tools__generate_typescript"
+            "mcp__dashboard_tools__generate_typescript",
+            "mcp__dashboard_tools__seed_sample_data",
+            "mcp__dashboard_tools__snapshot_records"
         ],
         cwd="/home/user/app",
         model="claude-sonnet-4-6"#"claude-opus-4-5-20251101"#, #"claude-sonnet-4-5-20250929"
@@ -606,6 +710,12 @@ async def main():
     # Session-Resume Unterstützung
     resume_session_id = os.getenv('RESUME_SESSION_ID')
     if resume_session_id:
+        # Transkripte liegen nicht mehr im Deploy-Repo — aus dem Session Store wiederherstellen
+        try:
+            from session_artifacts import SessionArtifactManager
+            SessionArtifactManager().restore()
+        except Exception as e:
+            print(f"[LILO] ⚠️ Session Store Restore fehlgeschlagen: {e}")
         options.resume = resume_session_id
         print(f"[LILO] Resuming session: {resume_session_id}")
 
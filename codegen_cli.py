@@ -0,0 +1,171 @@
+"""
+Command-line entry point for the code generators (without an agent session).
+
+    python codegen_cli.py                                   # types + service from ./app_metadata.json
+    python codegen_cli.py --scaffold kurse --scaffold anmeldungen --out /tmp/app
+    python codegen_cli.py --scaffold all --watch            # regenerate on every metadata change
+    python codegen_cli.py --python-client livingapps_client.py
+    python codegen_cli.py --modular --scaffold all          # one types/service module per entity
+
+--watch polls the metadata file's mtime. Every output has a fingerprint of the
+metadata it is rendered from (an entity page depends on its own app, its lookup
+targets' names/display fields and the UI language; types, service, router and
+layout depend on the whole appgroup) — only outputs whose fingerprint changed
+are rendered and written again.
+"""
+import argparse
+import hashlib
+import json
+import time
+from pathlib import Path
+
+from typescript_generator import TypeScriptGenerator, write_streamed
+
+
+def _fingerprint(*parts) -> str:
+    return hashlib.sha1(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class CodegenSession:
+    """Generates all outputs for one metadata file and remembers their fingerprints."""
+
+    def __init__(self, metadata_path: str, out_dir: str = ".", scaffolds: list = None,
+                 python_client: str = None, modular: bool = False):
+        self.metadata_path = Path(metadata_path)
+        self.out_dir = out_dir
+        self.scaffolds = scaffolds or []
+        self.python_client = python_client
+        self.modular = modular
+        self.fingerprints = {}  # output path -> fingerprint of the last written version
+
+    def _resolve_scaffolds(self, metadata: dict) -> list:
+        apps = metadata.get("apps", {})
+        if "all" in self.scaffolds:
+            return list(apps)
+        for identifier in self.scaffolds:
+            if identifier not in apps:
+                print(f"[CODEGEN] ⚠️ Unknown scaffold '{identifier}' — not in {self.metadata_path}")
+        return [s for s in self.scaffolds if s in apps]
+
+    def _jobs(self, metadata: dict):
+        """Yields (path, fingerprint, render) for every output; render() returns the file's lines."""
+        global_fp = _fingerprint(metadata.get("apps", {}), self.scaffolds, self.modular)
+
+        generator = TypeScriptGenerator(metadata, modular=self.modular)
+        for collision in generator.names.collisions:
+            print(f"[CODEGEN] ⚠️ Name collision: {collision}")
+        # Entity modules (--modular) only depend on their own app and the names of its lookup targets
+        entity_modules = {}
+        for app in generator.schema:
+            entity_fp = _fingerprint(metadata["apps"][app.identifier], [e.target_pascal for e in app.deps])
+            entity_modules[f"src/types/entities/{app.names.pascal}.ts"] = entity_fp
+            entity_modules[f"src/services/entities/{app.names.pascal}.ts"] = entity_fp
+        for path, chunks in generator.iter_files():
+            yield path, entity_modules.get(path, global_fp), lambda chunks=chunks: chunks
+
+        if self.python_client:
+            from python_client_generator import PythonClientGenerator
+            client_gen = PythonClientGenerator(metadata)
+            yield self.python_client, global_fp, lambda: [client_gen.generate_client()]
+
+        scaffolds = self._resolve_scaffolds(metadata)
+        if not scaffolds:
+            return
+
+        from react_component_generator import ReactComponentGenerator
+        react_gen = ReactComponentGenerator(metadata, scaffolds, modular=self.modular)
+        for path, chunks in react_gen._iter_shared_files():
+            # Generator objects are lazy — nothing is rendered unless the file is written
+            yield path, global_fp, lambda chunks=chunks: chunks
+
+        for identifier in react_gen.crud_scaffolds:
+            app = react_gen.schema[identifier]
+            edges = [(e.ctrl_key, e.target_identifier, e.target_pascal, e.target_const, e.display_field)
+                     for e in app.deps]
+            entity_fp = _fingerprint(react_gen.lang, react_gen.apps[identifier], edges)
+            names = react_gen.names[identifier]
+            yield names.page_file, entity_fp, lambda i=identifier: react_gen._iter_entity_page(i)
+            yield names.dialog_file, entity_fp, lambda i=identifier: react_gen._iter_entity_dialog(i)
+
+        for identifier in react_gen.apps:
+            if identifier not in react_gen.crud_scaffolds:
+                placeholder_fp = _fingerprint(identifier, react_gen.apps[identifier].get("name"))
+                yield (react_gen.names[identifier].page_file, placeholder_fp,
+                       lambda i=identifier: react_gen._iter_placeholder_page(i))
+
+    def run(self) -> list:
+        """Generates all outputs whose fingerprint changed. Returns the written paths."""
+        t_start = time.time()
+        with open(self.metadata_path) as f:
+            metadata = json.load(f)
+
+        changed = []
+        for path, fp, render in self._jobs(metadata):
+            if self.fingerprints.get(path) != fp or not (Path(self.out_dir) / path).exists():
+                changed.append((path, fp, render))
+
+        written = write_streamed(((path, render()) for path, _, render in changed), base_dir=self.out_dir)
+        for path, fp, _ in changed:
+            self.fingerprints[path] = fp
+        ms = (time.time() - t_start) * 1000
+        for path in written:
+            print(f"[CODEGEN] ✅ Generated {path}")
+        print(f"[CODEGEN] {len(written)} file(s) written in {ms:.0f} ms")
+        return written
+
+    def watch(self, interval: float = 0.2):
+        """Polls the metadata file and re-runs on every mtime change (Ctrl+C to stop)."""
+        self.run()
+        last_mtime = self.metadata_path.stat().st_mtime_ns
+        print(f"[CODEGEN] 👀 Watching {self.metadata_path} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(interval)
+                try:
+                    mtime = self.metadata_path.stat().st_mtime_ns
+                except FileNotFoundError:
+                    continue  # editor is replacing the file
+                if mtime == last_mtime:
+                    continue
+                last_mtime = mtime
+                try:
+                    self.run()
+                except json.JSONDecodeError as e:
+                    # Half-saved file — the next write triggers another run
+                    print(f"[CODEGEN] ⚠️ {self.metadata_path} is not valid JSON yet: {e}")
+                except Exception as e:
+                    print(f"[CODEGEN] ❌ Generation failed: {e}")
+        except KeyboardInterrupt:
+            pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate TypeScript types, service and React scaffolds from app_metadata.json")
+    parser.add_argument("--metadata", default="app_metadata.json")
+    parser.add_argument("--out", default=".", help="Project root the src/ files are written into")
+    parser.add_argument("--scaffold", action="append", default=[],
+                        help="App identifier to scaffold (repeatable, comma-separated or 'all')")
+    parser.add_argument("--python-client", metavar="PATH", help="Also generate the async Python client (relative to --out)")
+    parser.add_argument("--modular", action="store_true",
+                        help="One types + service module per entity (src/*/entities/) with compatibility barrels")
+    parser.add_argument("--keywords", action="append", default=[], metavar="JSON",
+                        help="Custom keyword->icon / keyword->language tables (repeatable, see keyword_matcher.py)")
+    parser.add_argument("--watch", action="store_true", help="Regenerate affected files whenever the metadata changes")
+    parser.add_argument("--interval", type=float, default=0.2, help="Watch polling interval in seconds")
+    args = parser.parse_args(argv)
+
+    if args.keywords:
+        from react_component_generator import ReactComponentGenerator
+        for path in args.keywords:
+            ReactComponentGenerator.load_keyword_tables(path)
+
+    scaffolds = [s.strip() for value in args.scaffold for s in value.split(",") if s.strip()]
+    session = CodegenSession(args.metadata, args.out, scaffolds, args.python_client, args.modular)
+    if args.watch:
+        session.watch(args.interval)
+    else:
+        session.run()
+
+
+if __name__ == "__main__":
+    main()
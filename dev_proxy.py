@@ -0,0 +1,162 @@
+"""
+Record/replay caching proxy for the LivingApps REST API (development only).
+
+Responses are stored on disk keyed by method, path (incl. query) and request body
+and served from there on the next request, optionally with simulated latency.
+
+    python dev_proxy.py --mode record          # forward misses + store, serve GET hits from cache
+    python dev_proxy.py --mode replay          # offline: cache only, misses return 504
+    python dev_proxy.py --mode refresh         # always forward, overwrite cache
+
+Vite dev server (vite.config.ts proxies /api/rest -> LIVINGAPPS_PROXY_TARGET):
+
+    LIVINGAPPS_PROXY_TARGET=http://localhost:8787 VITE_LIVINGAPPS_API_BASE=/api/rest npm run dev
+"""
+import argparse
+import base64
+import hashlib
+import json
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+
+UPSTREAM_URL = "https://my.living-apps.de"
+FORWARD_REQUEST_HEADERS = ("Accept", "Authorization", "Content-Type", "Cookie", "X-API-Key")
+FORWARD_RESPONSE_HEADERS = ("Content-Type", "Set-Cookie")
+
+
+class RecordReplayCache:
+    """On-disk response cache: one JSON file per (method, path, body) key."""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(method: str, path: str, body: bytes) -> str:
+        digest = hashlib.sha256()
+        digest.update(method.upper().encode())
+        digest.update(b"\0" + path.encode() + b"\0")
+        digest.update(body or b"")
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str):
+        path = self._path(key)
+        if not path.exists():
+            return None
+        with open(path) as f:
+            entry = json.load(f)
+        entry["body"] = base64.b64decode(entry["body"])
+        return entry
+
+    def put(self, key: str, method: str, path: str, status: int, headers: dict, body: bytes):
+        target = self._path(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "method": method,
+            "path": path,
+            "status": status,
+            "headers": headers,
+            "body": base64.b64encode(body).decode("ascii"),
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        tmp = target.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(entry, f)
+        tmp.replace(target)
+
+
+class ProxyHandler(BaseHTTPRequestHandler):
+    # Set by serve()
+    cache: RecordReplayCache = None
+    mode = "record"
+    upstream = UPSTREAM_URL
+    latency = 0.0
+
+    def _forward(self, method: str, body: bytes):
+        headers = {h: self.headers[h] for h in FORWARD_REQUEST_HEADERS if self.headers.get(h)}
+        request = urllib.request.Request(self.upstream + self.path, data=body or None, method=method, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=60) as resp:
+                return resp.status, resp.headers, resp.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.headers, e.read()
+
+    def _send(self, status: int, headers: dict, body: bytes, source: str):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-Dev-Proxy", source)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self):
+        method = self.command
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        key = self.cache.key(method, self.path, body)
+
+        # Mutations always reach the server while recording; reads are served from cache
+        use_cache = self.mode == "replay" or (self.mode == "record" and method == "GET")
+        if use_cache:
+            entry = self.cache.get(key)
+            if entry is not None:
+                if self.latency:
+                    time.sleep(self.latency)
+                self._send(entry["status"], entry["headers"], entry["body"], "hit")
+                return
+            if self.mode == "replay":
+                message = json.dumps({"error": f"dev_proxy: no recording for {method} {self.path}"}).encode()
+                self._send(504, {"Content-Type": "application/json"}, message, "miss")
+                return
+
+        try:
+            status, resp_headers, resp_body = self._forward(method, body)
+        except Exception as e:
+            message = json.dumps({"error": f"dev_proxy: upstream failed: {e}"}).encode()
+            self._send(502, {"Content-Type": "application/json"}, message, "error")
+            return
+
+        headers = {h: resp_headers[h] for h in FORWARD_RESPONSE_HEADERS if resp_headers.get(h)}
+        # Server errors are not worth replaying
+        if status < 500:
+            self.cache.put(key, method, self.path, status, headers, resp_body)
+        self._send(status, headers, resp_body, "forward")
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+    def log_message(self, fmt, *args):
+        print(f"[DEV-PROXY] {self.command} {self.path} {args[1] if len(args) > 1 else ''}")
+
+
+def serve(port: int = 8787, cache_dir: str = ".dev_proxy_cache", mode: str = "record",
+          upstream: str = UPSTREAM_URL, latency_ms: float = 0):
+    ProxyHandler.cache = RecordReplayCache(cache_dir)
+    ProxyHandler.mode = mode
+    ProxyHandler.upstream = upstream.rstrip("/")
+    ProxyHandler.latency = latency_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", port), ProxyHandler)
+    print(f"[DEV-PROXY] 🔁 {mode} mode on http://127.0.0.1:{port} → {upstream} (cache: {cache_dir})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record/replay caching proxy for the LivingApps REST API")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--cache-dir", default=".dev_proxy_cache")
+    parser.add_argument("--mode", choices=("record", "replay", "refresh"), default="record")
+    parser.add_argument("--upstream", default=UPSTREAM_URL)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Simulated latency for cached responses")
+    args = parser.parse_args()
+    serve(args.port, args.cache_dir, args.mode, args.upstream, args.latency_ms)
@@ -0,0 +1,166 @@
+import json
+import re
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over a set of keywords.
+
+    All keywords contained in a text are found in one pass over the text,
+    independent of how many keywords are registered. Each keyword carries a
+    payload; iter_matches() yields the payloads of every keyword found.
+    """
+
+    def __init__(self):
+        self._goto = [{}]    # state -> {char: next state}
+        self._fail = [0]
+        self._out = [[]]     # state -> payloads of keywords ending here
+        self._compiled = True
+
+    def add(self, keyword: str, payload):
+        state = 0
+        for char in keyword:
+            nxt = self._goto[state].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(payload)
+        self._compiled = False
+
+    def _compile(self):
+        """Breadth-first construction of failure links (outputs are merged along them)."""
+        queue = list(self._goto[0].values())
+        for state in queue:
+            self._fail[state] = 0
+        for state in queue:
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+        self._compiled = True
+
+    def iter_matches(self, text: str):
+        if not self._compiled:
+            self._compile()
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                yield from out[state]
+
+
+class IconRegistry:
+    """
+    keyword -> icon table with priority ordering, compiled to two matchers.
+
+    A keyword matches when it occurs in the lowercased identifier, or when its
+    normalized form occurs in the normalized identifier (umlauts/digraphs folded,
+    see normalize()). Earlier keywords win; register(..., override=True) puts
+    the new table in front of the existing one.
+    """
+
+    def __init__(self, table: dict = None, default: str = "FileText"):
+        self.default = default
+        self._entries = list((table or {}).items())
+        self._raw = self._folded = None
+        self._cache = {}
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Collapse umlauts and ae/oe/ue digraphs to base vowels for fuzzy icon matching."""
+        text = text.replace("ä", "a").replace("ö", "o").replace("ü", "u").replace("ß", "ss")
+        text = text.replace("ae", "a").replace("oe", "o").replace("ue", "u")
+        return text
+
+    def register(self, table: dict, override: bool = True):
+        new = [(keyword.lower(), icon) for keyword, icon in table.items()]
+        self._entries = new + self._entries if override else self._entries + new
+        self._raw = self._folded = None
+        self._cache.clear()
+
+    def _build(self):
+        self._raw, self._folded = KeywordMatcher(), KeywordMatcher()
+        for priority, (keyword, icon) in enumerate(self._entries):
+            self._raw.add(keyword, (priority, icon))
+            self._folded.add(self.normalize(keyword), (priority, icon))
+
+    def icon_for(self, identifier: str) -> str:
+        icon = self._cache.get(identifier)
+        if icon is None:
+            if self._raw is None:
+                self._build()
+            lower = identifier.lower()
+            matches = [*self._raw.iter_matches(lower), *self._folded.iter_matches(self.normalize(lower))]
+            icon = self._cache[identifier] = min(matches)[1] if matches else self.default
+        return icon
+
+
+class LanguageRegistry:
+    """
+    Detects the UI language from entity names and labels.
+
+    Each language has marker characters (a strong signal, e.g. 'äöüß') and
+    marker words, of which at least min_words distinct ones must appear.
+    Languages are checked in registration order; character markers first,
+    then words. Falls back to `default`.
+    """
+
+    _WORD_SPLIT_RE = re.compile(r"\W+")
+
+    def __init__(self, table: dict = None, default: str = "en"):
+        self.default = default
+        self.languages = {}      # lang -> (chars, min_words)
+        self._word_langs = {}    # word -> [lang, ...]
+        for lang, spec in (table or {}).items():
+            self.register(lang, **spec)
+
+    def register(self, lang: str, chars: str = "", words=(), min_words: int = 2):
+        self.languages[lang] = (frozenset(chars), min_words)
+        for word in words:
+            langs = self._word_langs.setdefault(word.lower(), [])
+            if lang not in langs:
+                langs.append(lang)
+
+    def detect(self, texts) -> str:
+        text = " ".join(texts).lower()
+        text_chars = set(text)
+        for lang, (chars, _) in self.languages.items():
+            if chars & text_chars:
+                return lang
+
+        hits = {}
+        for word in set(self._WORD_SPLIT_RE.split(text)):
+            for lang in self._word_langs.get(word, ()):
+                hits[lang] = hits.get(lang, 0) + 1
+        for lang, (_, min_words) in self.languages.items():
+            if hits.get(lang, 0) >= min_words:
+                return lang
+        return self.default
+
+
+def load_keyword_tables(path: str, icons: IconRegistry, languages: LanguageRegistry):
+    """
+    Loads custom tables from a JSON file into the registries:
+
+        {"icons": {"patient": "HeartPulse", ...},
+         "languages": {"fr": {"chars": "éèêç", "words": ["nom", "adresse"], "min_words": 2}}}
+
+    Custom icon keywords take priority over the built-in ones.
+    """
+    with open(path, encoding="utf-8") as f:
+        tables = json.load(f)
+    if tables.get("icons"):
+        icons.register(tables["icons"])
+    for lang, spec in tables.get("languages", {}).items():
+        languages.register(lang, **spec)
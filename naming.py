@@ -0,0 +1,117 @@
+import re
+from functools import lru_cache
+
+
+# Shared naming rules for all generators — generated imports only resolve if
+# TypeScriptGenerator, ReactComponentGenerator and PythonClientGenerator agree.
+_UMLAUTS = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+_NON_ALNUM_RE = re.compile(r"[^a-zA-Z0-9]")
+_CONST_STRIP_RE = re.compile(r"[-& ]")
+_MULTI_UNDERSCORE_RE = re.compile(r"_+")
+
+
+@lru_cache(maxsize=None)
+def to_pascal_case(text: str) -> str:
+    """Macht aus 'workout_logs' -> 'WorkoutLogs'"""
+    text = text.translate(_UMLAUTS)
+    return "".join(word.capitalize() for word in _NON_ALNUM_RE.sub(" ", text).split())
+
+
+@lru_cache(maxsize=None)
+def to_const_name(identifier: str) -> str:
+    """Macht aus 'workout-logs' -> 'WORKOUT_LOGS' (Keys von APP_IDS)"""
+    name = _CONST_STRIP_RE.sub(lambda m: "" if m.group() == "&" else "_", identifier.upper())
+    return _MULTI_UNDERSCORE_RE.sub("_", name)
+
+
+def to_singular(pascal_name: str) -> str:
+    """Einfache Heuristik: Wenn es auf 's' endet, weg damit. Sonst 'Entry' anhängen."""
+    return pascal_name[:-1] if pascal_name.endswith("s") else f"{pascal_name}Entry"
+
+
+def lookup_type_names(identifier: str, ctrl_key: str) -> tuple:
+    """(KEYS-Konstante, Key-Typ, LABELS-Konstante) für ein lookup/select-Feld, z.B.
+    ('KURSE_STATUS_KEYS', 'KurseStatusKey', 'KURSE_STATUS_LABELS')"""
+    prefix = f"{to_const_name(identifier)}_{to_const_name(ctrl_key)}"
+    return f"{prefix}_KEYS", f"{to_pascal_case(identifier)}{to_pascal_case(ctrl_key)}Key", f"{prefix}_LABELS"
+
+
+class EntityNames:
+    """All generated names for one app identifier (computed once)."""
+
+    __slots__ = ("identifier", "pascal", "const", "singular", "route", "page_file", "dialog_file", "service_ns", "lookup_type")
+
+    def __init__(self, identifier: str):
+        self.identifier = identifier
+        self.pascal = to_pascal_case(identifier)
+        self.const = to_const_name(identifier)
+        self.singular = to_singular(self.pascal)
+        self.route = identifier.replace("_", "-")
+        self.page_file = f"src/pages/{self.pascal}Page.tsx"
+        self.dialog_file = f"src/components/dialogs/{self.pascal}Dialog.tsx"
+        # Namespace-Import des Entity-Service-Moduls (kleingeschrieben: kollidiert nie mit Interfaces)
+        self.service_ns = f"{self.pascal[:1].lower()}{self.pascal[1:]}Service"
+        # Schlanker Typ für Applookup-Listen (record_id + Anzeigefeld)
+        self.lookup_type = f"{self.pascal}Lookup"
+
+    def __repr__(self) -> str:
+        return f"EntityNames({self.identifier!r} -> {self.pascal})"
+
+
+class NamingRegistry:
+    """
+    Interface, const, singular and file names for every app of one metadata load.
+
+    Use NamingRegistry.for_metadata(metadata) so both generators share one instance.
+    `collisions` lists identifiers that would produce clashing generated names
+    (e.g. 'task' and 'tasks' both generating getTask()).
+    """
+
+    _last = None  # (metadata, registry) — one registry per metadata load
+
+    def __init__(self, metadata: dict):
+        self.entities = {identifier: EntityNames(identifier) for identifier in metadata.get("apps", {})}
+        self.collisions = self._find_collisions()
+
+    @classmethod
+    def for_metadata(cls, metadata: dict) -> "NamingRegistry":
+        if cls._last is None or cls._last[0] is not metadata:
+            cls._last = (metadata, cls(metadata))
+        return cls._last[1]
+
+    def __getitem__(self, identifier: str) -> EntityNames:
+        names = self.entities.get(identifier)
+        if names is None:
+            # Identifiers outside the metadata (e.g. scaffolds for unknown apps)
+            names = self.entities[identifier] = EntityNames(identifier)
+        return names
+
+    def __iter__(self):
+        return iter(self.entities.values())
+
+    def _find_collisions(self) -> list:
+        collisions = []
+
+        def check(kind: str, pairs):
+            seen = {}
+            for name, identifier in pairs:
+                if name in seen and seen[name] != identifier:
+                    collisions.append(f"{kind} '{name}': '{seen[name]}' and '{identifier}'")
+                seen.setdefault(name, identifier)
+
+        for names in self.entities.values():
+            if not names.pascal:
+                collisions.append(f"identifier '{names.identifier}' has no letters or digits")
+        check("interface", (
+            (name, n.identifier)
+            for n in self.entities.values()
+            for name in (n.pascal, n.lookup_type)
+        ))
+        check("APP_IDS key", ((n.const, n.identifier) for n in self.entities.values()))
+        # get{Pascal}() (list) and get{Singular}() (one record) share one namespace
+        check("service method", (
+            (name, n.identifier)
+            for n in self.entities.values()
+            for name in dict.fromkeys((n.pascal, n.singular))
+        ))
+        return collisions
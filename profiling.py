@@ -0,0 +1,137 @@
+import asyncio
+import cProfile
+import functools
+import itertools
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+
+# Profiling is opt-in and decided once at import time:
+#   LILO_PROFILE=sample   — stack sampler only (low overhead)
+#   LILO_PROFILE=cprofile — deterministic cProfile + stack sampler
+# Anything else (default) leaves decorated functions completely untouched.
+PROFILE_MODE = os.getenv("LILO_PROFILE", "").strip().lower()
+PROFILE_DIR = Path(os.getenv("LILO_PROFILE_DIR", "/home/user/logs/profiles"))
+SAMPLE_INTERVAL = float(os.getenv("LILO_PROFILE_INTERVAL_MS", "2")) / 1000
+ENABLED = PROFILE_MODE in ("sample", "cprofile")
+
+_call_counter = itertools.count(1)
+_cprofile_lock = threading.Lock()
+
+
+class StackSampler:
+    """Samples the call stack of one thread in the background (collapsed-stack format)."""
+
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="lilo-profiler", daemon=True)
+
+    @staticmethod
+    def _label(frame) -> str:
+        code = frame.f_code
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(self._label(frame))
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def write_collapsed(self, path: Path):
+        """One line per unique stack: 'root;...;leaf count' (flamegraph.pl / speedscope input)."""
+        with open(path, "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+    def write_summary(self, path: Path, name: str, elapsed: float, top: int = 30):
+        self_counts = Counter()
+        for stack, count in self.stacks.items():
+            self_counts[stack.rsplit(";", 1)[-1]] += count
+        total = sum(self.stacks.values()) or 1
+        with open(path, "w") as f:
+            f.write(f"{name}: {elapsed:.3f}s, {total} samples @ {self.interval * 1000:.1f}ms\n\n")
+            f.write("  self%  samples  frame\n")
+            for frame, count in self_counts.most_common(top):
+                f.write(f"{100 * count / total:6.1f}%  {count:7d}  {frame}\n")
+
+
+class _CallProfile:
+    """Profiles a single call and writes its artifacts to PROFILE_DIR."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.sampler = StackSampler(threading.get_ident())
+        self.cprofile = None
+
+    def __enter__(self):
+        # cProfile allows one active profiler per thread; nested calls only get sampled
+        if PROFILE_MODE == "cprofile" and _cprofile_lock.acquire(blocking=False):
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+        self.sampler.start()
+        self.t_start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.t_start
+        self.sampler.stop()
+        if self.cprofile is not None:
+            self.cprofile.disable()
+            _cprofile_lock.release()
+
+        PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+        stem = PROFILE_DIR / f"{time.strftime('%Y%m%d-%H%M%S')}-{next(_call_counter):04d}-{self.name}"
+        self.sampler.write_collapsed(stem.with_suffix(".collapsed"))
+        if self.cprofile is not None:
+            self.cprofile.dump_stats(stem.with_suffix(".prof"))
+        else:
+            self.sampler.write_summary(stem.with_suffix(".txt"), self.name, elapsed)
+        print(f"[PROFILE] ⏱️ {self.name}: {elapsed:.3f}s → {stem}.*")
+        return False
+
+
+def profiled(name: str = None):
+    """
+    Decorator for tool handlers and generator entry points.
+
+    Returns the function itself when profiling is off, so there is no wrapper
+    and no overhead. Async functions are profiled across their awaits (other
+    tasks running on the same event loop show up in the samples).
+    """
+    def decorator(func):
+        if not ENABLED:
+            return func
+        label = name or func.__qualname__
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with _CallProfile(label):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _CallProfile(label):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
@@ -0,0 +1,345 @@
+import keyword
+import re
+
+from naming import NamingRegistry
+
+try:
+    from profiling import profiled
+except ImportError:  # generator copied without profiling.py
+    def profiled(name=None):
+        return lambda func: func
+
+
+class PythonClientGenerator:
+    """
+    Generates an async Python client (livingapps_client.py) from app metadata.
+
+    Same input format as TypeScriptGenerator. The generated module contains:
+    - one @dataclass(slots=True) record type per app (fields typed from fulltype; control keys
+      that are no valid Python names are renamed and mapped back in from_api/to_api)
+    - APP_IDS, extract_record_id() and create_record_url()
+    - LivingAppsClient: pooled httpx.AsyncClient with per-app get/create/update/delete,
+      concurrency-limited bulk create/update/delete and streaming iter_* over record lists
+
+    Naming follows TypeScriptGenerator (PascalCase types, singular method names).
+    """
+
+    PY_TYPES = {
+        "number": "float",
+        "bool": "bool",
+    }
+
+    def __init__(self, metadata: dict, api_base_url: str = "https://my.living-apps.de/rest"):
+        self.metadata = metadata
+        self.apps = metadata["apps"]
+        self.api_base_url = api_base_url
+        self.names = NamingRegistry.for_metadata(metadata)
+
+    # ================================================================
+    # Naming helpers — shared with the TypeScript generators via naming.py
+    # ================================================================
+
+    def _to_pascal_case(self, identifier: str) -> str:
+        return self.names[identifier].pascal
+
+    def _to_const_name(self, identifier: str) -> str:
+        return self.names[identifier].const
+
+    def _to_snake_case(self, identifier: str) -> str:
+        return self._to_const_name(identifier).lower()
+
+    def _to_singular(self, name: str) -> str:
+        """Singular for snake_case method names (mirrors the TypeScript heuristic)."""
+        return name[:-1] if name.endswith("s") else f"{name}_entry"
+
+    _NON_IDENTIFIER_RE = re.compile(r"\W")
+    # Methods of the generated *Fields classes — a slot with the same name would clash
+    _RESERVED_FIELD_NAMES = {"from_api", "to_api"}
+
+    def _field_names(self, controls: dict) -> dict:
+        """control key -> valid, unique dataclass field name ('class' -> 'class_', '1st-field' -> 'f_1st_field')"""
+        names = {}
+        for ctrl_key in controls:
+            name = self._NON_IDENTIFIER_RE.sub("_", ctrl_key) or "field"
+            if name[0].isdigit():
+                name = "f_" + name
+            while keyword.iskeyword(name) or name in self._RESERVED_FIELD_NAMES or name in names.values():
+                name += "_"
+            names[ctrl_key] = name
+        return names
+
+    def _map_type(self, control: dict) -> str:
+        ftype = control.get("fulltype", "string")
+        if ftype.startswith("multiple"):
+            return "list[str]"
+        return self.PY_TYPES.get(ftype, "str")
+
+    # ================================================================
+    # Main entry point
+    # ================================================================
+
+    @profiled("generate_python_client")
+    def generate_client(self) -> str:
+        L = []
+        L.append('"""AUTOMATICALLY GENERATED LIVINGAPPS CLIENT - DO NOT EDIT"""')
+        L.append("import asyncio")
+        L.append("import json")
+        L.append("import re")
+        L.append("from dataclasses import dataclass, field")
+        L.append("from typing import Any, AsyncIterator, Callable, Optional")
+        L.append("")
+        L.append("import httpx")
+        L.append("")
+        L.append("")
+        L.append("API_BASE_URL = '" + self.api_base_url + "'")
+        L.append("")
+        L.append("APP_IDS = {")
+        for app_key, app_data in self.apps.items():
+            L.append("    '" + self._to_const_name(app_key) + "': '" + app_data["app_id"] + "',")
+        L.append("}")
+        L.append("")
+        L.append("_RECORD_ID_RE = re.compile(r'([a-f0-9]{24})$', re.IGNORECASE)")
+        L.append("")
+        L.append("")
+        L.append("def extract_record_id(url: Optional[str]) -> Optional[str]:")
+        L.append("    if not url:")
+        L.append("        return None")
+        L.append("    match = _RECORD_ID_RE.search(url)")
+        L.append("    return match.group(1) if match else None")
+        L.append("")
+        L.append("")
+        L.append("def create_record_url(app_id: str, record_id: str) -> str:")
+        L.append("    return f'https://my.living-apps.de/rest/apps/{app_id}/records/{record_id}'")
+        L.append("")
+        L.append("")
+
+        # --- Record dataclasses ---
+        for app_key, app_data in self.apps.items():
+            pascal = self._to_pascal_case(app_key)
+            L.append("@dataclass(slots=True)")
+            L.append("class " + pascal + "Fields:")
+            controls = app_data.get("controls", {})
+            field_names = self._field_names(controls)
+            for ctrl_key, ctrl_data in controls.items():
+                L.append("    " + field_names[ctrl_key] + ": Optional[" + self._map_type(ctrl_data) + "] = None")
+            # (field name, API key) — control keys are not always valid Python names
+            if field_names:
+                L.append("    _API_KEYS = (")
+                L.extend("        (" + repr(name) + ", " + repr(key) + ")," for key, name in field_names.items())
+                L.append("    )")
+            else:
+                L.append("    _API_KEYS = ()")
+            L.append("")
+            L.append("    @classmethod")
+            L.append("    def from_api(cls, data: dict) -> '" + pascal + "Fields':")
+            L.append("        data = data or {}")
+            L.append("        return cls(**{name: data[key] for name, key in cls._API_KEYS if key in data})")
+            L.append("")
+            L.append("    def to_api(self, partial: bool = False) -> dict:")
+            L.append("        data = {key: getattr(self, name) for name, key in self._API_KEYS}")
+            L.append("        return {k: v for k, v in data.items() if v is not None} if partial else data")
+            L.append("")
+            L.append("")
+            L.append("@dataclass(slots=True)")
+            L.append("class " + pascal + ":")
+            L.append("    record_id: str")
+            L.append("    createdat: Optional[str] = None")
+            L.append("    updatedat: Optional[str] = None")
+            L.append("    fields: " + pascal + "Fields = field(default_factory=" + pascal + "Fields)")
+            L.append("")
+            L.append("    @classmethod")
+            L.append("    def from_api(cls, record_id: str, data: dict) -> '" + pascal + "':")
+            L.append("        return cls(")
+            L.append("            record_id=record_id,")
+            L.append("            createdat=data.get('createdat'),")
+            L.append("            updatedat=data.get('updatedat'),")
+            L.append("            fields=" + pascal + "Fields.from_api(data.get('fields')),")
+            L.append("        )")
+            L.append("")
+            L.append("")
+
+        L.extend(self._generate_runtime())
+
+        # --- Client class ---
+        L.append("class LivingAppsClient(_BaseClient):")
+        L.append('    """')
+        L.append("    Async LivingApps client with connection pooling.")
+        L.append("")
+        L.append("        async with LivingAppsClient(api_key=...) as client:")
+        L.append("            async for record in client.iter_" + self._to_snake_case(next(iter(self.apps), "apps")) + "():")
+        L.append("                ...")
+        L.append('    """')
+        L.append("")
+        for app_key in self.apps:
+            pascal = self._to_pascal_case(app_key)
+            const = self._to_const_name(app_key)
+            plural = self._to_snake_case(app_key)
+            singular = self._to_singular(plural)
+            app_id = 'APP_IDS["' + const + '"]'
+
+            L.append("    # --- " + app_key.upper() + " ---")
+            L.append("    async def get_" + plural + "(self) -> list[" + pascal + "]:")
+            L.append("        return [record async for record in self.iter_" + plural + "()]")
+            L.append("")
+            L.append("    async def iter_" + plural + "(self) -> AsyncIterator[" + pascal + "]:")
+            L.append("        async for record_id, data in self._stream_records(" + app_id + "):")
+            L.append("            yield " + pascal + ".from_api(record_id, data)")
+            L.append("")
+            L.append("    async def get_" + singular + "(self, record_id: str) -> " + pascal + ":")
+            L.append("        data = await self._request('GET', f'/apps/{" + app_id + "}/records/{record_id}')")
+            L.append("        return " + pascal + ".from_api(data.get('id', record_id), data)")
+            L.append("")
+            L.append("    async def create_" + singular + "(self, fields: " + pascal + "Fields) -> dict:")
+            L.append("        return await self._request('POST', f'/apps/{" + app_id + "}/records', {'fields': fields.to_api(partial=True)})")
+            L.append("")
+            L.append("    async def update_" + singular + "(self, record_id: str, fields: " + pascal + "Fields) -> dict:")
+            L.append("        return await self._request('PATCH', f'/apps/{" + app_id + "}/records/{record_id}', {'fields': fields.to_api(partial=True)})")
+            L.append("")
+            L.append("    async def delete_" + singular + "(self, record_id: str) -> bool:")
+            L.append("        return await self._request('DELETE', f'/apps/{" + app_id + "}/records/{record_id}')")
+            L.append("")
+            L.append("    async def create_many_" + plural + "(self, items: list[" + pascal + "Fields], on_progress: Callable[[int, int], None] = None) -> list:")
+            L.append("        return await self._bulk(self.create_" + singular + ", [(f,) for f in items], on_progress)")
+            L.append("")
+            L.append("    async def update_many_" + plural + "(self, items: list[tuple[str, " + pascal + "Fields]], on_progress: Callable[[int, int], None] = None) -> list:")
+            L.append("        return await self._bulk(self.update_" + singular + ", items, on_progress)")
+            L.append("")
+            L.append("    async def delete_many_" + plural + "(self, record_ids: list[str], on_progress: Callable[[int, int], None] = None) -> list:")
+            L.append("        return await self._bulk(self.delete_" + singular + ", [(rid,) for rid in record_ids], on_progress)")
+            L.append("")
+
+        return "\n".join(L).rstrip() + "\n"
+
+    def _generate_runtime(self) -> list:
+        """Static part of the module: pooled transport, retries, bulk runner, streaming JSON."""
+        return '''class BulkResult:
+    __slots__ = ("index", "ok", "value", "error")
+
+    def __init__(self, index: int, ok: bool, value: Any = None, error: Optional[BaseException] = None):
+        self.index = index
+        self.ok = ok
+        self.value = value
+        self.error = error
+
+    def __repr__(self) -> str:
+        return f"BulkResult(index={self.index}, ok={self.ok})"
+
+
+class _BaseClient:
+    RETRY_STATUS = {429, 502, 503, 504}
+
+    def __init__(self, api_key: str = None, base_url: str = API_BASE_URL, concurrency: int = 8,
+                 max_retries: int = 3, timeout: float = 60, client: httpx.AsyncClient = None):
+        headers = {"Accept": "application/json"}
+        if api_key:
+            headers["X-API-Key"] = api_key
+        self.base_url = base_url.rstrip("/")
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(
+            headers=headers,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    async def aclose(self):
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def _request(self, method: str, endpoint: str, data: dict = None):
+        for attempt in range(self.max_retries + 1):
+            try:
+                resp = await self._client.request(method, self.base_url + endpoint, json=data)
+            except httpx.TransportError:
+                if attempt == self.max_retries:
+                    raise
+            else:
+                if resp.status_code not in self.RETRY_STATUS or attempt == self.max_retries:
+                    resp.raise_for_status()
+                    if method == "DELETE":
+                        return True
+                    return resp.json()
+            await asyncio.sleep(0.5 * 2 ** attempt)
+
+    async def _bulk(self, func, arg_tuples: list, on_progress=None) -> list:
+        """Run func(*args) for each item with at most `concurrency` requests in flight."""
+        total = len(arg_tuples)
+        done = 0
+
+        async def run(index, args):
+            nonlocal done
+            async with self._semaphore:
+                try:
+                    result = BulkResult(index, True, await func(*args))
+                except Exception as e:
+                    result = BulkResult(index, False, error=e)
+            done += 1
+            if on_progress:
+                on_progress(done, total)
+            return result
+
+        return await asyncio.gather(*(run(i, args) for i, args in enumerate(arg_tuples)))
+
+    async def _stream_records(self, app_id: str) -> AsyncIterator[tuple]:
+        """Yield (record_id, data) pairs while the {id: record} response is still downloading."""
+        decoder = json.JSONDecoder()
+        buffer = ""
+        pos = 0
+        started = False
+        async with self._client.stream("GET", f"{self.base_url}/apps/{app_id}/records") as resp:
+            resp.raise_for_status()
+            async for chunk in resp.aiter_text():
+                buffer = buffer[pos:] + chunk
+                pos = 0
+                while True:
+                    # Skip whitespace, the opening brace and separators between entries
+                    while pos < len(buffer) and buffer[pos] in " \\t\\r\\n,":
+                        pos += 1
+                    if not started:
+                        if pos >= len(buffer):
+                            break
+                        if buffer[pos] != "{":
+                            raise ValueError("Unexpected records payload")
+                        started = True
+                        pos += 1
+                        continue
+                    if pos < len(buffer) and buffer[pos] == "}":
+                        return
+                    try:
+                        record_id, key_end = decoder.raw_decode(buffer, pos)
+                        colon = buffer.index(":", key_end)
+                        value_start = colon + 1
+                        while value_start < len(buffer) and buffer[value_start] in " \\t\\r\\n":
+                            value_start += 1
+                        data, value_end = decoder.raw_decode(buffer, value_start)
+                    except ValueError:
+                        break  # entry incomplete — wait for the next chunk
+                    pos = value_end
+                    yield record_id, data
+
+
+'''.split("\n")
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Generate an async Python LivingApps client from app_metadata.json")
+    parser.add_argument("metadata", nargs="?", default="app_metadata.json")
+    parser.add_argument("--out", default="livingapps_client.py")
+    args = parser.parse_args()
+
+    with open(args.metadata) as f:
+        code = PythonClientGenerator(json.load(f)).generate_client()
+    with open(args.out, "w") as f:
+        f.write(code)
+    print(f"[PYCLIENT] ✅ Generated {args.out}")
@@ -1,4 +1,16 @@
-import re
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from keyword_matcher import IconRegistry, LanguageRegistry, load_keyword_tables
+from naming import to_singular
+from schema import Schema
+
+try:
+    from profiling import profiled
+except ImportError:  # generator copied without profiling.py
+    def profiled(name=None):
+        return lambda func: func
 
 
 class ReactComponentGenerator:
@@ -12,11 +24,12 @@ class ReactComponentGenerator:
     - src/pages/DashboardOverview.tsx — Placeholder overview page with KPI cards
     - src/components/ConfirmDialog.tsx — Generic delete confirmation
     - src/components/StatCard.tsx — Reusable KPI card
+    - src/hooks/use-entity-store.ts — Normalized store for applookup target lists (shared by pages and dialogs)
     - src/pages/{Entity}Page.tsx — Full CRUD page per scaffolded entity
     - src/components/dialogs/{Entity}Dialog.tsx — Create/edit dialog per scaffolded entity
     - src/pages/{Entity}Page.tsx — Placeholder page for non-scaffolded entities
     
-    Naming conventions MUST match TypeScriptGenerator exactly so imports work.
+    Naming and schema analysis come from the shared Schema (schema.py, naming.py) so imports match TypeScriptGenerator.
     Auto-detects language (DE/EN) from entity metadata for all UI text.
     """
 
@@ -60,6 +73,24 @@ class ReactComponentGenerator:
         "booking": "CalendarCheck", "buchung": "CalendarCheck",
     }
 
+    # Marker characters / words per UI language (checked in order, fallback 'en')
+    LANGUAGE_KEYWORDS = {
+        'de': {
+            'chars': 'äöüß',
+            'words': [
+                'und', 'der', 'die', 'das', 'für', 'mit', 'von', 'zur', 'zum',
+                'aus', 'bei', 'ein', 'eine', 'name', 'datum', 'preis', 'nummer',
+                'telefon', 'adresse', 'strasse', 'stadt', 'raum', 'gebaeude',
+                'beschreibung', 'bezeichnung', 'bemerkung', 'anmerkung',
+            ],
+            'min_words': 2,
+        },
+    }
+
+    # Compiled once per process; extend via load_keyword_tables()
+    icons = IconRegistry(ICON_MAP)
+    languages = LanguageRegistry(LANGUAGE_KEYWORDS)
+
     UI_TEXTS = {
         'de': {
             'overview': 'Übersicht',
@@ -88,6 +119,14 @@ class ReactComponentGenerator:
             'management': 'Verwaltung',
             'dashboard': 'Dashboard',
             'date_format': 'dd.MM.yyyy',
+            'selected': 'ausgewählt',
+            'edit': 'Bearbeiten',
+            'clear_selection': 'Auswahl aufheben',
+            'bulk_edit_entity': 'Ausgewählte {entity} bearbeiten',
+            'bulk_delete_entity': 'Ausgewählte {entity} löschen',
+            'bulk_delete_desc': 'Sollen alle ausgewählten Einträge wirklich gelöscht werden? Diese Aktion kann nicht rückgängig gemacht werden.',
+            'bulk_failed': 'fehlgeschlagen',
+            'save_failed': 'Speichern fehlgeschlagen',
         },
         'en': {
             'overview': 'Overview',
@@ -116,16 +155,27 @@ class ReactComponentGenerator:
             'management': 'Management',
             'dashboard': 'Dashboard',
             'date_format': 'MMM d, yyyy',
+            'selected': 'selected',
+            'edit': 'Edit',
+            'clear_selection': 'Clear selection',
+            'bulk_edit_entity': 'Edit selected {entity}',
+            'bulk_delete_entity': 'Delete selected {entity}',
+            'bulk_delete_desc': 'Delete all selected entries? This action cannot be undone.',
+            'bulk_failed': 'failed',
+            'save_failed': 'Saving failed',
         }
     }
 
-    def __init__(self, metadata: dict, crud_scaffolds: list):
+    def __init__(self, metadata: dict, crud_scaffolds: list, modular: bool = False):
         self.metadata = metadata
+        # modular=True: Seiten importieren die Entity-Services (TypeScriptGenerator(modular=True)) einzeln
+        self.modular = modular
         self.apps = metadata.get("apps", {})
         self.crud_scaffolds = [s for s in crud_scaffolds if s in self.apps]
-        self.app_id_to_identifier = {
-            data["app_id"]: key for key, data in self.apps.items()
-        }
+        # Einmal vorberechnet: Lookup-Kanten, Display-Felder, Typ-Flags (geteilt mit TypeScriptGenerator)
+        self.schema = Schema.for_metadata(metadata)
+        self.app_id_to_identifier = self.schema.app_id_to_identifier
+        self.names = self.schema.names
         self.lang = self._detect_language()
 
     # ================================================================
@@ -134,32 +184,17 @@ class ReactComponentGenerator:
 
     def _detect_language(self) -> str:
         """Detect UI language from entity names and labels."""
-        german_chars = set('äöüß')
-        german_words = {
-            'und', 'der', 'die', 'das', 'für', 'mit', 'von', 'zur', 'zum',
-            'aus', 'bei', 'ein', 'eine', 'name', 'datum', 'preis', 'nummer',
-            'telefon', 'adresse', 'strasse', 'stadt', 'raum', 'gebaeude',
-            'beschreibung', 'bezeichnung', 'bemerkung', 'anmerkung',
-        }
-
         text_parts = []
         for data in self.apps.values():
             text_parts.append(data.get('name', ''))
             for ctrl in data.get('controls', {}).values():
                 text_parts.append(ctrl.get('label', ''))
+        return self.languages.detect(text_parts)
 
-        text = ' '.join(text_parts).lower()
-
-        # German umlauts/ß are a strong signal
-        if any(c in text for c in german_chars):
-            return 'de'
-
-        # Check for common German words
-        words = set(re.split(r'\W+', text))
-        if len(words & german_words) >= 2:
-            return 'de'
-
-        return 'en'
+    @classmethod
+    def load_keyword_tables(cls, path: str):
+        """Load custom keyword->icon / keyword->language tables (JSON, see keyword_matcher.py)."""
+        load_keyword_tables(path, cls.icons, cls.languages)
 
     def _t(self, key: str, **kwargs) -> str:
         """Get localized UI text."""
@@ -170,19 +205,17 @@ class ReactComponentGenerator:
         return text
 
     # ================================================================
-    # Naming helpers — MUST match TypeScriptGenerator exactly
+    # Naming helpers — shared with TypeScriptGenerator via naming.py
     # ================================================================
 
-    def _to_pascal_case(self, text: str) -> str:
-        text = text.replace("ä", "ae").replace("ö", "oe").replace("ü", "ue").replace("ß", "ss")
-        return "".join(word.capitalize() for word in re.sub(r"[^a-zA-Z0-9]", " ", text).split())
+    def _to_pascal_case(self, identifier: str) -> str:
+        return self.names[identifier].pascal
 
     def _to_singular(self, pascal_name: str) -> str:
-        return pascal_name[:-1] if pascal_name.endswith("s") else f"{pascal_name}Entry"
+        return to_singular(pascal_name)
 
     def _to_const_name(self, identifier: str) -> str:
-        name = identifier.upper().replace("-", "_").replace("&", "").replace(" ", "_")
-        return re.sub(r"_+", "_", name)
+        return self.names[identifier].const
 
     # ================================================================
     # Analysis helpers
@@ -190,111 +223,139 @@ class ReactComponentGenerator:
 
     def _get_display_field(self, identifier: str) -> str:
         """Which field to show for an entity in dropdowns / table lookups."""
-        if identifier not in self.apps:
+        if identifier not in self.schema:
             return "record_id"
-        controls = self.apps[identifier].get("controls", {})
-
-        for key, ctrl in controls.items():
-            if ctrl.get("fulltype") == "string/text" and ctrl.get("in_list"):
-                return key
-        for name in ["name", "title", "bezeichnung", "label", "titel", "description"]:
-            if name in controls:
-                return name
-        for key, ctrl in controls.items():
-            if "string" in ctrl.get("fulltype", ""):
-                return key
-        return next(iter(controls.keys()), "record_id")
+        return self.schema[identifier].display_field
 
     @staticmethod
     def _normalize_for_icon_match(text: str) -> str:
         """Collapse umlauts and ae/oe/ue digraphs to base vowels for fuzzy icon matching."""
-        text = text.replace("ä", "a").replace("ö", "o").replace("ü", "u").replace("ß", "ss")
-        text = text.replace("ae", "a").replace("oe", "o").replace("ue", "u")
-        return text
+        return IconRegistry.normalize(text)
 
     def _get_icon_name(self, identifier: str) -> str:
-        lower = identifier.lower()
-        norm_id = self._normalize_for_icon_match(lower)
-        for keyword, icon in self.ICON_MAP.items():
-            # Direct match first, then normalized match
-            if keyword in lower:
-                return icon
-            norm_kw = self._normalize_for_icon_match(keyword)
-            if norm_kw in norm_id:
-                return icon
-        return "FileText"
+        # First keyword (by priority) found directly or after umlaut folding
+        return self.icons.icon_for(identifier)
+
+    def _service_call(self, identifier: str, method: str) -> str:
+        """'LivingAppsService.getKurse' or, in modular mode, 'kurseService.getKurse'."""
+        if self.modular:
+            return self.names[identifier].service_ns + "." + method
+        return "LivingAppsService." + method
+
+    def _service_imports(self, identifiers: list, helpers: str = ""):
+        """Import lines for the service: one class from the monolith, or one namespace per entity module."""
+        if not self.modular:
+            imported = ", ".join(filter(None, ["LivingAppsService" if identifiers else "", helpers]))
+            yield "import { " + imported + " } from '@/services/livingAppsService';"
+            return
+        if helpers:
+            yield "import { " + helpers + " } from '@/services/api';"
+        for identifier in dict.fromkeys(identifiers):
+            names = self.names[identifier]
+            yield "import * as " + names.service_ns + " from '@/services/entities/" + names.pascal + "';"
 
     def _get_applookup_deps(self, identifier: str) -> list:
-        """All applookup fields and their target entities for a given entity."""
-        deps = []
-        if identifier not in self.apps:
-            return deps
-        controls = self.apps[identifier].get("controls", {})
-        for ctrl_key, ctrl_data in controls.items():
-            if "applookup" not in ctrl_data.get("fulltype", ""):
-                continue
-            lookup_app_url = ctrl_data.get("lookup_app", "")
-            if not lookup_app_url:
-                continue
-            try:
-                target_app_id = lookup_app_url.rstrip("/").split("/")[-1]
-                target_identifier = self.app_id_to_identifier.get(target_app_id)
-                if target_identifier:
-                    deps.append({
-                        "ctrl_key": ctrl_key,
-                        "target_identifier": target_identifier,
-                        "target_pascal": self._to_pascal_case(target_identifier),
-                        "target_const": self._to_const_name(target_identifier),
-                        "display_field": self._get_display_field(target_identifier),
-                    })
-            except Exception:
-                pass
-        return deps
+        """All applookup fields and their target entities (LookupEdge) for a given entity."""
+        if identifier not in self.schema:
+            return []
+        return self.schema[identifier].deps
 
     def _get_unique_applookup_entities(self, identifier: str) -> list:
         """Deduplicated target entities (one entry per referenced entity)."""
-        deps = self._get_applookup_deps(identifier)
-        seen = {}
-        for dep in deps:
-            t = dep["target_identifier"]
-            if t not in seen:
-                seen[t] = dep
-        return list(seen.values())
+        if identifier not in self.schema:
+            return []
+        return self.schema[identifier].unique_deps
 
     def _has_date_fields(self, identifier: str) -> bool:
         """Check if entity has any date/datetime fields."""
-        if identifier not in self.apps:
-            return False
-        controls = self.apps[identifier].get("controls", {})
-        return any('date' in c.get('fulltype', '') for c in controls.values())
+        return identifier in self.schema and self.schema[identifier].has_dates
 
     # ================================================================
     # Main entry point
     # ================================================================
 
-    def generate_all(self) -> dict:
-        """Returns {filepath: content} for all files to generate."""
-        files = {}
+    # An entity page + dialog renders in ~0.1 ms; below this many scaffolds the
+    # pool start-up (~50 ms) costs more than it saves
+    PARALLEL_MIN_ENTITIES = 200
+
+    @profiled("generate_all")
+    def generate_all(self, workers: int = None) -> dict:
+        """
+        Returns {filepath: content} for all files to generate.
+
+        workers: None = automatic (parallel only for >= PARALLEL_MIN_ENTITIES scaffolds),
+        0/1 = single process, n > 1 = render entity pages/dialogs on n workers.
+        Output (content and key order) is identical either way.
+        """
+        if workers is None:
+            workers = (os.cpu_count() or 1) if len(self.crud_scaffolds) >= self.PARALLEL_MIN_ENTITIES else 1
+        if workers <= 1 or len(self.crud_scaffolds) < 2:
+            return {path: "\n".join(chunks) for path, chunks in self.iter_files()}
+
+        files = {path: "\n".join(chunks) for path, chunks in self._iter_shared_files()}
+        for entity_files in self._render_entities_parallel(workers):
+            files.update(entity_files)
+        for path, chunks in self._iter_placeholder_files():
+            files[path] = "\n".join(chunks)
+        return files
+
+    def _render_entities_parallel(self, workers: int):
+        """Entity pages + dialogs in crud_scaffolds order; threads on free-threaded builds, else processes."""
+        gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+        chunksize = max(1, len(self.crud_scaffolds) // (workers * 4))
+        if not gil_enabled:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                yield from pool.map(self._render_entity, self.crud_scaffolds, chunksize=chunksize)
+            return
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_entity_worker,
+            initargs=(self.metadata, self.crud_scaffolds, self.modular),
+        ) as pool:
+            # map() keeps submission order -> deterministic output
+            yield from pool.map(_render_entity_in_worker, self.crud_scaffolds, chunksize=chunksize)
+
+    def _render_entity(self, identifier: str) -> dict:
+        names = self.names[identifier]
+        return {
+            names.page_file: "\n".join(self._iter_entity_page(identifier)),
+            names.dialog_file: "\n".join(self._iter_entity_dialog(identifier)),
+        }
 
-        files["src/App.tsx"] = self._generate_app_router()
-        files["src/components/Layout.tsx"] = self._generate_layout()
-        files["src/components/PageShell.tsx"] = self._generate_page_shell()
-        files["src/pages/DashboardOverview.tsx"] = self._generate_overview()
-        files["src/components/ConfirmDialog.tsx"] = self._generate_confirm_dialog()
-        files["src/components/StatCard.tsx"] = self._generate_stat_card()
+    def iter_files(self):
+        """
+        Streaming variant of generate_all: yields (filepath, chunks) in the same order.
 
-        for identifier in self.crud_scaffolds:
-            pascal = self._to_pascal_case(identifier)
-            files[f"src/pages/{pascal}Page.tsx"] = self._generate_entity_page(identifier)
-            files[f"src/components/dialogs/{pascal}Dialog.tsx"] = self._generate_entity_dialog(identifier)
+        Files are produced lazily and each file's chunks are generated while they are
+        consumed, so a writer (see typescript_generator.write_streamed) can put the
+        first files on disk before the last ones are rendered. Chunks are lines
+        without trailing newline.
+        """
+        yield from self._iter_shared_files()
 
-        # Placeholder pages for non-scaffolded entities
+        for identifier in self.crud_scaffolds:
+            names = self.names[identifier]
+            yield names.page_file, self._iter_entity_page(identifier)
+            yield names.dialog_file, self._iter_entity_dialog(identifier)
+
+        yield from self._iter_placeholder_files()
+
+    def _iter_shared_files(self):
+        yield "src/App.tsx", self._iter_app_router()
+        yield "src/components/Layout.tsx", self._iter_layout()
+        yield "src/components/PageShell.tsx", [self._generate_page_shell()]
+        yield "src/pages/DashboardOverview.tsx", self._iter_overview()
+        yield "src/components/ConfirmDialog.tsx", [self._generate_confirm_dialog()]
+        yield "src/components/StatCard.tsx", [self._generate_stat_card()]
+        yield "src/hooks/use-entity-store.ts", self._iter_entity_store()
+        yield "src/hooks/use-debounced-value.ts", self._iter_debounced_value()
+        yield "src/lib/search.ts", self._iter_search_lib()
+
+    def _iter_placeholder_files(self):
+        """Placeholder pages for non-scaffolded entities."""
         for identifier in self.apps:
             if identifier not in self.crud_scaffolds:
-                pascal = self._to_pascal_case(identifier)
-                files[f"src/pages/{pascal}Page.tsx"] = self._generate_placeholder_page(identifier)
-
-        return files
+                yield self.names[identifier].page_file, self._iter_placeholder_page(identifier)
 
     # ================================================================
     # PageShell.tsx — Consistent page header wrapper
@@ -331,35 +392,33 @@ export function PageShell({ title, subtitle, action, children }: PageShellProps)
     # App.tsx — Router with all routes
     # ================================================================
 
-    def _generate_app_router(self) -> str:
-        L = []
-        L.append("import { BrowserRouter, Routes, Route } from 'react-router-dom';")
-        L.append("import { Layout } from '@/components/Layout';")
-        L.append("import DashboardOverview from '@/pages/DashboardOverview';")
+    def _iter_app_router(self):
+        yield "import { BrowserRouter, Routes, Route } from 'react-router-dom';"
+        yield "import { Layout } from '@/components/Layout';"
+        yield "import DashboardOverview from '@/pages/DashboardOverview';"
 
         for identifier in self.apps:
             pascal = self._to_pascal_case(identifier)
-            L.append("import " + pascal + "Page from '@/pages/" + pascal + "Page';")
+            yield "import " + pascal + "Page from '@/pages/" + pascal + "Page';"
 
-        L.append("")
-        L.append("export default function App() {")
-        L.append("  return (")
-        L.append("    <BrowserRouter basename={import.meta.env.BASE_URL}>")
-        L.append("      <Routes>")
-        L.append("        <Route element={<Layout />}>")
-        L.append("          <Route index element={<DashboardOverview />} />")
+        yield ""
+        yield "export default function App() {"
+        yield "  return ("
+        yield "    <BrowserRouter basename={import.meta.env.BASE_URL}>"
+        yield "      <Routes>"
+        yield "        <Route element={<Layout />}>"
+        yield "          <Route index element={<DashboardOverview />} />"
 
         for identifier in self.apps:
             pascal = self._to_pascal_case(identifier)
-            route_path = identifier.replace("_", "-")
-            L.append('          <Route path="' + route_path + '" element={<' + pascal + 'Page />} />')
+            route_path = self.names[identifier].route
+            yield '          <Route path="' + route_path + '" element={<' + pascal + 'Page />} />'
 
-        L.append("        </Route>")
-        L.append("      </Routes>")
-        L.append("    </BrowserRouter>")
-        L.append("  );")
-        L.append("}")
-        return "\n".join(L)
+        yield "        </Route>"
+        yield "      </Routes>"
+        yield "    </BrowserRouter>"
+        yield "  );"
+        yield "}"
 
     # ================================================================
     # Layout.tsx — Polished sidebar navigation + Outlet
@@ -367,7 +426,7 @@ export function PageShell({ title, subtitle, action, children }: PageShellProps)
     # so it adapts to whatever the agent puts in index.css
     # ================================================================
 
-    def _generate_layout(self) -> str:
+    def _iter_layout(self):
         # Collect all icon names
         icons = {"LayoutDashboard", "Menu", "X"}
         for identifier in self.apps:
@@ -380,202 +439,198 @@ export function PageShell({ title, subtitle, action, children }: PageShellProps)
         # Use first entity's icon for the logo
         first_icon = self._get_icon_name(next(iter(self.apps), ""))
 
-        L = []
-        L.append("import { NavLink, Outlet } from 'react-router-dom';")
-        L.append("import { " + ", ".join(sorted(icons)) + " } from 'lucide-react';")
-        L.append("import { useState } from 'react';")
-        L.append("")
+        yield "import { NavLink, Outlet } from 'react-router-dom';"
+        yield "import { " + ", ".join(sorted(icons)) + " } from 'lucide-react';"
+        yield "import { useState } from 'react';"
+        yield ""
 
         # App identity constants — agent customizes these
-        L.append("// ⚡ Customize these for your app")
-        L.append("const APP_TITLE = 'Dashboard';")
-        L.append("const APP_SUBTITLE = '" + management_label + "';")
-        L.append("")
+        yield "// ⚡ Customize these for your app"
+        yield "const APP_TITLE = 'Dashboard';"
+        yield "const APP_SUBTITLE = '" + management_label + "';"
+        yield ""
 
         # Navigation config
-        L.append("const navigation = [")
-        L.append("  { name: '" + overview_label + "', href: '/', icon: LayoutDashboard },")
+        yield "const navigation = ["
+        yield "  { name: '" + overview_label + "', href: '/', icon: LayoutDashboard },"
         for identifier in self.apps:
             label = self.apps[identifier].get("name", self._to_pascal_case(identifier))
             icon = self._get_icon_name(identifier)
-            route_path = "/" + identifier.replace("_", "-")
-            L.append("  { name: '" + label + "', href: '" + route_path + "', icon: " + icon + " },")
-        L.append("];")
-        L.append("")
+            route_path = "/" + self.names[identifier].route
+            yield "  { name: '" + label + "', href: '" + route_path + "', icon: " + icon + " },"
+        yield "];"
+        yield ""
 
-        L.append("export function Layout() {")
-        L.append("  const [sidebarOpen, setSidebarOpen] = useState(false);")
-        L.append("")
-        L.append("  return (")
-        L.append('    <div className="min-h-screen bg-background">')
+        yield "export function Layout() {"
+        yield "  const [sidebarOpen, setSidebarOpen] = useState(false);"
+        yield ""
+        yield "  return ("
+        yield '    <div className="min-h-screen bg-background">'
 
         # Mobile overlay
-        L.append("      {sidebarOpen && (")
-        L.append('        <div')
-        L.append('          className="fixed inset-0 bg-black/50 backdrop-blur-sm z-40 lg:hidden"')
-        L.append("          onClick={() => setSidebarOpen(false)}")
-        L.append("        />")
-        L.append("      )}")
+        yield "      {sidebarOpen && ("
+        yield '        <div'
+        yield '          className="fixed inset-0 bg-black/50 backdrop-blur-sm z-40 lg:hidden"'
+        yield "          onClick={() => setSidebarOpen(false)}"
+        yield "        />"
+        yield "      )}"
 
         # Sidebar with semantic sidebar tokens
-        L.append("")
-        L.append("      <aside")
-        L.append("        className={`")
-        L.append("          fixed top-0 left-0 z-50 h-full w-64 bg-sidebar border-r border-sidebar-border")
-        L.append("          transform transition-transform duration-200 ease-in-out")
-        L.append("          ${sidebarOpen ? 'translate-x-0' : '-translate-x-full'}")
-        L.append("          lg:translate-x-0")
-        L.append("        `}")
-        L.append("      >")
+        yield ""
+        yield "      <aside"
+        yield "        className={`"
+        yield "          fixed top-0 left-0 z-50 h-full w-64 bg-sidebar border-r border-sidebar-border"
+        yield "          transform transition-transform duration-200 ease-in-out"
+        yield "          ${sidebarOpen ? 'translate-x-0' : '-translate-x-full'}"
+        yield "          lg:translate-x-0"
+        yield "        `}"
+        yield "      >"
 
         # Logo area
-        L.append('        <div className="flex items-center justify-between px-5 py-6 border-b border-sidebar-border">')
-        L.append('          <div className="flex items-center gap-3">')
-        L.append('            <div className="w-9 h-9 rounded-xl bg-sidebar-primary flex items-center justify-center shadow-sm">')
-        L.append('              <' + first_icon + ' size={16} className="text-sidebar-primary-foreground" />')
-        L.append("            </div>")
-        L.append("            <div>")
-        L.append('              <h1 className="text-sm font-bold tracking-tight text-sidebar-foreground">{APP_TITLE}</h1>')
-        L.append('              <p className="text-xs text-sidebar-foreground/60">{APP_SUBTITLE}</p>')
-        L.append("            </div>")
-        L.append("          </div>")
-        L.append('          <button')
-        L.append('            className="lg:hidden p-1.5 rounded-lg text-sidebar-foreground/60 hover:text-sidebar-foreground transition-colors"')
-        L.append("            onClick={() => setSidebarOpen(false)}")
-        L.append("          >")
-        L.append('            <X size={16} />')
-        L.append("          </button>")
-        L.append("        </div>")
+        yield '        <div className="flex items-center justify-between px-5 py-6 border-b border-sidebar-border">'
+        yield '          <div className="flex items-center gap-3">'
+        yield '            <div className="w-9 h-9 rounded-xl bg-sidebar-primary flex items-center justify-center shadow-sm">'
+        yield '              <' + first_icon + ' size={16} className="text-sidebar-primary-foreground" />'
+        yield "            </div>"
+        yield "            <div>"
+        yield '              <h1 className="text-sm font-bold tracking-tight text-sidebar-foreground">{APP_TITLE}</h1>'
+        yield '              <p className="text-xs text-sidebar-foreground/60">{APP_SUBTITLE}</p>'
+        yield "            </div>"
+        yield "          </div>"
+        yield '          <button'
+        yield '            className="lg:hidden p-1.5 rounded-lg text-sidebar-foreground/60 hover:text-sidebar-foreground transition-colors"'
+        yield "            onClick={() => setSidebarOpen(false)}"
+        yield "          >"
+        yield '            <X size={16} />'
+        yield "          </button>"
+        yield "        </div>"
 
         # Navigation links with proper TypeScript
-        L.append('        <nav className="px-3 pt-4 space-y-0.5">')
-        L.append('          <p className="px-3 pb-2 text-xs font-semibold uppercase tracking-widest text-sidebar-foreground/40">')
-        L.append("            " + nav_label)
-        L.append("          </p>")
-        L.append("          {navigation.map(item => (")
-        L.append("            <NavLink")
-        L.append("              key={item.href}")
-        L.append("              to={item.href}")
-        L.append("              end={item.href === '/'}")
-        L.append("              onClick={() => setSidebarOpen(false)}")
-        L.append("              className={({ isActive }: { isActive: boolean }) =>")
-        L.append("                `flex items-center gap-3 px-3 py-2.5 rounded-lg text-sm font-medium transition-colors ${")
-        L.append("                  isActive")
-        L.append("                    ? 'bg-sidebar-primary text-sidebar-primary-foreground shadow-sm'")
-        L.append("                    : 'text-sidebar-foreground/70 hover:bg-sidebar-accent hover:text-sidebar-accent-foreground'")
-        L.append("                }`")
-        L.append("              }")
-        L.append("            >")
-        L.append('              <item.icon size={16} className="shrink-0" />')
-        L.append("              {item.name}")
-        L.append("            </NavLink>")
-        L.append("          ))}")
-        L.append("        </nav>")
-        L.append("      </aside>")
-        L.append("")
+        yield '        <nav className="px-3 pt-4 space-y-0.5">'
+        yield '          <p className="px-3 pb-2 text-xs font-semibold uppercase tracking-widest text-sidebar-foreground/40">'
+        yield "            " + nav_label
+        yield "          </p>"
+        yield "          {navigation.map(item => ("
+        yield "            <NavLink"
+        yield "              key={item.href}"
+        yield "              to={item.href}"
+        yield "              end={item.href === '/'}"
+        yield "              onClick={() => setSidebarOpen(false)}"
+        yield "              className={({ isActive }: { isActive: boolean }) =>"
+        yield "                `flex items-center gap-3 px-3 py-2.5 rounded-lg text-sm font-medium transition-colors ${"
+        yield "                  isActive"
+        yield "                    ? 'bg-sidebar-primary text-sidebar-primary-foreground shadow-sm'"
+        yield "                    : 'text-sidebar-foreground/70 hover:bg-sidebar-accent hover:text-sidebar-accent-foreground'"
+        yield "                }`"
+        yield "              }"
+        yield "            >"
+        yield '              <item.icon size={16} className="shrink-0" />'
+        yield "              {item.name}"
+        yield "            </NavLink>"
+        yield "          ))}"
+        yield "        </nav>"
+        yield "      </aside>"
+        yield ""
 
         # Main content
-        L.append('      <div className="lg:pl-64">')
-        L.append('        <header className="lg:hidden flex items-center gap-4 px-4 py-3 border-b bg-card sticky top-0 z-30">')
-        L.append('          <button')
-        L.append('            className="p-2 rounded-lg hover:bg-accent transition-colors"')
-        L.append("            onClick={() => setSidebarOpen(true)}")
-        L.append("          >")
-        L.append('            <Menu size={18} />')
-        L.append("          </button>")
-        L.append('          <span className="font-semibold text-sm">{APP_TITLE}</span>')
-        L.append("        </header>")
-        L.append('        <main className="p-6 lg:p-8 max-w-screen-2xl">')
-        L.append("          <Outlet />")
-        L.append("        </main>")
-        L.append("      </div>")
-
-        L.append("    </div>")
-        L.append("  );")
-        L.append("}")
-        return "\n".join(L)
+        yield '      <div className="lg:pl-64">'
+        yield '        <header className="lg:hidden flex items-center gap-4 px-4 py-3 border-b bg-card sticky top-0 z-30">'
+        yield '          <button'
+        yield '            className="p-2 rounded-lg hover:bg-accent transition-colors"'
+        yield "            onClick={() => setSidebarOpen(true)}"
+        yield "          >"
+        yield '            <Menu size={18} />'
+        yield "          </button>"
+        yield '          <span className="font-semibold text-sm">{APP_TITLE}</span>'
+        yield "        </header>"
+        yield '        <main className="p-6 lg:p-8 max-w-screen-2xl">'
+        yield "          <Outlet />"
+        yield "        </main>"
+        yield "      </div>"
+
+        yield "    </div>"
+        yield "  );"
+        yield "}"
 
     # ================================================================
     # DashboardOverview.tsx — Placeholder for agent to customize
     # ================================================================
 
-    def _generate_overview(self) -> str:
-        L = []
-        L.append("import { useEffect, useState } from 'react';")
-        L.append("import { StatCard } from '@/components/StatCard';")
-        L.append("import { LivingAppsService } from '@/services/livingAppsService';")
+    def _iter_overview(self):
+        yield "import { useEffect, useState } from 'react';"
+        yield "import { StatCard } from '@/components/StatCard';"
+        yield from self._service_imports(list(self.apps), helpers="onCacheRefresh")
 
         # Import types for all entities
         type_names = [self._to_pascal_case(k) for k in self.apps]
         if type_names:
-            L.append("import type { " + ", ".join(type_names) + " } from '@/types/app';")
-        L.append("")
+            yield "import { APP_IDS } from '@/types/app';"
+            yield "import type { " + ", ".join(type_names) + " } from '@/types/app';"
+        yield ""
 
-        L.append("export default function DashboardOverview() {")
+        yield "export default function DashboardOverview() {"
 
-        # Generate state for each entity count
-        for identifier in self.apps:
-            pascal = self._to_pascal_case(identifier)
-            L.append("  const [" + identifier + "Count, set" + pascal + "Count] = useState(0);")
-        L.append("  const [loading, setLoading] = useState(true);")
-        L.append("")
-
-        # Load counts
-        L.append("  useEffect(() => {")
-        L.append("    async function loadStats() {")
-        L.append("      try {")
-        L.append("        const [" + ", ".join(identifier + "Data" for identifier in self.apps) + "] = await Promise.all([")
+        # Generate state for each entity count (null = noch nicht geladen)
         for identifier in self.apps:
             pascal = self._to_pascal_case(identifier)
-            L.append("          LivingAppsService.get" + pascal + "(),")
-        L.append("        ]);")
+            yield "  const [" + identifier + "Count, set" + pascal + "Count] = useState<number | null>(null);"
+        yield ""
+
+        # Load counts — jede Karte erscheint, sobald ihre Zahl da ist
+        yield "  useEffect(() => {"
+        yield "    const controller = new AbortController();"
+        yield "    const onError = (e: unknown) => {"
+        yield "      if (!controller.signal.aborted) console.error('Failed to load stats:', e);"
+        yield "    };"
+        yield "    const counters: Record<string, () => void> = {"
         for identifier in self.apps:
             pascal = self._to_pascal_case(identifier)
-            L.append("        set" + pascal + "Count(" + identifier + "Data.length);")
-        L.append("      } catch (e) {")
-        L.append("        console.error('Failed to load stats:', e);")
-        L.append("      } finally {")
-        L.append("        setLoading(false);")
-        L.append("      }")
-        L.append("    }")
-        L.append("    loadStats();")
-        L.append("  }, []);")
-        L.append("")
-
-        L.append("  return (")
-        L.append('    <div className="space-y-8">')
+            yield ("      [APP_IDS." + self.names[identifier].const + "]: () => "
+                   + self._service_call(identifier, "count" + pascal) + "(controller.signal).then(set" + pascal + "Count).catch(onError),")
+        yield "    };"
+        yield "    Object.values(counters).forEach(count => count());"
+        yield "    // Nach dem Hintergrund-Abgleich (Start aus IndexedDB) nur die geänderte App neu zählen — kommt aus dem Cache"
+        yield "    const unsubscribe = onCacheRefresh(appId => counters[appId]?.());"
+        yield "    return () => {"
+        yield "      unsubscribe();"
+        yield "      controller.abort();"
+        yield "    };"
+        yield "  }, []);"
+        yield ""
+
+        yield "  return ("
+        yield '    <div className="space-y-8">'
 
         # Hero section
-        L.append('      {/* === HERO SECTION — Customize with gradient, welcome text, key metrics === */}')
-        L.append("      <div>")
-        L.append('        <h1 className="text-3xl font-bold tracking-tight">' + self._t('welcome') + '</h1>')
-        L.append("        <p className=\"text-muted-foreground mt-1\">" + self._t('overview_subtitle') + "</p>")
-        L.append("      </div>")
-        L.append("")
+        yield '      {/* === HERO SECTION — Customize with gradient, welcome text, key metrics === */}'
+        yield "      <div>"
+        yield '        <h1 className="text-3xl font-bold tracking-tight">' + self._t('welcome') + '</h1>'
+        yield "        <p className=\"text-muted-foreground mt-1\">" + self._t('overview_subtitle') + "</p>"
+        yield "      </div>"
+        yield ""
 
         # KPI cards
-        L.append('      {/* === KPI CARDS — Customize with icons, colors, descriptions === */}')
+        yield '      {/* === KPI CARDS — Customize with icons, colors, descriptions === */}'
         cols = str(min(len(self.apps), 5))
-        L.append('      <div className="grid grid-cols-2 lg:grid-cols-' + cols + ' gap-4">')
+        yield '      <div className="grid grid-cols-2 lg:grid-cols-' + cols + ' gap-4">'
         for identifier in self.apps:
             pascal = self._to_pascal_case(identifier)
             label = self.apps[identifier].get("name", pascal)
-            L.append("        <StatCard")
-            L.append('          title="' + label + '"')
-            L.append("          value={loading ? '...' : " + identifier + "Count}")
-            L.append('          description="' + self._t('in_system', entity=label) + '"')
-            L.append("        />")
-        L.append("      </div>")
-        L.append("")
+            yield "        <StatCard"
+            yield '          title="' + label + '"'
+            yield "          value={" + identifier + "Count ?? '...'}"
+            yield '          description="' + self._t('in_system', entity=label) + '"'
+            yield "        />"
+        yield "      </div>"
+        yield ""
 
         # Charts/content placeholder
-        L.append('      {/* === CHARTS / CONTENT — Build your dashboard here === */}')
-        L.append('      {/* Ideas: recharts BarChart/LineChart, upcoming items list, recent activity feed */}')
+        yield '      {/* === CHARTS / CONTENT — Build your dashboard here === */}'
+        yield '      {/* Ideas: recharts BarChart/LineChart, upcoming items list, recent activity feed */}'
 
-        L.append("    </div>")
-        L.append("  );")
-        L.append("}")
-        return "\n".join(L)
+        yield "    </div>"
+        yield "  );"
+        yield "}"
 
     # ================================================================
     # ConfirmDialog.tsx — Generic delete confirmation
@@ -646,11 +701,144 @@ export function StatCard({ title, value, description, icon }: StatCardProps) {
   );
 }"""
 
+    # ================================================================
+    # use-entity-store.ts — Normalized store for applookup targets
+    # ================================================================
+
+    def _iter_entity_store(self):
+        yield "import { useCallback, useSyncExternalStore } from 'react';"
+        yield from self._service_imports([], helpers="extractRecordId")
+        yield from [
+            "",
+            "// Normalisierter Store für Applookup-Ziele: pro App eine Map record_id -> Record und ein",
+            "// vorberechneter Index record_id -> Anzeigename. Dialoge laden die vollständigen Listen",
+            "// (setEntities), Seiten ergänzen nur die referenzierten Records (mergeEntities) — alle lesen",
+            "// über useEntities, jeder Record liegt nur einmal im Speicher.",
+            "export interface EntityTable<T> {",
+            "  list: T[];         // vollständige Liste (Dropdowns) — leer, solange nur einzelne Records bekannt sind",
+            "  byId: Map<string, T>;",
+            "  displayNames: Map<string, string>;",
+            "}",
+            "",
+            "const EMPTY_TABLE: EntityTable<any> = { list: [], byId: new Map(), displayNames: new Map() };",
+            "const tables = new Map<string, EntityTable<any>>();",
+            "const listeners = new Map<string, Set<() => void>>();",
+            "",
+            "type EntityRecord = { record_id: string; fields: Record<string, any> };",
+            "",
+            "function indexRecords<T extends EntityRecord>(",
+            "  records: T[], displayField: string, byId: Map<string, T>, displayNames: Map<string, string>,",
+            ") {",
+            "  for (const record of records) {",
+            "    byId.set(record.record_id, record);",
+            "    const name = record.fields[displayField];",
+            "    if (name !== undefined && name !== null && name !== '') displayNames.set(record.record_id, String(name));",
+            "    else displayNames.delete(record.record_id);",
+            "  }",
+            "}",
+            "",
+            "/** Ersetzt die Tabelle einer App durch die vollständige Liste */",
+            "export function setEntities<T extends EntityRecord>(appId: string, records: T[], displayField: string) {",
+            "  if (tables.get(appId)?.list === records) return;",
+            "  const byId = new Map<string, T>();",
+            "  const displayNames = new Map<string, string>();",
+            "  indexRecords(records, displayField, byId, displayNames);",
+            "  tables.set(appId, { list: records, byId, displayNames });",
+            "  listeners.get(appId)?.forEach(listener => listener());",
+            "}",
+            "",
+            "/** Ergänzt einzelne Records (z.B. aufgelöste Referenzen), die Liste bleibt unverändert */",
+            "export function mergeEntities<T extends EntityRecord>(appId: string, records: T[], displayField: string) {",
+            "  if (!records.length) return;",
+            "  const current = getEntities<T>(appId);",
+            "  const byId = new Map(current.byId);",
+            "  const displayNames = new Map(current.displayNames);",
+            "  indexRecords(records, displayField, byId, displayNames);",
+            "  tables.set(appId, { list: current.list, byId, displayNames });",
+            "  listeners.get(appId)?.forEach(listener => listener());",
+            "}",
+            "",
+            "/** Eindeutige record_ids, auf die `keys` (applookup-Felder) in `records` verweisen */",
+            "export function referencedIds(records: { fields: Record<string, any> }[], ...keys: string[]): string[] {",
+            "  const ids = new Set<string>();",
+            "  for (const record of records) {",
+            "    for (const key of keys) {",
+            "      const id = extractRecordId(record.fields[key]);",
+            "      if (id) ids.add(id);",
+            "    }",
+            "  }",
+            "  return [...ids];",
+            "}",
+            "",
+            "export function getEntities<T>(appId: string): EntityTable<T> {",
+            "  return tables.get(appId) ?? EMPTY_TABLE;",
+            "}",
+            "",
+            "/** Anzeigename zu einer applookup-URL in O(1); '—' wenn leer oder (noch) unbekannt */",
+            "export function displayNameOf(appId: string, url?: string | null): string {",
+            "  const id = extractRecordId(url);",
+            "  return (id && tables.get(appId)?.displayNames.get(id)) || '—';",
+            "}",
+            "",
+            "function subscribe(appId: string, listener: () => void): () => void {",
+            "  const appListeners = listeners.get(appId) ?? new Set<() => void>();",
+            "  listeners.set(appId, appListeners);",
+            "  appListeners.add(listener);",
+            "  return () => { appListeners.delete(listener); };",
+            "}",
+            "",
+            "/** Tabelle einer App; rendert neu bei jedem setEntities()/mergeEntities() */",
+            "export function useEntities<T>(appId: string): EntityTable<T> {",
+            "  const subscribeApp = useCallback((listener: () => void) => subscribe(appId, listener), [appId]);",
+            "  return useSyncExternalStore(subscribeApp, () => getEntities<T>(appId));",
+            "}",
+        ]
+
+    # ================================================================
+    # use-debounced-value.ts + lib/search.ts — Search helpers for entity pages
+    # ================================================================
+
+    SEARCH_DEBOUNCE_MS = 150
+
+    def _iter_debounced_value(self):
+        yield from [
+            "import { useEffect, useState } from 'react';",
+            "",
+            "/** `value`, erst nachdem er sich `delay` ms nicht mehr geändert hat (z.B. Sucheingabe) */",
+            "export function useDebouncedValue<T>(value: T, delay: number): T {",
+            "  const [debounced, setDebounced] = useState(value);",
+            "  useEffect(() => {",
+            "    const timer = setTimeout(() => setDebounced(value), delay);",
+            "    return () => clearTimeout(timer);",
+            "  }, [value, delay]);",
+            "  return debounced;",
+            "}",
+        ]
+
+    def _iter_search_lib(self):
+        yield from [
+            "// Suchtext normalisieren: klein, ß -> ss, Akzente entfernt, Umlaut-Digraphen gefaltet (ae -> a).",
+            "// Index und Eingabe laufen durch dieselbe Funktion — 'Müller', 'Mueller' und 'muller' finden sich.",
+            "export function normalizeSearch(text: string): string {",
+            "  let folded = text.toLowerCase();",
+            "  // Unicode-Normalisierung ist teuer — nur für Texte mit Nicht-ASCII-Zeichen",
+            "  if (/[^\\x00-\\x7f]/.test(folded)) {",
+            "    folded = folded.replace(/ß/g, 'ss').normalize('NFD').replace(/[\\u0300-\\u036f]/g, '');",
+            "  }",
+            "  return folded.replace(/([aou])e/g, '$1');",
+            "}",
+            "",
+            "/** Suchbegriffe einer Eingabe (normalisiert, an Leerzeichen getrennt) — alle müssen vorkommen */",
+            "export function searchTerms(query: string): string[] {",
+            "  return normalizeSearch(query).split(/\\s+/).filter(Boolean);",
+            "}",
+        ]
+
     # ================================================================
     # {Entity}Page.tsx — Full CRUD page per scaffolded entity
     # ================================================================
 
-    def _generate_entity_page(self, identifier: str) -> str:
+    def _iter_entity_page(self, identifier: str):
         app_data = self.apps[identifier]
         controls = app_data.get("controls", {})
         pascal = self._to_pascal_case(identifier)
@@ -660,152 +848,302 @@ export function StatCard({ title, value, description, icon }: StatCardProps) {
         deps = self._get_applookup_deps(identifier)
         unique_deps = self._get_unique_applookup_entities(identifier)
 
-        has_lookup = any(c.get("fulltype") == "lookup/select" for c in controls.values())
-        has_dates = self._has_date_fields(identifier)
-        col_count = len(controls) + 1  # +1 for actions
-
-        L = []
+        has_lookup = self.schema[identifier].has_lookup
+        has_dates = self.schema[identifier].has_dates
+        col_count = len(controls) + 2  # +1 selection, +1 actions
 
         # --- Imports ---
-        L.append("import { useState, useEffect } from 'react';")
-        L.append("import { LivingAppsService, extractRecordId, createRecordUrl } from '@/services/livingAppsService';")
+        yield "import { useState, useEffect, useRef, useMemo } from 'react';"
+        yield from self._service_imports([identifier] + [dep.target_identifier for dep in unique_deps],
+                                         helpers="extractRecordId, createRecordUrl, onCacheRefresh")
 
+        # Applookup-Listen nutzen den schlanken <Target>Lookup-Typ (record_id + Anzeigefeld)
         type_imports = [pascal]
         for dep in unique_deps:
-            if dep["target_pascal"] not in type_imports:
-                type_imports.append(dep["target_pascal"])
-        L.append("import type { " + ", ".join(type_imports) + " } from '@/types/app';")
-        L.append("import { APP_IDS } from '@/types/app';")
-        L.append("import { Button } from '@/components/ui/button';")
-        L.append("import { Input } from '@/components/ui/input';")
-        L.append("import {")
-        L.append("  Table, TableBody, TableCell, TableHead,")
-        L.append("  TableHeader, TableRow,")
-        L.append("} from '@/components/ui/table';")
+            lookup_type = self.names[dep.target_identifier].lookup_type
+            if lookup_type not in type_imports:
+                type_imports.append(lookup_type)
+        yield "import type { " + ", ".join(type_imports) + " } from '@/types/app';"
+        label_imports = "".join(", " + c.lookup_labels_const for c in self.schema[identifier].lookup_controls)
+        yield "import { APP_IDS" + label_imports + " } from '@/types/app';"
+        yield "import { Button } from '@/components/ui/button';"
+        yield "import { Input } from '@/components/ui/input';"
+        yield "import { Checkbox } from '@/components/ui/checkbox';"
+        yield "import {"
+        yield "  Table, TableBody, TableCell, TableHead,"
+        yield "  TableHeader, TableRow,"
+        yield "} from '@/components/ui/table';"
         if has_lookup:
-            L.append("import { Badge } from '@/components/ui/badge';")
-        L.append("import { Pencil, Trash2, Plus, Search } from 'lucide-react';")
-        L.append("import { " + pascal + "Dialog } from '@/components/dialogs/" + pascal + "Dialog';")
-        L.append("import { ConfirmDialog } from '@/components/ConfirmDialog';")
-        L.append("import { PageShell } from '@/components/PageShell';")
+            yield "import { Badge } from '@/components/ui/badge';"
+        yield "import { Pencil, Trash2, Plus, Search } from 'lucide-react';"
+        yield "import { " + pascal + "Dialog } from '@/components/dialogs/" + pascal + "Dialog';"
+        yield "import { ConfirmDialog } from '@/components/ConfirmDialog';"
+        yield "import { PageShell } from '@/components/PageShell';"
+        if unique_deps:
+            yield "import { useEntities, mergeEntities, referencedIds } from '@/hooks/use-entity-store';"
+        yield "import { useDebouncedValue } from '@/hooks/use-debounced-value';"
+        yield "import { normalizeSearch, searchTerms } from '@/lib/search';"
         if has_dates:
-            L.append("import { format, parseISO } from 'date-fns';")
+            yield "import { format, parseISO } from 'date-fns';"
             if self.lang == 'de':
-                L.append("import { de } from 'date-fns/locale';")
-        L.append("")
+                yield "import { de } from 'date-fns/locale';"
+        yield ""
 
         # Date format helper (only if needed)
         if has_dates:
             date_fmt = self._t('date_format')
             if self.lang == 'de':
-                L.append("function formatDate(d?: string) {")
-                L.append("  if (!d) return '—';")
-                L.append("  try { return format(parseISO(d), '" + date_fmt + "', { locale: de }); } catch { return d; }")
-                L.append("}")
-                L.append("")
+                yield "function formatDate(d?: string) {"
+                yield "  if (!d) return '—';"
+                yield "  try { return format(parseISO(d), '" + date_fmt + "', { locale: de }); } catch { return d; }"
+                yield "}"
+                yield ""
             else:
-                L.append("function formatDate(d?: string) {")
-                L.append("  if (!d) return '—';")
-                L.append("  try { return format(parseISO(d), '" + date_fmt + "'); } catch { return d; }")
-                L.append("}")
-                L.append("")
+                yield "function formatDate(d?: string) {"
+                yield "  if (!d) return '—';"
+                yield "  try { return format(parseISO(d), '" + date_fmt + "'); } catch { return d; }"
+                yield "}"
+                yield ""
+
+        yield "// Optimistisch angelegte Einträge haben bis zur Server-Antwort eine temporäre ID"
+        yield "function isPending(id: string) {"
+        yield "  return id.startsWith('pending-');"
+        yield "}"
+        yield ""
 
         # --- Component ---
-        L.append("export default function " + pascal + "Page() {")
-        L.append("  const [records, setRecords] = useState<" + pascal + "[]>([]);")
-        L.append("  const [loading, setLoading] = useState(true);")
-        L.append("  const [search, setSearch] = useState('');")
-        L.append("  const [dialogOpen, setDialogOpen] = useState(false);")
-        L.append("  const [editingRecord, setEditingRecord] = useState<" + pascal + " | null>(null);")
-        L.append("  const [deleteTarget, setDeleteTarget] = useState<" + pascal + " | null>(null);")
+        yield "export default function " + pascal + "Page() {"
+        yield "  const [records, setRecords] = useState<" + pascal + "[]>([]);"
+        yield "  const [loading, setLoading] = useState(true);"
+        yield "  const [search, setSearch] = useState('');"
+        yield "  const [dialogOpen, setDialogOpen] = useState(false);"
+        yield "  const [editingRecord, setEditingRecord] = useState<" + pascal + " | null>(null);"
+        yield "  const [deleteTarget, setDeleteTarget] = useState<" + pascal + " | null>(null);"
+        yield "  const [selectedIds, setSelectedIds] = useState<Set<string>>(new Set());"
+        yield "  const [bulkEditOpen, setBulkEditOpen] = useState(false);"
+        yield "  const [bulkDeleteOpen, setBulkDeleteOpen] = useState(false);"
+        yield "  const [bulkStatus, setBulkStatus] = useState<string | null>(null);"
+        yield "  const [mutationError, setMutationError] = useState<string | null>(null);"
 
         for dep in unique_deps:
-            L.append("  const [" + dep["target_identifier"] + "List, set" + dep["target_pascal"] + "List] = useState<" + dep["target_pascal"] + "[]>([]);")
-
-        L.append("")
-        L.append("  useEffect(() => { loadData(); }, []);")
-        L.append("")
+            yield ("  const " + dep.target_identifier + "Table = useEntities<" + self.names[dep.target_identifier].lookup_type
+                   + ">(APP_IDS." + dep.target_const + ");")
+
+        yield "  // Laufender loadData()-Aufruf — wird beim Unmount und bei jedem neuen Laden abgebrochen"
+        yield "  const loadController = useRef<AbortController | null>(null);"
+        yield ""
+        watched = " || ".join("appId === APP_IDS." + self.names[i].const
+                              for i in dict.fromkeys([identifier] + [dep.target_identifier for dep in unique_deps]))
+        yield "  useEffect(() => {"
+        yield "    loadData();"
+        yield "    // Im Hintergrund aktualisierte Listen (z.B. nach dem Start aus IndexedDB) ohne Spinner neu einlesen"
+        yield "    const unsubscribe = onCacheRefresh(appId => {"
+        yield "      if (" + watched + ") loadData(false);"
+        yield "    });"
+        yield "    return () => {"
+        yield "      unsubscribe();"
+        yield "      loadController.current?.abort();"
+        yield "    };"
+        yield "  }, []);"
+        yield ""
 
         # loadData
-        L.append("  async function loadData() {")
-        L.append("    setLoading(true);")
-        L.append("    try {")
+        yield "  async function loadData(showSpinner = true) {"
+        yield "    loadController.current?.abort();"
+        yield "    const controller = new AbortController();"
+        yield "    loadController.current = controller;"
+        yield "    const { signal } = controller;"
+        yield "    if (showSpinner) setLoading(true);"
+        yield "    try {"
+        # First chunk renders immediately, the rest is appended while it downloads
         if unique_deps:
-            vars_list = ["mainData"]
-            calls_list = ["LivingAppsService.get" + pascal + "()"]
-            for dep in unique_deps:
-                vars_list.append(dep["target_identifier"] + "Data")
-                calls_list.append("LivingAppsService.get" + dep["target_pascal"] + "()")
-            L.append("      const [" + ", ".join(vars_list) + "] = await Promise.all([")
-            for call in calls_list:
-                L.append("        " + call + ",")
-            L.append("      ]);")
-            L.append("      setRecords(mainData);")
+            yield "      const resolving: Promise<void>[] = [];"
+        yield "      let loaded: " + pascal + "[] = [];"
+        yield "      for await (const chunk of " + self._service_call(identifier, "iter" + pascal) + "(1000, 100, signal)) {"
+        yield "        loaded = loaded.concat(chunk);"
+        if unique_deps:
+            yield "        resolving.push(resolveLookups(chunk, signal));"
+        yield "        setRecords(loaded);"
+        yield "        setLoading(false);"
+        yield "      }"
+        yield "      setRecords(loaded);"
+        if unique_deps:
+            yield "      await Promise.all(resolving);"
+        yield "    } catch (e) {"
+        yield "      if (signal.aborted) return;  // abgelöst durch neueres loadData() oder Unmount"
+        yield "      throw e;"
+        yield "    } finally {"
+        yield "      if (!signal.aborted) setLoading(false);"
+        yield "    }"
+        yield "  }"
+        yield ""
+
+        if unique_deps:
+            # Only the referenced target records are fetched (batched per chunk, cached in the service)
+            yield "  // Anzeigenamen: nur die in `chunk` referenzierten Applookup-Records statt der ganzen Ziel-Apps"
+            yield "  function resolveLookups(chunk: " + pascal + "[], signal: AbortSignal): Promise<void> {"
+            yield "    return Promise.all(["
             for dep in unique_deps:
-                L.append("      set" + dep["target_pascal"] + "List(" + dep["target_identifier"] + "Data);")
-        else:
-            L.append("      setRecords(await LivingAppsService.get" + pascal + "());")
-        L.append("    } finally {")
-        L.append("      setLoading(false);")
-        L.append("    }")
-        L.append("  }")
-        L.append("")
-
-        # CRUD handlers
-        L.append("  async function handleCreate(fields: " + pascal + "['fields']) {")
-        L.append("    await LivingAppsService.create" + singular + "(fields);")
-        L.append("    await loadData();")
-        L.append("    setDialogOpen(false);")
-        L.append("  }")
-        L.append("")
-        L.append("  async function handleUpdate(fields: " + pascal + "['fields']) {")
-        L.append("    if (!editingRecord) return;")
-        L.append("    await LivingAppsService.update" + singular + "(editingRecord.record_id, fields);")
-        L.append("    await loadData();")
-        L.append("    setEditingRecord(null);")
-        L.append("  }")
-        L.append("")
-        L.append("  async function handleDelete() {")
-        L.append("    if (!deleteTarget) return;")
-        L.append("    await LivingAppsService.delete" + singular + "(deleteTarget.record_id);")
-        L.append("    setRecords(prev => prev.filter(r => r.record_id !== deleteTarget.record_id));")
-        L.append("    setDeleteTarget(null);")
-        L.append("  }")
-        L.append("")
+                keys = ", ".join("'" + d.ctrl_key + "'" for d in deps if d.target_identifier == dep.target_identifier)
+                yield ("      " + self._service_call(dep.target_identifier, "get" + dep.target_pascal + "LookupByIds")
+                       + "(referencedIds(chunk, " + keys + "), signal)")
+                yield ("        .then(data => mergeEntities(APP_IDS." + dep.target_const + ", data, '"
+                       + dep.display_field + "')),")
+            yield "    ]).then(() => {}, e => {"
+            yield "      if (!signal.aborted) console.error('Failed to resolve lookups:', e);"
+            yield "    });"
+            yield "  }"
+            yield ""
+
+        # CRUD handlers — optimistisch: lokaler State sofort, ein Request, Rollback bei Fehler
+        save_failed = self._t('save_failed')
+        yield "  function showMutationError(e: unknown) {"
+        yield "    setMutationError(`" + save_failed + ": ${e instanceof Error ? e.message : String(e)}`);"
+        yield "  }"
+        yield ""
+        yield "  async function handleCreate(fields: " + pascal + "['fields']) {"
+        yield "    const tempId = `pending-${Date.now()}`;"
+        yield "    const optimistic: " + pascal + " = { record_id: tempId, createdat: new Date().toISOString(), updatedat: null, fields };"
+        yield "    setRecords(prev => [...prev, optimistic]);"
+        yield "    setDialogOpen(false);"
+        yield "    setMutationError(null);"
+        yield "    try {"
+        yield "      const created = await " + self._service_call(identifier, "create" + singular) + "(fields);"
+        yield "      const id = created?.id ?? extractRecordId(created?.url);"
+        yield "      if (id) setRecords(prev => prev.map(r => r.record_id === tempId ? { ...optimistic, record_id: id } : r));"
+        yield "      else await loadData(false);  // Antwort ohne ID: Liste (aus dem Cache) neu einlesen"
+        yield "    } catch (e) {"
+        yield "      setRecords(prev => prev.filter(r => r.record_id !== tempId));"
+        yield "      showMutationError(e);"
+        yield "    }"
+        yield "  }"
+        yield ""
+        yield "  async function handleUpdate(fields: " + pascal + "['fields']) {"
+        yield "    if (!editingRecord) return;"
+        yield "    const previous = editingRecord;"
+        yield "    const optimistic = { ...previous, fields: { ...previous.fields, ...fields } };"
+        yield "    setRecords(prev => prev.map(r => r.record_id === previous.record_id ? optimistic : r));"
+        yield "    setEditingRecord(null);"
+        yield "    setMutationError(null);"
+        yield "    try {"
+        yield "      await " + self._service_call(identifier, "update" + singular) + "(previous.record_id, fields);"
+        yield "    } catch (e) {"
+        yield "      setRecords(prev => prev.map(r => r.record_id === previous.record_id ? previous : r));"
+        yield "      showMutationError(e);"
+        yield "    }"
+        yield "  }"
+        yield ""
+        yield "  async function handleDelete() {"
+        yield "    if (!deleteTarget) return;"
+        yield "    await " + self._service_call(identifier, "delete" + singular) + "(deleteTarget.record_id);"
+        yield "    setRecords(prev => prev.filter(r => r.record_id !== deleteTarget.record_id));"
+        yield "    setDeleteTarget(null);"
+        yield "  }"
+        yield ""
+
+        # Bulk handlers — Service-Warteschlange, fehlgeschlagene Einträge bleiben ausgewählt
+        failed_text = self._t('bulk_failed')
+        yield "  function toggleSelected(id: string) {"
+        yield "    setSelectedIds(prev => {"
+        yield "      const next = new Set(prev);"
+        yield "      if (next.has(id)) next.delete(id); else next.add(id);"
+        yield "      return next;"
+        yield "    });"
+        yield "  }"
+        yield ""
+        yield "  async function handleBulkDelete() {"
+        yield "    const ids = [...selectedIds].filter(id => !isPending(id));"
+        yield "    const targets = new Set(ids);"
+        yield "    const results = await " + self._service_call(identifier, "delete" + pascal + "Many") + "(ids, {"
+        yield "      onProgress: (done, total) => setBulkStatus(`${done}/${total}`),"
+        yield "    });"
+        yield "    const failed = new Set(results.filter(r => !r.ok).map(r => ids[r.index]));"
+        yield "    setRecords(prev => prev.filter(r => !targets.has(r.record_id) || failed.has(r.record_id)));"
+        yield "    setSelectedIds(failed);"
+        yield "    setBulkStatus(failed.size ? `${failed.size} " + failed_text + "` : null);"
+        yield "    setBulkDeleteOpen(false);"
+        yield "  }"
+        yield ""
+        yield "  async function handleBulkUpdate(fields: " + pascal + "['fields']) {"
+        yield "    // Nur ausgefüllte Felder werden auf alle ausgewählten Einträge geschrieben"
+        yield "    const changes = Object.fromEntries("
+        yield "      Object.entries(fields).filter(([, v]) => v !== undefined && v !== '')"
+        yield "    ) as Partial<" + pascal + "['fields']>;"
+        yield "    const ids = [...selectedIds].filter(id => !isPending(id));"
+        yield "    // Optimistisch: Änderungen sofort anzeigen, fehlgeschlagene Einträge auf den alten Stand zurück"
+        yield "    const targets = new Set(ids);"
+        yield "    const snapshot = new Map(records.filter(r => targets.has(r.record_id)).map(r => [r.record_id, r]));"
+        yield "    setRecords(prev => prev.map(r => snapshot.has(r.record_id) ? { ...r, fields: { ...r.fields, ...changes } } : r));"
+        yield "    setBulkEditOpen(false);"
+        yield "    setMutationError(null);"
+        yield "    const results = await " + self._service_call(identifier, "update" + pascal + "Many") + "("
+        yield "      ids.map(id => ({ id, fields: changes })),"
+        yield "      { onProgress: (done, total) => setBulkStatus(`${done}/${total}`) },"
+        yield "    );"
+        yield "    const failed = new Set(results.filter(r => !r.ok).map(r => ids[r.index]));"
+        yield "    if (failed.size) setRecords(prev => prev.map(r => failed.has(r.record_id) ? snapshot.get(r.record_id) ?? r : r));"
+        yield "    setSelectedIds(failed);"
+        yield "    setBulkStatus(failed.size ? `${failed.size} " + failed_text + "` : null);"
+        yield "  }"
+        yield ""
 
         # Applookup display helpers (deduplicated)
         generated_helpers = set()
         for dep in deps:
-            helper_name = "get" + dep["target_pascal"] + "DisplayName"
+            helper_name = "get" + dep.target_pascal + "DisplayName"
             if helper_name in generated_helpers:
                 continue
             generated_helpers.add(helper_name)
-            L.append("  function " + helper_name + "(url?: string) {")
-            L.append("    if (!url) return '—';")
-            L.append("    const id = extractRecordId(url);")
-            L.append("    return " + dep["target_identifier"] + "List.find(r => r.record_id === id)?.fields." + dep["display_field"] + " ?? '—';")
-            L.append("  }")
-            L.append("")
-
-        # Search filter
-        L.append("  const filtered = records.filter(r => {")
-        L.append("    if (!search) return true;")
-        L.append("    const s = search.toLowerCase();")
-        L.append("    return Object.values(r.fields).some(v =>")
-        L.append("      String(v ?? '').toLowerCase().includes(s)")
-        L.append("    );")
-        L.append("  });")
-        L.append("")
+            yield "  function " + helper_name + "(url?: string) {"
+            yield "    const id = extractRecordId(url);"
+            yield "    return (id && " + dep.target_identifier + "Table.displayNames.get(id)) || '—';"
+            yield "  }"
+            yield ""
+
+        # Search: one normalized string per record (fulltext fields + resolved labels/names),
+        # built only while searching and rebuilt only when the data changes — not per keystroke
+        search_parts, index_deps = [], ["records", "searching"]
+        for ctrl in self.schema[identifier].search_controls:
+            value = "r.fields." + ctrl.key
+            dep = next((d for d in deps if d.ctrl_key == ctrl.key), None)
+            if ctrl.lookup_type:
+                search_parts.append(value + " ? " + ctrl.lookup_labels_const + "[" + value + "] : ''")
+            elif dep:
+                table = dep.target_identifier + "Table"
+                search_parts.append(table + ".displayNames.get(extractRecordId(" + value + ") ?? '')")
+                if table not in index_deps:
+                    index_deps.append(table)
+            else:
+                search_parts.append(value)
+        yield "  const debouncedSearch = useDebouncedValue(search, " + str(self.SEARCH_DEBOUNCE_MS) + ");"
+        yield "  const searching = debouncedSearch.trim() !== '';"
+        yield "  // Suchindex: ein normalisierter String pro Record (Volltext-Felder + Anzeigenamen), nur neu bei Datenänderung"
+        yield "  const searchIndex = useMemo(() => !searching ? [] : records.map(r => normalizeSearch(["
+        for part in search_parts:
+            yield "    " + part + ","
+        yield "  ].join('\\n'))), [" + ", ".join(index_deps) + "]);"
+        yield "  const filtered = useMemo(() => {"
+        yield "    const terms = searchTerms(debouncedSearch);"
+        yield "    if (!terms.length) return records;"
+        yield "    return records.filter((_, i) => terms.every(term => searchIndex[i].includes(term)));"
+        yield "  }, [records, searchIndex, debouncedSearch]);"
+        yield "  const selectable = filtered.filter(r => !isPending(r.record_id));"
+        yield "  const allSelected = selectable.length > 0 && selectable.every(r => selectedIds.has(r.record_id));"
+        yield ""
+        yield "  function toggleAll() {"
+        yield "    setSelectedIds(allSelected ? new Set() : new Set(selectable.map(r => r.record_id)));"
+        yield "  }"
+        yield ""
 
         # Loading state
-        L.append("  if (loading) {")
-        L.append("    return (")
-        L.append('      <div className="flex items-center justify-center py-32">')
-        L.append('        <div className="animate-spin h-8 w-8 border-2 border-primary border-t-transparent rounded-full" />')
-        L.append("      </div>")
-        L.append("    );")
-        L.append("  }")
-        L.append("")
+        yield "  if (loading) {"
+        yield "    return ("
+        yield '      <div className="flex items-center justify-center py-32">'
+        yield '        <div className="animate-spin h-8 w-8 border-2 border-primary border-t-transparent rounded-full" />'
+        yield "      </div>"
+        yield "    );"
+        yield "  }"
+        yield ""
 
         # --- Render with PageShell ---
         search_ph = self._t('search_entity', entity=label)
@@ -815,108 +1153,163 @@ export function StatCard({ title, value, description, icon }: StatCardProps) {
         no_data = self._t('no_data_yet', entity=label)
         delete_title = self._t('delete_entity', entity=label)
         delete_desc = self._t('confirm_delete_desc')
-
-        L.append("  return (")
-        L.append("    <PageShell")
-        L.append('      title="' + label + '"')
-        L.append("      subtitle={`${records.length} " + self._t('in_system', entity=label) + "`}")
-        L.append("      action={")
-        L.append('        <Button onClick={() => setDialogOpen(true)} className="shrink-0">')
-        L.append('          <Plus className="h-4 w-4 mr-2" /> ' + add_btn)
-        L.append("        </Button>")
-        L.append("      }")
-        L.append("    >")
+        bulk_edit_title = self._t('bulk_edit_entity', entity=label)
+        bulk_delete_title = self._t('bulk_delete_entity', entity=label)
+        bulk_delete_desc = self._t('bulk_delete_desc')
+
+        yield "  return ("
+        yield "    <PageShell"
+        yield '      title="' + label + '"'
+        yield "      subtitle={`${records.length} " + self._t('in_system', entity=label) + "`}"
+        yield "      action={"
+        yield '        <Button onClick={() => setDialogOpen(true)} className="shrink-0">'
+        yield '          <Plus className="h-4 w-4 mr-2" /> ' + add_btn
+        yield "        </Button>"
+        yield "      }"
+        yield "    >"
 
         # Search bar
-        L.append('      <div className="relative w-full max-w-sm">')
-        L.append('        <Search className="absolute left-3 top-1/2 -translate-y-1/2 h-4 w-4 text-muted-foreground" />')
-        L.append("        <Input")
-        L.append('          placeholder="' + search_ph + '"')
-        L.append("          value={search}")
-        L.append("          onChange={e => setSearch(e.target.value)}")
-        L.append('          className="pl-9"')
-        L.append("        />")
-        L.append("      </div>")
+        yield '      <div className="relative w-full max-w-sm">'
+        yield '        <Search className="absolute left-3 top-1/2 -translate-y-1/2 h-4 w-4 text-muted-foreground" />'
+        yield "        <Input"
+        yield '          placeholder="' + search_ph + '"'
+        yield "          value={search}"
+        yield "          onChange={e => setSearch(e.target.value)}"
+        yield '          className="pl-9"'
+        yield "        />"
+        yield "      </div>"
+
+        # Fehler einer optimistischen Änderung (bereits zurückgerollt)
+        yield "      {mutationError && ("
+        yield '        <div className="rounded-lg border border-destructive/50 bg-destructive/10 px-4 py-2 text-sm text-destructive">'
+        yield "          {mutationError}"
+        yield "        </div>"
+        yield "      )}"
+
+        # Bulk action bar (only while records are selected)
+        yield "      {selectedIds.size > 0 && ("
+        yield '        <div className="flex flex-wrap items-center gap-2 rounded-lg border bg-muted/50 px-4 py-2 text-sm">'
+        yield '          <span className="font-medium">{selectedIds.size} ' + self._t('selected') + '</span>'
+        yield '          {bulkStatus && <span className="text-muted-foreground">{bulkStatus}</span>}'
+        yield '          <div className="ml-auto flex gap-2">'
+        yield '            <Button variant="outline" size="sm" onClick={() => setBulkEditOpen(true)}>'
+        yield '              <Pencil className="h-4 w-4 mr-2" /> ' + self._t('edit')
+        yield "            </Button>"
+        yield '            <Button variant="outline" size="sm" onClick={() => setBulkDeleteOpen(true)}>'
+        yield '              <Trash2 className="h-4 w-4 mr-2 text-destructive" /> ' + self._t('delete')
+        yield "            </Button>"
+        yield '            <Button variant="ghost" size="sm" onClick={() => { setSelectedIds(new Set()); setBulkStatus(null); }}>'
+        yield "              " + self._t('clear_selection')
+        yield "            </Button>"
+        yield "          </div>"
+        yield "        </div>"
+        yield "      )}"
 
         # Table with card-like wrapper
-        L.append('      <div className="rounded-lg border bg-card overflow-hidden">')
-        L.append("        <Table>")
-        L.append("          <TableHeader>")
-        L.append("            <TableRow>")
+        yield '      <div className="rounded-lg border bg-card overflow-hidden">'
+        yield "        <Table>"
+        yield "          <TableHeader>"
+        yield "            <TableRow>"
+        yield '              <TableHead className="w-10">'
+        yield "                <Checkbox checked={allSelected} onCheckedChange={toggleAll} />"
+        yield "              </TableHead>"
         for ctrl_key, ctrl_data in controls.items():
             col_label = ctrl_data.get("label", ctrl_key)
-            L.append('              <TableHead>' + col_label + '</TableHead>')
-        L.append('              <TableHead className="w-24">' + actions_label + '</TableHead>')
-        L.append("            </TableRow>")
-        L.append("          </TableHeader>")
-        L.append("          <TableBody>")
-        L.append("            {filtered.map(record => (")
-        L.append('              <TableRow key={record.record_id} className="hover:bg-muted/50 transition-colors">')
+            yield '              <TableHead>' + col_label + '</TableHead>'
+        yield '              <TableHead className="w-24">' + actions_label + '</TableHead>'
+        yield "            </TableRow>"
+        yield "          </TableHeader>"
+        yield "          <TableBody>"
+        yield "            {filtered.map(record => ("
+        yield '              <TableRow key={record.record_id} className="hover:bg-muted/50 transition-colors">'
+        yield "                <TableCell>"
+        yield "                  <Checkbox"
+        yield "                    checked={selectedIds.has(record.record_id)}"
+        yield "                    disabled={isPending(record.record_id)}"
+        yield "                    onCheckedChange={() => toggleSelected(record.record_id)}"
+        yield "                  />"
+        yield "                </TableCell>"
 
         # Table cells
         is_first_text = True
         for ctrl_key, ctrl_data in controls.items():
             fulltype = ctrl_data.get("fulltype", "string/text")
-            cell = self._render_table_cell(ctrl_key, ctrl_data, fulltype, deps, is_first_text)
-            L.append("                " + cell)
+            cell = self._render_table_cell(ctrl_key, ctrl_data, fulltype, deps, is_first_text,
+                                           self.schema[identifier].controls[ctrl_key])
+            yield "                " + cell
             if fulltype in ("string/text", "string/email") and is_first_text:
                 is_first_text = False
 
         # Actions column
-        L.append("                <TableCell>")
-        L.append('                  <div className="flex gap-1">')
-        L.append('                    <Button variant="ghost" size="icon" onClick={() => setEditingRecord(record)}>')
-        L.append('                      <Pencil className="h-4 w-4" />')
-        L.append("                    </Button>")
-        L.append('                    <Button variant="ghost" size="icon" onClick={() => setDeleteTarget(record)}>')
-        L.append('                      <Trash2 className="h-4 w-4 text-destructive" />')
-        L.append("                    </Button>")
-        L.append("                  </div>")
-        L.append("                </TableCell>")
-        L.append("              </TableRow>")
-        L.append("            ))}")
+        yield "                <TableCell>"
+        yield '                  <div className="flex gap-1">'
+        yield ('                    <Button variant="ghost" size="icon" disabled={isPending(record.record_id)}'
+               ' onClick={() => setEditingRecord(record)}>')
+        yield '                      <Pencil className="h-4 w-4" />'
+        yield "                    </Button>"
+        yield ('                    <Button variant="ghost" size="icon" disabled={isPending(record.record_id)}'
+               ' onClick={() => setDeleteTarget(record)}>')
+        yield '                      <Trash2 className="h-4 w-4 text-destructive" />'
+        yield "                    </Button>"
+        yield "                  </div>"
+        yield "                </TableCell>"
+        yield "              </TableRow>"
+        yield "            ))}"
 
         # Empty state
-        L.append("            {filtered.length === 0 && (")
-        L.append("              <TableRow>")
-        L.append('                <TableCell colSpan={' + str(col_count) + '} className="text-center py-16 text-muted-foreground">')
-        L.append("                  {search ? '" + no_results + "' : '" + no_data + "'}")
-        L.append("                </TableCell>")
-        L.append("              </TableRow>")
-        L.append("            )}")
-        L.append("          </TableBody>")
-        L.append("        </Table>")
-        L.append("      </div>")
+        yield "            {filtered.length === 0 && ("
+        yield "              <TableRow>"
+        yield '                <TableCell colSpan={' + str(col_count) + '} className="text-center py-16 text-muted-foreground">'
+        yield "                  {search ? '" + no_results + "' : '" + no_data + "'}"
+        yield "                </TableCell>"
+        yield "              </TableRow>"
+        yield "            )}"
+        yield "          </TableBody>"
+        yield "        </Table>"
+        yield "      </div>"
 
         # Dialogs
-        L.append("")
-        L.append("      <" + pascal + "Dialog")
-        L.append("        open={dialogOpen || !!editingRecord}")
-        L.append("        onClose={() => { setDialogOpen(false); setEditingRecord(null); }}")
-        L.append("        onSubmit={editingRecord ? handleUpdate : handleCreate}")
-        L.append("        defaultValues={editingRecord?.fields}")
-        for dep in unique_deps:
-            L.append("        " + dep["target_identifier"] + "List={" + dep["target_identifier"] + "List}")
-        L.append("      />")
-        L.append("")
-        L.append("      <ConfirmDialog")
-        L.append("        open={!!deleteTarget}")
-        L.append("        onClose={() => setDeleteTarget(null)}")
-        L.append("        onConfirm={handleDelete}")
-        L.append('        title="' + delete_title + '"')
-        L.append('        description="' + delete_desc + '"')
-        L.append("      />")
-
-        L.append("    </PageShell>")
-        L.append("  );")
-        L.append("}")
-        return "\n".join(L)
+        yield ""
+        yield "      <" + pascal + "Dialog"
+        yield "        open={dialogOpen || !!editingRecord}"
+        yield "        onClose={() => { setDialogOpen(false); setEditingRecord(null); }}"
+        yield "        onSubmit={editingRecord ? handleUpdate : handleCreate}"
+        yield "        defaultValues={editingRecord?.fields}"
+        yield "      />"
+        yield ""
+        yield "      <ConfirmDialog"
+        yield "        open={!!deleteTarget}"
+        yield "        onClose={() => setDeleteTarget(null)}"
+        yield "        onConfirm={handleDelete}"
+        yield '        title="' + delete_title + '"'
+        yield '        description="' + delete_desc + '"'
+        yield "      />"
+        yield ""
+        yield "      <" + pascal + "Dialog"
+        yield "        open={bulkEditOpen}"
+        yield "        onClose={() => setBulkEditOpen(false)}"
+        yield "        onSubmit={handleBulkUpdate}"
+        yield '        title="' + bulk_edit_title + '"'
+        yield "        bulk"
+        yield "      />"
+        yield ""
+        yield "      <ConfirmDialog"
+        yield "        open={bulkDeleteOpen}"
+        yield "        onClose={() => setBulkDeleteOpen(false)}"
+        yield "        onConfirm={handleBulkDelete}"
+        yield '        title="' + bulk_delete_title + '"'
+        yield '        description="' + bulk_delete_desc + '"'
+        yield "      />"
+
+        yield "    </PageShell>"
+        yield "  );"
+        yield "}"
 
     # ================================================================
     # Table cell renderer helper
     # ================================================================
 
-    def _render_table_cell(self, ctrl_key: str, ctrl_data: dict, fulltype: str, deps: list, is_first_text: bool) -> str:
+    def _render_table_cell(self, ctrl_key: str, ctrl_data: dict, fulltype: str, deps: list, is_first_text: bool, ctrl=None) -> str:
         yes_text = self._t('yes')
         no_text = self._t('no')
 
@@ -930,11 +1323,15 @@ export function StatCard({ title, value, description, icon }: StatCardProps) {
                     "{record.fields." + ctrl_key + " ? '" + yes_text + "' : '" + no_text + "'}"
                     "</span></TableCell>")
         elif fulltype == "lookup/select":
+            if ctrl is not None and ctrl.lookup_type:
+                value = "record.fields." + ctrl_key
+                return ('<TableCell><Badge variant="secondary">{' + value + " ? " + ctrl.lookup_labels_const
+                        + "[" + value + "] : '—'}</Badge></TableCell>")
             return '<TableCell><Badge variant="secondary">{record.fields.' + ctrl_key + " ?? '—'}</Badge></TableCell>"
         elif "applookup" in fulltype:
-            dep = next((d for d in deps if d["ctrl_key"] == ctrl_key), None)
+            dep = next((d for d in deps if d.ctrl_key == ctrl_key), None)
             if dep:
-                helper = "get" + dep["target_pascal"] + "DisplayName"
+                helper = "get" + dep.target_pascal + "DisplayName"
                 return "<TableCell>{" + helper + "(record.fields." + ctrl_key + ")}</TableCell>"
             return "<TableCell>{record.fields." + ctrl_key + " ?? '—'}</TableCell>"
         elif "date" in fulltype:
@@ -950,7 +1347,7 @@ export function StatCard({ title, value, description, icon }: StatCardProps) {
     # {Entity}Dialog.tsx — Create/edit dialog per scaffolded entity
     # ================================================================
 
-    def _generate_entity_dialog(self, identifier: str) -> str:
+    def _iter_entity_dialog(self, identifier: str):
         app_data = self.apps[identifier]
         controls = app_data.get("controls", {})
         pascal = self._to_pascal_case(identifier)
@@ -960,9 +1357,10 @@ export function StatCard({ title, value, description, icon }: StatCardProps) {
         unique_deps = self._get_unique_applookup_entities(identifier)
 
         # Determine which shadcn imports are needed
-        has_textarea = any(c.get("fulltype") == "string/textarea" for c in controls.values())
-        has_select = any(c.get("fulltype") in ("lookup/select",) or "applookup" in c.get("fulltype", "") for c in controls.values())
-        has_checkbox = any(c.get("fulltype") == "bool" for c in controls.values())
+        app_schema = self.schema[identifier]
+        has_textarea = app_schema.has_textarea
+        has_select = app_schema.has_select
+        has_checkbox = app_schema.has_checkbox
 
         # Localized text
         cancel_text = self._t('cancel')
@@ -973,79 +1371,100 @@ export function StatCard({ title, value, description, icon }: StatCardProps) {
         new_title = self._t('new_entity', entity=label)
         select_ph = self._t('select_placeholder')
 
-        L = []
-
         # --- Imports ---
-        L.append("import { useState, useEffect } from 'react';")
+        yield "import { useState, useEffect } from 'react';"
 
+        # Applookup-Listen nutzen den schlanken <Target>Lookup-Typ (record_id + Anzeigefeld)
         type_imports = [pascal]
         for dep in unique_deps:
-            if dep["target_pascal"] not in type_imports:
-                type_imports.append(dep["target_pascal"])
-        L.append("import type { " + ", ".join(type_imports) + " } from '@/types/app';")
-        L.append("import { APP_IDS } from '@/types/app';")
-        L.append("import { extractRecordId, createRecordUrl } from '@/services/livingAppsService';")
-        L.append("import {")
-        L.append("  Dialog, DialogContent, DialogHeader,")
-        L.append("  DialogTitle, DialogFooter,")
-        L.append("} from '@/components/ui/dialog';")
-        L.append("import { Button } from '@/components/ui/button';")
-        L.append("import { Input } from '@/components/ui/input';")
-        L.append("import { Label } from '@/components/ui/label';")
+            lookup_type = self.names[dep.target_identifier].lookup_type
+            if lookup_type not in type_imports:
+                type_imports.append(lookup_type)
+        type_imports += [c.lookup_type for c in app_schema.lookup_controls]
+        yield "import type { " + ", ".join(type_imports) + " } from '@/types/app';"
+        option_imports = "".join(", " + c.lookup_keys_const + ", " + c.lookup_labels_const for c in app_schema.lookup_controls)
+        yield "import { APP_IDS" + option_imports + " } from '@/types/app';"
+        yield from self._service_imports([dep.target_identifier for dep in unique_deps],
+                                         helpers="extractRecordId, createRecordUrl")
+        yield "import {"
+        yield "  Dialog, DialogContent, DialogHeader,"
+        yield "  DialogTitle, DialogFooter,"
+        yield "} from '@/components/ui/dialog';"
+        yield "import { Button } from '@/components/ui/button';"
+        yield "import { Input } from '@/components/ui/input';"
+        yield "import { Label } from '@/components/ui/label';"
         if has_textarea:
-            L.append("import { Textarea } from '@/components/ui/textarea';")
+            yield "import { Textarea } from '@/components/ui/textarea';"
         if has_select:
-            L.append("import {")
-            L.append("  Select, SelectContent, SelectItem,")
-            L.append("  SelectTrigger, SelectValue,")
-            L.append("} from '@/components/ui/select';")
+            yield "import {"
+            yield "  Select, SelectContent, SelectItem,"
+            yield "  SelectTrigger, SelectValue,"
+            yield "} from '@/components/ui/select';"
         if has_checkbox:
-            L.append("import { Checkbox } from '@/components/ui/checkbox';")
-        L.append("")
+            yield "import { Checkbox } from '@/components/ui/checkbox';"
+        if unique_deps:
+            yield "import { useEntities, setEntities } from '@/hooks/use-entity-store';"
+        yield ""
 
         # --- Props interface ---
-        L.append("interface " + pascal + "DialogProps {")
-        L.append("  open: boolean;")
-        L.append("  onClose: () => void;")
-        L.append("  onSubmit: (fields: " + pascal + "['fields']) => Promise<void>;")
-        L.append("  defaultValues?: " + pascal + "['fields'];")
-        for dep in unique_deps:
-            L.append("  " + dep["target_identifier"] + "List: " + dep["target_pascal"] + "[];")
-        L.append("}")
-        L.append("")
+        yield "interface " + pascal + "DialogProps {"
+        yield "  open: boolean;"
+        yield "  onClose: () => void;"
+        yield "  onSubmit: (fields: " + pascal + "['fields']) => Promise<void>;"
+        yield "  defaultValues?: " + pascal + "['fields'];"
+        yield "  title?: string;"
+        yield "  // Mehrfachbearbeitung: keine Pflichtfelder, leere Felder bleiben unverändert"
+        yield "  bulk?: boolean;"
+        yield "}"
+        yield ""
 
         # --- Component ---
-        props_destructure = "open, onClose, onSubmit, defaultValues"
+        props_destructure = "open, onClose, onSubmit, defaultValues, title, bulk"
+
+        yield "export function " + pascal + "Dialog({ " + props_destructure + " }: " + pascal + "DialogProps) {"
+        # Applookup-Optionen aus dem gemeinsamen Store (vollständige Listen lädt der Dialog beim Öffnen)
         for dep in unique_deps:
-            props_destructure += ", " + dep["target_identifier"] + "List"
-
-        L.append("export function " + pascal + "Dialog({ " + props_destructure + " }: " + pascal + "DialogProps) {")
-        L.append("  const [fields, setFields] = useState<Partial<" + pascal + "['fields']>>({});")
-        L.append("  const [saving, setSaving] = useState(false);")
-        L.append("")
-        L.append("  useEffect(() => {")
-        L.append("    if (open) setFields(defaultValues ?? {});")
-        L.append("  }, [open, defaultValues]);")
-        L.append("")
-        L.append("  async function handleSubmit(e: React.FormEvent) {")
-        L.append("    e.preventDefault();")
-        L.append("    setSaving(true);")
-        L.append("    try {")
-        L.append("      await onSubmit(fields as " + pascal + "['fields']);")
-        L.append("    } finally {")
-        L.append("      setSaving(false);")
-        L.append("    }")
-        L.append("  }")
-        L.append("")
+            yield ("  const " + dep.target_identifier + "List = useEntities<" + self.names[dep.target_identifier].lookup_type
+                   + ">(APP_IDS." + dep.target_const + ").list;")
+        yield "  const [fields, setFields] = useState<Partial<" + pascal + "['fields']>>({});"
+        yield "  const [saving, setSaving] = useState(false);"
+        yield ""
+        yield "  useEffect(() => {"
+        yield "    if (open) setFields(defaultValues ?? {});"
+        yield "  }, [open, defaultValues]);"
+        yield ""
+        if unique_deps:
+            # Full option lists only when the dialog is used — the page resolves just the referenced records
+            yield "  useEffect(() => {"
+            yield "    if (!open) return;"
+            yield "    const controller = new AbortController();"
+            for dep in unique_deps:
+                yield ("    " + self._service_call(dep.target_identifier, "get" + dep.target_pascal + "Lookup")
+                       + "(controller.signal)")
+                yield ("      .then(data => setEntities(APP_IDS." + dep.target_const + ", data, '" + dep.display_field + "'))")
+                yield "      .catch(e => { if (!controller.signal.aborted) console.error('Failed to load options:', e); });"
+            yield "    return () => controller.abort();"
+            yield "  }, [open]);"
+            yield ""
+        yield "  async function handleSubmit(e: React.FormEvent) {"
+        yield "    e.preventDefault();"
+        yield "    setSaving(true);"
+        yield "    try {"
+        yield "      await onSubmit(fields as " + pascal + "['fields']);"
+        yield "    } finally {"
+        yield "      setSaving(false);"
+        yield "    }"
+        yield "  }"
+        yield ""
 
         # --- Render ---
-        L.append("  return (")
-        L.append("    <Dialog open={open} onOpenChange={v => !v && onClose()}>")
-        L.append('      <DialogContent className="max-w-lg">')
-        L.append("        <DialogHeader>")
-        L.append("          <DialogTitle>{defaultValues ? '" + edit_title + "' : '" + new_title + "'}</DialogTitle>")
-        L.append("        </DialogHeader>")
-        L.append('        <form onSubmit={handleSubmit} className="space-y-4">')
+        yield "  return ("
+        yield "    <Dialog open={open} onOpenChange={v => !v && onClose()}>"
+        yield '      <DialogContent className="max-w-lg">'
+        yield "        <DialogHeader>"
+        yield "          <DialogTitle>{title ?? (defaultValues ? '" + edit_title + "' : '" + new_title + "')}</DialogTitle>"
+        yield "        </DialogHeader>"
+        yield '        <form onSubmit={handleSubmit} className="space-y-4">'
 
         # Form fields
         for ctrl_key, ctrl_data in controls.items():
@@ -1055,34 +1474,34 @@ export function StatCard({ title, value, description, icon }: StatCardProps) {
             req_mark = " *" if required else ""
             req_attr = " required" if required else ""
 
-            L.append('          <div className="space-y-2">')
-            L.append('            <Label htmlFor="' + ctrl_key + '">' + field_label + req_mark + '</Label>')
+            yield '          <div className="space-y-2">'
+            yield '            <Label htmlFor="' + ctrl_key + '">' + field_label + req_mark + '</Label>'
 
-            field_jsx = self._render_form_field(ctrl_key, ctrl_data, fulltype, deps, unique_deps, req_attr, select_ph)
+            field_jsx = self._render_form_field(ctrl_key, ctrl_data, fulltype, deps, unique_deps, req_attr, select_ph,
+                                                app_schema.controls[ctrl_key])
             for line in field_jsx:
-                L.append("            " + line)
+                yield "            " + line
 
-            L.append("          </div>")
+            yield "          </div>"
 
         # Footer
-        L.append("          <DialogFooter>")
-        L.append('            <Button type="button" variant="outline" onClick={onClose}>' + cancel_text + '</Button>')
-        L.append('            <Button type="submit" disabled={saving}>')
-        L.append("              {saving ? '" + saving_text + "' : defaultValues ? '" + save_text + "' : '" + create_text + "'}")
-        L.append("            </Button>")
-        L.append("          </DialogFooter>")
-        L.append("        </form>")
-        L.append("      </DialogContent>")
-        L.append("    </Dialog>")
-        L.append("  );")
-        L.append("}")
-        return "\n".join(L)
+        yield "          <DialogFooter>"
+        yield '            <Button type="button" variant="outline" onClick={onClose}>' + cancel_text + '</Button>'
+        yield '            <Button type="submit" disabled={saving}>'
+        yield "              {saving ? '" + saving_text + "' : defaultValues || bulk ? '" + save_text + "' : '" + create_text + "'}"
+        yield "            </Button>"
+        yield "          </DialogFooter>"
+        yield "        </form>"
+        yield "      </DialogContent>"
+        yield "    </Dialog>"
+        yield "  );"
+        yield "}"
 
     # ================================================================
     # Form field renderer helper
     # ================================================================
 
-    def _render_form_field(self, ctrl_key: str, ctrl_data: dict, fulltype: str, deps: list, unique_deps: list, req_attr: str, select_ph: str) -> list:
+    def _render_form_field(self, ctrl_key: str, ctrl_data: dict, fulltype: str, deps: list, unique_deps: list, req_attr: str, select_ph: str, ctrl=None) -> list:
         """Returns a list of JSX lines for a single form field."""
         lines = []
 
@@ -1092,7 +1511,7 @@ export function StatCard({ title, value, description, icon }: StatCardProps) {
             lines.append("  value={fields." + ctrl_key + " ?? ''}")
             lines.append("  onChange={e => setFields(f => ({ ...f, " + ctrl_key + ": e.target.value }))}")
             if req_attr.strip():
-                lines.append("  required")
+                lines.append("  required={!bulk}")
             lines.append("/>")
 
         elif fulltype == "string/textarea":
@@ -1136,7 +1555,7 @@ export function StatCard({ title, value, description, icon }: StatCardProps) {
             lines.append("  value={fields." + ctrl_key + " ?? ''}")
             lines.append("  onChange={e => setFields(f => ({ ...f, " + ctrl_key + ": e.target.value }))}")
             if req_attr.strip():
-                lines.append("  required")
+                lines.append("  required={!bulk}")
             lines.append("/>")
 
         elif fulltype == "date/datetimeminute":
@@ -1149,13 +1568,9 @@ export function StatCard({ title, value, description, icon }: StatCardProps) {
             lines.append("/>")
 
         elif fulltype == "lookup/select":
-            lookup_data = ctrl_data.get("lookup_data", {})
-            # Build TypeScript union type assertion to match generated types
-            if lookup_data:
-                union_type = " | ".join("'" + k + "'" for k in lookup_data.keys())
-                type_cast = " as " + union_type
-            else:
-                type_cast = ""
+            # Cast to the named key type from types/app.ts (instead of repeating the options)
+            named = ctrl is not None and ctrl.lookup_type
+            type_cast = " as " + ctrl.lookup_type if named else ""
             lines.append("<Select")
             lines.append("  value={fields." + ctrl_key + " ?? 'none'}")
             lines.append("  onValueChange={v => setFields(f => ({ ...f, " + ctrl_key + ": v === 'none' ? undefined : v" + type_cast + " }))}")
@@ -1163,18 +1578,19 @@ export function StatCard({ title, value, description, icon }: StatCardProps) {
             lines.append('  <SelectTrigger id="' + ctrl_key + '"><SelectValue placeholder="' + select_ph + '" /></SelectTrigger>')
             lines.append("  <SelectContent>")
             lines.append('    <SelectItem value="none">—</SelectItem>')
-            for key, value in lookup_data.items():
-                safe_val = str(value).replace("'", "\\'")
-                lines.append('    <SelectItem value="' + str(key) + '">' + safe_val + '</SelectItem>')
+            if named:
+                lines.append("    {" + ctrl.lookup_keys_const + ".map(key => (")
+                lines.append("      <SelectItem key={key} value={key}>{" + ctrl.lookup_labels_const + "[key]}</SelectItem>")
+                lines.append("    ))}")
             lines.append("  </SelectContent>")
             lines.append("</Select>")
 
         elif "applookup" in fulltype:
-            dep = next((d for d in deps if d["ctrl_key"] == ctrl_key), None)
+            dep = next((d for d in deps if d.ctrl_key == ctrl_key), None)
             if dep:
-                const_name = dep["target_const"]
-                display_field = dep["display_field"]
-                list_var = dep["target_identifier"] + "List"
+                const_name = dep.target_const
+                display_field = dep.display_field
+                list_var = dep.target_identifier + "List"
 
                 lines.append("<Select")
                 lines.append("  value={extractRecordId(fields." + ctrl_key + ") ?? 'none'}")
@@ -1212,26 +1628,41 @@ export function StatCard({ title, value, description, icon }: StatCardProps) {
     # Placeholder page for non-scaffolded entities
     # ================================================================
 
-    def _generate_placeholder_page(self, identifier: str) -> str:
+    def _iter_placeholder_page(self, identifier: str):
         pascal = self._to_pascal_case(identifier)
         label = self.apps[identifier].get("name", pascal)
 
-        L = []
-        L.append("// TODO: Build custom UI for " + label)
-        L.append("// This entity was not included in crud_scaffolds — build your own view here.")
-        L.append("// Available: LivingAppsService.get" + pascal + "(), create/update/delete methods")
-        L.append("")
-        L.append("export default function " + pascal + "Page() {")
-        L.append("  return (")
-        L.append('    <div className="space-y-6">')
-        L.append("      <div>")
-        L.append('        <h1 className="text-2xl font-bold tracking-tight">' + label + "</h1>")
-        L.append('        <p className="text-muted-foreground">Build your custom ' + label.lower() + ' view here.</p>')
-        L.append("      </div>")
-        L.append('      <div className="rounded-lg border border-dashed p-12 text-center text-muted-foreground">')
-        L.append("        <p>Custom UI placeholder — build your " + label.lower() + " view here</p>")
-        L.append("      </div>")
-        L.append("    </div>")
-        L.append("  );")
-        L.append("}")
-        return "\n".join(L)
+        yield "// TODO: Build custom UI for " + label
+        yield "// This entity was not included in crud_scaffolds — build your own view here."
+        yield "// Available: " + self._service_call(identifier, "get" + pascal) + "(), create/update/delete methods"
+        yield ""
+        yield "export default function " + pascal + "Page() {"
+        yield "  return ("
+        yield '    <div className="space-y-6">'
+        yield "      <div>"
+        yield '        <h1 className="text-2xl font-bold tracking-tight">' + label + "</h1>"
+        yield '        <p className="text-muted-foreground">Build your custom ' + label.lower() + ' view here.</p>'
+        yield "      </div>"
+        yield '      <div className="rounded-lg border border-dashed p-12 text-center text-muted-foreground">'
+        yield "        <p>Custom UI placeholder — build your " + label.lower() + " view here</p>"
+        yield "      </div>"
+        yield "    </div>"
+        yield "  );"
+        yield "}"
+
+
+# ================================================================
+# Process-pool workers for generate_all(workers=n)
+# ================================================================
+
+_worker_generator = None
+
+
+def _init_entity_worker(metadata: dict, crud_scaffolds: list, modular: bool):
+    # Each worker builds schema + names once, then renders many entities
+    global _worker_generator
+    _worker_generator = ReactComponentGenerator(metadata, crud_scaffolds, modular)
+
+
+def _render_entity_in_worker(identifier: str) -> dict:
+    return _worker_generator._render_entity(identifier)
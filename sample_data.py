@@ -0,0 +1,289 @@
+import asyncio
+import random
+import time
+from datetime import date, datetime, timedelta
+
+
+API_URL = "https://my.living-apps.de/rest"
+
+
+class SampleDataGenerator:
+    """
+    Generates type-correct synthetic records from app_metadata.json.
+
+    - Values follow each control's fulltype (text, email, number, bool, dates, lookups)
+    - lookup/select values are always keys of lookup_data
+    - required controls are always filled, optional ones most of the time
+    - applookup fields point to records of the parent app, so parents are seeded first;
+      a required applookup without parent records is an error, optional ones stay empty
+    """
+
+    FIRST_NAMES = [
+        "Anna", "Ben", "Clara", "David", "Emma", "Felix", "Greta", "Hannah", "Jonas", "Julia",
+        "Leon", "Lena", "Lukas", "Marie", "Max", "Mia", "Noah", "Paul", "Sophie", "Tom",
+    ]
+    LAST_NAMES = [
+        "Müller", "Schmidt", "Schneider", "Fischer", "Weber", "Meyer", "Wagner", "Becker",
+        "Schulz", "Hoffmann", "Koch", "Richter", "Klein", "Wolf", "Neumann", "Braun",
+    ]
+    WORDS = [
+        "Grundlagen", "Praxis", "Workshop", "Intensiv", "Einführung", "Projekt", "Analyse",
+        "Design", "Management", "Kommunikation", "Daten", "Planung", "Strategie", "Team",
+        "Qualität", "Service", "Technik", "Marketing", "Finanzen", "Sicherheit",
+    ]
+    CITIES = ["Berlin", "Hamburg", "München", "Köln", "Frankfurt", "Stuttgart", "Leipzig", "Dresden"]
+    OPTIONAL_FILL_RATE = 0.8
+
+    def __init__(self, metadata: dict, seed: int = None):
+        self.metadata = metadata
+        self.apps = metadata.get("apps", {})
+        self.app_id_to_identifier = {data["app_id"]: key for key, data in self.apps.items()}
+        self.random = random.Random(seed)
+
+    # ================================================================
+    # Dependency analysis
+    # ================================================================
+
+    def _lookup_target(self, ctrl: dict) -> str:
+        """Identifier of the app an applookup control points to (or None)."""
+        url = ctrl.get("lookup_app", "")
+        if not url:
+            return None
+        return self.app_id_to_identifier.get(url.rstrip("/").split("/")[-1])
+
+    def parent_apps(self, identifier: str) -> list:
+        parents = []
+        for ctrl in self.apps[identifier].get("controls", {}).values():
+            if "applookup" in ctrl.get("fulltype", ""):
+                target = self._lookup_target(ctrl)
+                if target and target != identifier and target not in parents:
+                    parents.append(target)
+        return parents
+
+    def seed_order(self, identifiers: list) -> list:
+        """Parents before children (depth-first), cycles fall back to metadata order."""
+        ordered, visiting = [], set()
+
+        def visit(identifier):
+            if identifier in ordered or identifier in visiting:
+                return
+            visiting.add(identifier)
+            for parent in self.parent_apps(identifier):
+                if parent in identifiers:
+                    visit(parent)
+            visiting.discard(identifier)
+            ordered.append(identifier)
+
+        for identifier in identifiers:
+            visit(identifier)
+        return ordered
+
+    # ================================================================
+    # Value generation
+    # ================================================================
+
+    def _person_name(self) -> str:
+        return f"{self.random.choice(self.FIRST_NAMES)} {self.random.choice(self.LAST_NAMES)}"
+
+    def _text_value(self, key: str, label: str, fields: dict) -> str:
+        # Content guesses by control key / label (first match wins)
+        hint = f"{key} {label}".lower()
+        if any(h in hint for h in ("telefon", "phone", "mobil", "handy")):
+            return f"+49 {self.random.randint(150, 179)} {self.random.randint(1000000, 9999999)}"
+        if any(h in hint for h in ("stadt", "city", "standort", "gebaeude", "gebäude", "building")):
+            return self.random.choice(self.CITIES)
+        if any(h in hint for h in ("strasse", "straße", "street", "adresse", "address")):
+            return f"{self.random.choice(self.LAST_NAMES)}straße {self.random.randint(1, 120)}"
+        if any(h in hint for h in ("raum", "room")):
+            return f"Raum {self.random.choice('ABC')}{self.random.randint(100, 399)}"
+        if "name" in hint and not any(h in hint for h in ("titel", "title", "raum", "room")):
+            name = self._person_name()
+            fields["__person"] = name
+            return name
+        return " ".join(self.random.sample(self.WORDS, 2))
+
+    def _email_value(self, fields: dict) -> str:
+        name = fields.get("__person") or self._person_name()
+        local = name.lower().replace(" ", ".")
+        for src, dst in (("ä", "ae"), ("ö", "oe"), ("ü", "ue"), ("ß", "ss")):
+            local = local.replace(src, dst)
+        return f"{local}{self.random.randint(1, 999)}@example.com"
+
+    def _number_value(self, key: str, label: str):
+        hint = f"{key} {label}".lower()
+        if any(h in hint for h in ("preis", "price", "betrag", "amount", "kosten", "cost", "gebühr")):
+            return round(self.random.uniform(20, 2000), 2)
+        if any(h in hint for h in ("kapazit", "capacity", "max", "anzahl", "count", "plaetze", "plätze")):
+            return self.random.randint(5, 50)
+        return self.random.randint(1, 100)
+
+    def _date_value(self, fulltype: str, key: str, fields: dict) -> str:
+        today = date.today()
+        day = today + timedelta(days=self.random.randint(-365, 365))
+        if "geburt" in key or "birth" in key:
+            day = today - timedelta(days=self.random.randint(18 * 365, 70 * 365))
+        if any(h in key for h in ("end", "bis")) and fields.get("__last_date"):
+            day = fields["__last_date"] + timedelta(days=self.random.randint(1, 60))
+        fields["__last_date"] = day
+        if fulltype == "date/datetimeminute":
+            moment = datetime(day.year, day.month, day.day, self.random.randint(8, 18), self.random.choice((0, 15, 30, 45)))
+            return moment.strftime("%Y-%m-%dT%H:%M")
+        return day.isoformat()
+
+    def make_fields(self, identifier: str, parent_urls: dict) -> dict:
+        """
+        One record's fields. parent_urls: {parent identifier: [record URLs]}.
+
+        Raises ValueError if a required applookup has no parent records to point to.
+        """
+        fields = {}
+        for key, ctrl in self.apps[identifier].get("controls", {}).items():
+            fulltype = ctrl.get("fulltype", "string/text")
+            label = ctrl.get("label", key)
+            if not ctrl.get("required") and self.random.random() > self.OPTIONAL_FILL_RATE:
+                continue
+
+            lookup_keys = list((ctrl.get("lookup_data") or ctrl.get("lookups") or {}).keys())
+            if "applookup" in fulltype:
+                target = self._lookup_target(ctrl)
+                urls = parent_urls.get(target) or []
+                if not urls:
+                    if ctrl.get("required"):
+                        raise ValueError(
+                            f"{identifier}.{key} is a required lookup to {target or ctrl.get('lookup_app')}, "
+                            f"which has no records — seed it first"
+                        )
+                    continue
+                if fulltype.startswith("multiple"):
+                    value = self.random.sample(urls, min(len(urls), self.random.randint(1, 3)))
+                else:
+                    value = self.random.choice(urls)
+            elif "lookup" in fulltype:
+                if not lookup_keys:
+                    continue
+                if fulltype.startswith("multiple"):
+                    value = self.random.sample(lookup_keys, self.random.randint(1, len(lookup_keys)))
+                else:
+                    value = self.random.choice(lookup_keys)
+            elif fulltype == "number":
+                value = self._number_value(key, label)
+            elif fulltype == "bool":
+                value = self.random.random() < 0.5
+            elif fulltype.startswith("date"):
+                value = self._date_value(fulltype, key.lower(), fields)
+            elif fulltype == "string/email":
+                value = self._email_value(fields)
+            elif fulltype == "string/url":
+                value = f"https://example.com/{key}/{self.random.randint(1, 99999)}"
+            elif fulltype == "string/textarea":
+                value = " ".join(self.random.choices(self.WORDS, k=self.random.randint(8, 30))) + "."
+            elif fulltype.startswith("string"):
+                value = self._text_value(key, label, fields)
+            else:
+                # Files, geo, signatures etc. are left empty
+                continue
+            fields[key] = value
+
+        return {k: v for k, v in fields.items() if not k.startswith("__")}
+
+
+def record_url(app_id: str, record_id: str) -> str:
+    # Same format as createRecordUrl() in the generated service
+    return f"{API_URL}/apps/{app_id}/records/{record_id}"
+
+
+# Safe to retry a POST only if the server cannot have created the record: the connection was never
+# established, or the server rejected the request outright. Read/write timeouts, dropped connections
+# and gateway errors (502/504) may come after the record was created — re-sending would duplicate it.
+RETRY_STATUS = (429, 503)
+
+
+async def seed_sample_data(metadata: dict, api_key: str, counts: dict,
+                           concurrency: int = 8, seed: int = None, max_retries: int = 3) -> dict:
+    """
+    Create synthetic records via bounded-concurrency POSTs, parents first.
+
+    counts: {identifier: number of records}. Returns a throughput report per app.
+    """
+    import httpx
+
+    generator = SampleDataGenerator(metadata, seed)
+    headers = {"X-API-Key": api_key, "Content-Type": "application/json", "Accept": "application/json"}
+    semaphore = asyncio.Semaphore(concurrency)
+    parent_urls = {}
+    report = {"apps": {}, "total_created": 0, "total_failed": 0}
+    t_start = time.time()
+
+    async with httpx.AsyncClient(
+        headers=headers,
+        timeout=60,
+        limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+    ) as client:
+
+        async def existing_urls(identifier: str) -> list:
+            """Record URLs of a parent that is not seeded in this run."""
+            app_id = generator.apps[identifier]["app_id"]
+            resp = await client.get(f"{API_URL}/apps/{app_id}/records")
+            resp.raise_for_status()
+            return [record_url(app_id, rid) for rid in resp.json().keys()]
+
+        async def create_one(app_id: str, fields: dict):
+            async with semaphore:
+                for attempt in range(max_retries + 1):
+                    try:
+                        resp = await client.post(f"{API_URL}/apps/{app_id}/records", json={"fields": fields})
+                        if resp.status_code in RETRY_STATUS and attempt < max_retries:
+                            await asyncio.sleep(0.5 * 2 ** attempt)
+                            continue
+                        resp.raise_for_status()
+                        return resp.json().get("id")
+                    except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout):
+                        # Request never reached the server
+                        if attempt == max_retries:
+                            raise
+                        await asyncio.sleep(0.5 * 2 ** attempt)
+
+        for identifier in generator.seed_order([k for k in counts if k in generator.apps]):
+            app_id = generator.apps[identifier]["app_id"]
+            for parent in generator.parent_apps(identifier):
+                if parent not in parent_urls:
+                    try:
+                        parent_urls[parent] = await existing_urls(parent)
+                    except Exception as e:
+                        print(f"[SEED] ⚠️ Could not load {parent} records: {e}")
+                        parent_urls[parent] = []
+
+            t_app = time.time()
+            try:
+                records = [generator.make_fields(identifier, parent_urls) for _ in range(counts[identifier])]
+            except ValueError as e:
+                print(f"[SEED] ❌ {identifier}: {e}")
+                report["apps"][identifier] = {
+                    "created": 0, "failed": counts[identifier], "seconds": 0,
+                    "records_per_second": None, "first_error": str(e),
+                }
+                report["total_failed"] += counts[identifier]
+                continue
+            results = await asyncio.gather(*(create_one(app_id, f) for f in records), return_exceptions=True)
+
+            created_ids = [r for r in results if isinstance(r, str)]
+            errors = [r for r in results if isinstance(r, Exception)]
+            parent_urls[identifier] = parent_urls.get(identifier, []) + [record_url(app_id, rid) for rid in created_ids]
+
+            elapsed = time.time() - t_app
+            report["apps"][identifier] = {
+                "created": len(created_ids),
+                "failed": len(records) - len(created_ids),
+                "seconds": round(elapsed, 2),
+                "records_per_second": round(len(created_ids) / elapsed, 1) if elapsed else None,
+                "first_error": str(errors[0])[:300] if errors else None,
+            }
+            report["total_created"] += len(created_ids)
+            report["total_failed"] += len(records) - len(created_ids)
+            print(f"[SEED] ✅ {identifier}: {len(created_ids)}/{len(records)} records ({elapsed:.1f}s)")
+
+    total = time.time() - t_start
+    report["seconds"] = round(total, 2)
+    report["records_per_second"] = round(report["total_created"] / total, 1) if total else None
+    report["concurrency"] = concurrency
+    return report
@@ -0,0 +1,157 @@
+import hashlib
+import json
+
+from naming import NamingRegistry, lookup_type_names
+
+
+class ControlSchema:
+    """One field of an app, with its applookup target already resolved."""
+
+    __slots__ = ("key", "label", "fulltype", "required", "in_list", "in_fulltext_search", "lookup_data", "target", "raw",
+                 "lookup_keys_const", "lookup_type", "lookup_labels_const")
+
+    def __init__(self, key: str, data: dict, app_identifier: str):
+        self.key = key
+        self.label = data.get("label", key)
+        self.fulltype = data.get("fulltype", "")
+        self.required = bool(data.get("required"))
+        self.in_list = bool(data.get("in_list"))
+        self.in_fulltext_search = bool(data.get("in_fulltext_search", True))
+        self.lookup_data = data.get("lookup_data") or {}
+        self.target = None  # identifier of the applookup target app, set by Schema
+        self.raw = data     # original metadata dict (the generators still render from it)
+        # Named option types in types/app.ts (None unless lookup/select with options)
+        self.lookup_keys_const = self.lookup_type = self.lookup_labels_const = None
+        if self.fulltype == "lookup/select" and self.lookup_data:
+            self.lookup_keys_const, self.lookup_type, self.lookup_labels_const = lookup_type_names(app_identifier, key)
+
+    @property
+    def is_applookup(self) -> bool:
+        return "applookup" in self.fulltype
+
+    @property
+    def is_date(self) -> bool:
+        return "date" in self.fulltype
+
+
+class LookupEdge:
+    """applookup dependency: ctrl_key of the source app -> target app."""
+
+    __slots__ = ("ctrl_key", "target_identifier", "target_pascal", "target_const", "display_field")
+
+    def __init__(self, ctrl_key: str, target: "AppSchema"):
+        self.ctrl_key = ctrl_key
+        self.target_identifier = target.identifier
+        self.target_pascal = target.names.pascal
+        self.target_const = target.names.const
+        self.display_field = target.display_field
+
+
+class AppSchema:
+    """One app: controls, display field, applookup edges and type flags."""
+
+    __slots__ = ("identifier", "app_id", "name", "names", "controls", "display_field", "lookup_fields", "lookup_controls",
+                 "search_controls",
+                 "deps", "unique_deps", "referenced_by",
+                 "has_dates", "has_lookup", "has_textarea", "has_select", "has_checkbox")
+
+    DISPLAY_FIELD_NAMES = ("name", "title", "bezeichnung", "label", "titel", "description")
+
+    def __init__(self, identifier: str, data: dict, names):
+        self.identifier = identifier
+        self.app_id = data.get("app_id")
+        self.names = names
+        self.name = data.get("name", names.pascal)
+        self.controls = {key: ControlSchema(key, ctrl, identifier) for key, ctrl in data.get("controls", {}).items()}
+        self.display_field = self._find_display_field()
+        # Felder, die Applookup-Listen dieser App brauchen (Dropdowns + Anzeigenamen)
+        self.lookup_fields = (self.display_field,) if self.display_field in self.controls else ()
+        self.lookup_controls = [ctrl for ctrl in self.controls.values() if ctrl.lookup_type]
+        # Felder der Volltextsuche (Ja/Nein-Felder nie); ohne markierte Felder wird alles durchsucht
+        searchable = [ctrl for ctrl in self.controls.values() if ctrl.fulltype != "bool"]
+        self.search_controls = [ctrl for ctrl in searchable if ctrl.in_fulltext_search] or searchable
+        self.deps = []             # LookupEdge per applookup control (resolved by Schema)
+        self.unique_deps = []      # one LookupEdge per referenced target app
+        self.referenced_by = []    # (source identifier, ctrl_key) pointing at this app
+
+        # Type flags in one pass over the controls
+        self.has_dates = self.has_lookup = self.has_textarea = self.has_select = self.has_checkbox = False
+        for ctrl in self.controls.values():
+            ftype = ctrl.fulltype
+            self.has_dates |= ctrl.is_date
+            self.has_lookup |= ftype == "lookup/select"
+            self.has_textarea |= ftype == "string/textarea"
+            self.has_select |= ftype == "lookup/select" or ctrl.is_applookup
+            self.has_checkbox |= ftype == "bool"
+
+    def _find_display_field(self) -> str:
+        """Which field to show for an entity in dropdowns / table lookups."""
+        for key, ctrl in self.controls.items():
+            if ctrl.fulltype == "string/text" and ctrl.in_list:
+                return key
+        for name in self.DISPLAY_FIELD_NAMES:
+            if name in self.controls:
+                return name
+        for key, ctrl in self.controls.items():
+            if "string" in ctrl.fulltype:
+                return key
+        return next(iter(self.controls), "record_id")
+
+
+class Schema:
+    """
+    Compact, precomputed view of app_metadata.json shared by all generators.
+
+    Built once per metadata load (Schema.for_metadata): applookup URLs are resolved
+    to target apps, dependency edges, display fields and type flags are computed in
+    a single pass, and a reverse index records which apps reference each app.
+    """
+
+    __slots__ = ("apps", "app_id_to_identifier", "names", "hash")
+
+    _last = None  # (metadata, schema)
+
+    def __init__(self, metadata: dict):
+        self.names = NamingRegistry.for_metadata(metadata)
+        raw_apps = metadata.get("apps", {})
+        self.apps = {identifier: AppSchema(identifier, data, self.names[identifier])
+                     for identifier, data in raw_apps.items()}
+        self.app_id_to_identifier = {app.app_id: app.identifier for app in self.apps.values()}
+        # Struktur-Hash (App-IDs, Feldnamen, Feldtypen) — Labels ändern ihn nicht
+        structure = {app.identifier: [app.app_id, {key: ctrl.fulltype for key, ctrl in app.controls.items()}]
+                     for app in self.apps.values()}
+        self.hash = hashlib.sha1(json.dumps(structure, sort_keys=True).encode()).hexdigest()[:16]
+
+        for app in self.apps.values():
+            seen = set()
+            for ctrl in app.controls.values():
+                if not ctrl.is_applookup:
+                    continue
+                lookup_app_url = ctrl.raw.get("lookup_app", "")
+                target_id = lookup_app_url.rstrip("/").split("/")[-1] if lookup_app_url else None
+                target_identifier = self.app_id_to_identifier.get(target_id)
+                if not target_identifier:
+                    continue
+                ctrl.target = target_identifier
+                target = self.apps[target_identifier]
+                edge = LookupEdge(ctrl.key, target)
+                app.deps.append(edge)
+                if target_identifier not in seen:
+                    seen.add(target_identifier)
+                    app.unique_deps.append(edge)
+                target.referenced_by.append((app.identifier, ctrl.key))
+
+    @classmethod
+    def for_metadata(cls, metadata: dict) -> "Schema":
+        if cls._last is None or cls._last[0] is not metadata:
+            cls._last = (metadata, cls(metadata))
+        return cls._last[1]
+
+    def __getitem__(self, identifier: str) -> AppSchema:
+        return self.apps[identifier]
+
+    def __contains__(self, identifier: str) -> bool:
+        return identifier in self.apps
+
+    def __iter__(self):
+        return iter(self.apps.values())
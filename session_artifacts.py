@@ -0,0 +1,218 @@
+import gzip
+import hashlib
+import json
+import os
+import subprocess
+from pathlib import Path
+
+
+class SessionArtifactManager:
+    """
+    Keeps .claude session transcripts out of the deploy commit.
+
+    Transcripts are compacted (JSONL re-serialized without whitespace), split into
+    fixed line chunks and stored gzip-compressed under their SHA-256:
+
+        <store_dir>/objects/ab/ab12...gz   — one chunk, content-addressed
+        <store_dir>/manifest.json          — file -> ordered chunk list
+
+    Resumed sessions only append to their transcript, so all full chunks stay
+    identical and are never written (or committed) again.
+
+    Modes (env SESSION_STORE_MODE):
+    - branch — store is a git repo on an orphan branch, pushed next to main
+    - local  — store stays on disk, nothing is pushed
+    - inline — legacy behaviour: .claude is force-added to the deploy commit
+    """
+
+    MODES = ("branch", "local", "inline")
+    CHUNK_LINES = 256
+    # debug/ may contain secrets and is never stored
+    EXCLUDED_DIRS = {"debug"}
+
+    def __init__(self, app_dir: str = "/home/user/app", store_dir: str = None,
+                 mode: str = None, remote_url: str = None, branch: str = None):
+        self.app_dir = Path(app_dir)
+        self.claude_dir = self.app_dir / ".claude"
+        self.session_id_file = self.app_dir / ".claude_session_id"
+        self.store_dir = Path(store_dir or os.getenv("SESSION_STORE_DIR", "/home/user/session_store"))
+        self.mode = mode or os.getenv("SESSION_STORE_MODE", "branch")
+        if self.mode not in self.MODES:
+            raise ValueError(f"Unknown SESSION_STORE_MODE '{self.mode}' (expected one of {', '.join(self.MODES)})")
+        self.remote_url = remote_url or os.getenv("GIT_PUSH_URL")
+        self.branch = branch or os.getenv("SESSION_STORE_BRANCH", "lilo-sessions")
+
+    # ================================================================
+    # Chunk store
+    # ================================================================
+
+    def _object_path(self, digest: str) -> Path:
+        return self.store_dir / "objects" / digest[:2] / f"{digest}.gz"
+
+    def _put_chunk(self, data: bytes) -> tuple:
+        """Store a chunk, returns (digest, was_new)."""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if path.exists():
+            return digest, False
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        # mtime=0 keeps the gzip bytes deterministic for identical chunks
+        with open(tmp, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=9, mtime=0) as gz:
+            gz.write(data)
+        tmp.replace(path)
+        return digest, True
+
+    def _get_chunk(self, digest: str) -> bytes:
+        with gzip.open(self._object_path(digest), "rb") as f:
+            return f.read()
+
+    @staticmethod
+    def _compact_line(line: str) -> str:
+        """Re-serialize a JSONL line without whitespace; non-JSON lines pass through."""
+        try:
+            return json.dumps(json.loads(line), separators=(",", ":"), ensure_ascii=False)
+        except ValueError:
+            return line.rstrip("\r\n")
+
+    def _chunk_file(self, path: Path) -> list:
+        """Split a file into byte chunks (compacted line groups for transcripts)."""
+        if path.suffix != ".jsonl":
+            return [path.read_bytes()]
+        lines = []
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if line.strip():
+                    lines.append(self._compact_line(line))
+        return [
+            ("\n".join(lines[i:i + self.CHUNK_LINES]) + "\n").encode("utf-8")
+            for i in range(0, len(lines), self.CHUNK_LINES)
+        ]
+
+    def _iter_session_files(self):
+        if not self.claude_dir.exists():
+            return
+        for path in sorted(self.claude_dir.rglob("*")):
+            rel = path.relative_to(self.claude_dir)
+            if not path.is_file() or rel.parts[0] in self.EXCLUDED_DIRS:
+                continue
+            yield rel, path
+
+    # ================================================================
+    # Pack / unpack
+    # ================================================================
+
+    def pack(self) -> dict:
+        """Write all session files into the store, returns size statistics."""
+        stats = {"files": 0, "chunks": 0, "new_chunks": 0, "raw_bytes": 0, "new_bytes": 0}
+        manifest = {"version": 1, "session_id": None, "files": {}}
+
+        if self.session_id_file.exists():
+            manifest["session_id"] = self.session_id_file.read_text().strip()
+
+        for rel, path in self._iter_session_files():
+            stats["files"] += 1
+            stats["raw_bytes"] += path.stat().st_size
+            digests = []
+            for chunk in self._chunk_file(path):
+                digest, is_new = self._put_chunk(chunk)
+                digests.append(digest)
+                stats["chunks"] += 1
+                if is_new:
+                    stats["new_chunks"] += 1
+                    stats["new_bytes"] += self._object_path(digest).stat().st_size
+            manifest["files"][rel.as_posix()] = digests
+
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.store_dir / "manifest.json", "w") as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+        self._prune(manifest)
+        return stats
+
+    def _prune(self, manifest: dict):
+        """Drop chunks no longer referenced (e.g. the previous tail chunk of a transcript)."""
+        referenced = {d for digests in manifest["files"].values() for d in digests}
+        for path in (self.store_dir / "objects").glob("*/*.gz"):
+            if path.name[:-3] not in referenced:
+                path.unlink()
+
+    def unpack(self) -> int:
+        """Rebuild .claude (and .claude_session_id) from the store, returns file count."""
+        manifest_path = self.store_dir / "manifest.json"
+        if not manifest_path.exists():
+            return 0
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+        for rel, digests in manifest.get("files", {}).items():
+            target = self.claude_dir / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with open(target, "wb") as out:
+                for digest in digests:
+                    out.write(self._get_chunk(digest))
+
+        if manifest.get("session_id") and not self.session_id_file.exists():
+            self.session_id_file.write_text(manifest["session_id"])
+        return len(manifest.get("files", {}))
+
+    # ================================================================
+    # Orphan branch sync
+    # ================================================================
+
+    def _git(self, *args, check: bool = True) -> subprocess.CompletedProcess:
+        result = subprocess.run(["git", *args], cwd=self.store_dir, capture_output=True, text=True)
+        if check and result.returncode != 0:
+            raise Exception(f"Git Error (git {' '.join(args)}): {result.stderr}")
+        return result
+
+    def _checkout_store(self):
+        """Clone the session branch into store_dir, or start a fresh orphan branch."""
+        if (self.store_dir / ".git").exists():
+            return
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        cloned = subprocess.run(
+            ["git", "clone", "--depth", "1", "--branch", self.branch, self.remote_url, str(self.store_dir)],
+            capture_output=True, text=True,
+        ).returncode == 0
+        if not cloned:
+            self._git("init", "-q")
+            self._git("checkout", "-q", "--orphan", self.branch)
+            self._git("remote", "add", "origin", self.remote_url)
+
+    def _push_store(self) -> bool:
+        self._git("add", "-A")
+        if not self._git("status", "--porcelain").stdout.strip():
+            return False
+        self._git("-c", "user.name=Lilo", "-c", "user.email=lilo@livinglogic.de",
+                  "commit", "-q", "-m", "Lilo Session Sync")
+        self._git("push", "-q", "origin", f"HEAD:refs/heads/{self.branch}")
+        return True
+
+    # ================================================================
+    # Public entry points (deploy / resume)
+    # ================================================================
+
+    def save(self) -> dict:
+        """Pack the current session and, in branch mode, push it to the session branch."""
+        if self.mode == "branch":
+            if not self.remote_url:
+                raise ValueError("GIT_PUSH_URL not set — cannot push session branch")
+            self._checkout_store()
+        stats = self.pack()
+        stats["pushed"] = self._push_store() if self.mode == "branch" else False
+        print(f"[SESSION] 💾 {stats['files']} files, {stats['new_chunks']}/{stats['chunks']} new chunks "
+              f"({stats['new_bytes'] / 1024:.1f} KB stored of {stats['raw_bytes'] / 1024:.1f} KB raw)")
+        return stats
+
+    def restore(self) -> int:
+        """Restore .claude for a resumed session unless it is already present."""
+        if self.mode == "inline" or self.claude_dir.exists():
+            return 0
+        if self.mode == "branch":
+            if not self.remote_url:
+                return 0
+            self._checkout_store()
+        count = self.unpack()
+        if count:
+            print(f"[SESSION] ✅ {count} session files restored from {self.mode} store")
+        return count
@@ -0,0 +1,210 @@
+import asyncio
+import json
+import re
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+API_URL = "https://my.living-apps.de/rest"
+STATE_FILE = "_snapshot_state.json"
+# Same semantics as extractRecordId() in the generated service
+RECORD_ID_RE = re.compile(r"([a-f0-9]{24})$", re.IGNORECASE)
+
+
+def extract_record_id(url):
+    if not url:
+        return None
+    match = RECORD_ID_RE.search(str(url))
+    return match.group(1) if match else None
+
+
+class AppSnapshot:
+    """Converts one app's records into flat rows and writes NDJSON + a columnar file."""
+
+    def __init__(self, identifier: str, app_data: dict):
+        self.identifier = identifier
+        self.app_id = app_data["app_id"]
+        self.controls = app_data.get("controls", {})
+
+    def to_row(self, record_id: str, record: dict) -> dict:
+        row = {
+            "record_id": record_id,
+            "createdat": record.get("createdat"),
+            "updatedat": record.get("updatedat"),
+        }
+        fields = record.get("fields") or {}
+        for key, ctrl in self.controls.items():
+            value = fields.get(key)
+            fulltype = ctrl.get("fulltype", "")
+            if "applookup" in fulltype:
+                if isinstance(value, list):
+                    value = [extract_record_id(v) for v in value]
+                else:
+                    value = extract_record_id(value)
+            row[key] = value
+        return row
+
+    def column_types(self) -> dict:
+        """Column -> logical type derived from each control's fulltype."""
+        types = {"record_id": "string", "createdat": "timestamp", "updatedat": "timestamp"}
+        for key, ctrl in self.controls.items():
+            fulltype = ctrl.get("fulltype", "")
+            if fulltype.startswith("multiple"):
+                types[key] = "list<string>"
+            elif fulltype == "number":
+                types[key] = "float64"
+            elif fulltype == "bool":
+                types[key] = "bool"
+            elif fulltype == "date/date":
+                types[key] = "date"
+            elif fulltype.startswith("date"):
+                types[key] = "timestamp"
+            else:
+                types[key] = "string"
+        return types
+
+    def write_ndjson(self, path: Path, rows: list):
+        with open(path, "w", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+    def write_columnar(self, out_dir: Path, rows: list) -> Path:
+        """Parquet when pyarrow is installed, otherwise a column-oriented JSON file."""
+        types = self.column_types()
+        columns = {name: [row.get(name) for row in rows] for name in types}
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            path = out_dir / f"{self.identifier}.columns.json"
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"schema": types, "row_count": len(rows), "columns": columns}, f, ensure_ascii=False)
+            return path
+
+        arrow_types = {
+            "string": pa.string(),
+            "float64": pa.float64(),
+            "bool": pa.bool_(),
+            "date": pa.date32(),
+            "timestamp": pa.timestamp("s"),
+            "list<string>": pa.list_(pa.string()),
+        }
+        arrays = {}
+        for name, logical in types.items():
+            values = columns[name]
+            if logical in ("date", "timestamp"):
+                values = [_parse_datetime(v, logical) for v in values]
+            elif logical == "float64":
+                values = [float(v) if v not in (None, "") else None for v in values]
+            arrays[name] = pa.array(values, type=arrow_types[logical])
+        path = out_dir / f"{self.identifier}.parquet"
+        pq.write_table(pa.table(arrays), path)
+        return path
+
+
+def _parse_datetime(value, logical: str):
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed.date() if logical == "date" else parsed.replace(tzinfo=None)
+
+
+def _read_ndjson(path: Path) -> dict:
+    rows = {}
+    if path.exists():
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    row = json.loads(line)
+                    rows[row["record_id"]] = row
+    return rows
+
+
+async def snapshot_appgroup(metadata: dict, api_key: str, out_dir: str,
+                            incremental: bool = False, concurrency: int = 8) -> dict:
+    """
+    Fetch every app's records concurrently and write a local snapshot.
+
+    Writes <out_dir>/<identifier>.ndjson and a typed columnar file per app.
+    With incremental=True only records whose updatedat (or createdat) is newer
+    than the previous snapshot are converted again; unchanged rows are reused
+    from the existing NDJSON and deleted records are dropped.
+    """
+    import httpx
+
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    state_path = out / STATE_FILE
+    state = {}
+    if incremental and state_path.exists():
+        with open(state_path) as f:
+            state = json.load(f)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    report = {"apps": {}, "incremental": incremental}
+    t_start = time.time()
+
+    async with httpx.AsyncClient(
+        headers={"X-API-Key": api_key, "Accept": "application/json"},
+        timeout=120,
+        limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+    ) as client:
+
+        async def snapshot_app(identifier: str, app_data: dict):
+            app = AppSnapshot(identifier, app_data)
+            async with semaphore:
+                t_app = time.time()
+                resp = await client.get(f"{API_URL}/apps/{app.app_id}/records")
+                resp.raise_for_status()
+                records = resp.json() or {}
+
+            ndjson_path = out / f"{identifier}.ndjson"
+            since = state.get(identifier, {}).get("max_updatedat") if incremental else None
+            previous = _read_ndjson(ndjson_path) if since else {}
+
+            rows, changed = [], 0
+            max_updated = since or ""
+            for record_id, record in records.items():
+                stamp = record.get("updatedat") or record.get("createdat") or ""
+                max_updated = max(max_updated, stamp)
+                if since and record_id in previous and stamp <= since:
+                    rows.append(previous[record_id])
+                    continue
+                rows.append(app.to_row(record_id, record))
+                changed += 1
+
+            app.write_ndjson(ndjson_path, rows)
+            columnar_path = app.write_columnar(out, rows)
+            state[identifier] = {
+                "max_updatedat": max_updated or None,
+                "snapshot_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "row_count": len(rows),
+            }
+            report["apps"][identifier] = {
+                "rows": len(rows),
+                "changed": changed,
+                "deleted": len(set(previous) - set(records)),
+                "files": [ndjson_path.name, columnar_path.name],
+                "seconds": round(time.time() - t_app, 2),
+            }
+            print(f"[SNAPSHOT] ✅ {identifier}: {len(rows)} rows ({changed} changed)")
+
+        apps = metadata.get("apps", {})
+        results = await asyncio.gather(
+            *(snapshot_app(identifier, app_data) for identifier, app_data in apps.items()),
+            return_exceptions=True,
+        )
+        for identifier, result in zip(apps, results):
+            if isinstance(result, Exception):
+                report["apps"][identifier] = {"error": str(result)[:300]}
+                print(f"[SNAPSHOT] ❌ {identifier}: {result}")
+
+    with open(state_path, "w") as f:
+        json.dump(state, f, indent=2)
+    report["out_dir"] = str(out)
+    report["seconds"] = round(time.time() - t_start, 2)
+    return report
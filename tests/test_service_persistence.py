@@ -0,0 +1,162 @@
+"""
+Runtime checks of the generated service: a page list loaded through iter<Entity>()
+must end up in the request cache and in the persisted IndexedDB store, and a list
+hydrated from IndexedDB is served stale, revalidated in the background and reported
+through onCacheRefresh() only when the server data changed.
+
+Transpiles the generated TypeScript with the project's `typescript` devDependency
+and runs it in node against a mocked fetch() and an in-memory IndexedDB.
+Skipped when node or node_modules/typescript is not available.
+"""
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from typescript_generator import TypeScriptGenerator
+
+ROOT = Path(__file__).resolve().parent.parent
+
+TRANSPILE_JS = r"""
+const fs = require('fs');
+const ts = require('typescript');
+for (const [src, out] of JSON.parse(process.argv[1])) {
+  const code = fs.readFileSync(src, 'utf8').replace(/import\.meta\.env\.\w+/g, 'undefined');
+  const js = ts.transpileModule(code, {
+    compilerOptions: { module: ts.ModuleKind.ESNext, target: ts.ScriptTarget.ES2022 },
+  }).outputText;
+  fs.writeFileSync(out, js.replace("'@/types/app'", "'./app.mjs'"));
+}
+"""
+
+HARNESS_JS = r"""
+const stored = new Map();
+const request = fn => {
+  const req = {};
+  setTimeout(() => { req.result = fn(); req.onsuccess?.(); });
+  return req;
+};
+const store = {
+  getAllKeys: () => request(() => [...stored.keys()]),
+  getAll: () => request(() => [...stored.values()]),
+  put: (value, key) => request(() => { stored.set(key, structuredClone(value)); }),
+  clear: () => request(() => stored.clear()),
+};
+const db = { transaction: () => ({ objectStore: () => store }), createObjectStore() {}, close() {} };
+globalThis.indexedDB = {
+  open() {
+    const req = {};
+    setTimeout(() => { req.result = db; req.onupgradeneeded?.(); req.onsuccess?.(); });
+    return req;
+  },
+};
+
+// index of persisted keys (without it the service does not wait for IndexedDB)
+globalThis.localStorage = {
+  getItem: key => (key.endsWith(':keys') ? JSON.stringify([...stored.keys()]) : null),
+  setItem() {},
+};
+
+const [endpoint, total, seed] = JSON.parse(process.argv[2]);
+const makeRecords = (count, updatedat) => {
+  const records = {};
+  for (let i = 0; i < count; i++) {
+    records[i.toString(16).padStart(24, '0')] = { createdat: 'c', updatedat, fields: {} };
+  }
+  return records;
+};
+const records = makeRecords(total, 'u');
+if (seed) stored.set(endpoint, { schema: seed.schema, savedAt: 0, data: makeRecords(seed.total, seed.updatedat) });
+let fetches = 0;
+globalThis.fetch = async () => {
+  fetches++;
+  const body = new TextEncoder().encode(JSON.stringify(records));
+  return new Response(new ReadableStream({
+    start(controller) {
+      for (let i = 0; i < body.length; i += 1000) controller.enqueue(body.slice(i, i + 1000));
+      controller.close();
+    },
+  }));
+};
+
+const { LivingAppsService, onCacheRefresh } = await import('./service.mjs');
+const refreshed = [];
+onCacheRefresh(appId => refreshed.push(appId));
+const method = Object.getOwnPropertyNames(LivingAppsService).find(name => name.startsWith('iter'));
+const load = async () => {
+  let count = 0;
+  for await (const chunk of LivingAppsService[method]()) count += chunk.length;
+  return count;
+};
+const pages = await Promise.all([0, 1].map(load));
+await new Promise(resolve => setTimeout(resolve, 20));
+console.log(JSON.stringify({
+  pages,
+  reloaded: await load(),
+  fetches,
+  refreshed,
+  persisted: Object.keys(stored.get(endpoint)?.data ?? {}).length,
+}));
+"""
+
+
+def _node_with_typescript():
+    node = shutil.which("node")
+    if not node:
+        pytest.skip("node not installed")
+    probe = subprocess.run([node, "-e", "require('typescript')"], cwd=ROOT, capture_output=True)
+    if probe.returncode:
+        pytest.skip("node_modules/typescript not installed (npm install)")
+    return node
+
+
+def _run_harness(tmp_path, seed=None):
+    """
+    Generate and transpile the service, then load the first app's list twice in parallel and
+    once more afterwards. seed = (count, updatedat) of a list already stored in IndexedDB.
+    """
+    node = _node_with_typescript()
+    metadata = json.loads((ROOT / "app_metadata.json").read_text(encoding="utf-8"))
+    generator = TypeScriptGenerator(metadata)
+    (tmp_path / "app.ts").write_text(generator.generate_types(), encoding="utf-8")
+    (tmp_path / "service.ts").write_text(generator.generate_service(), encoding="utf-8")
+    files = [[str(tmp_path / f"{name}.ts"), str(tmp_path / f"{name}.mjs")] for name in ("app", "service")]
+    subprocess.run([node, "-e", TRANSPILE_JS, json.dumps(files)], cwd=ROOT, check=True)
+
+    # iter<Entity>() of the first app in the generated class
+    app_id = next(iter(metadata["apps"].values()))["app_id"]
+    endpoint = f"/apps/{app_id}/records"
+    seeded = {"schema": generator.schema.hash, "total": seed[0], "updatedat": seed[1]} if seed else None
+    (tmp_path / "harness.mjs").write_text(HARNESS_JS, encoding="utf-8")
+    result = subprocess.run([node, "harness.mjs", json.dumps([endpoint, 250, seeded])],
+                            cwd=tmp_path, capture_output=True, text=True, check=True)
+    return app_id, json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_page_list_is_persisted(tmp_path):
+    _, stats = _run_harness(tmp_path)
+
+    assert stats["pages"] == [250, 250]
+    assert stats["fetches"] == 1  # both mounts share one streamed request
+    assert stats["persisted"] == 250
+    assert stats["refreshed"] == []  # nothing was shown before the first load
+
+
+def test_stale_persisted_list_is_refreshed(tmp_path):
+    app_id, stats = _run_harness(tmp_path, seed=(200, "old"))
+
+    assert stats["pages"] == [200, 200]  # served from IndexedDB without waiting for the server
+    assert stats["fetches"] == 1  # one background revalidation
+    assert stats["refreshed"] == [app_id]
+    assert stats["reloaded"] == 250  # the listener's reload gets the server list
+    assert stats["persisted"] == 250
+
+
+def test_unchanged_persisted_list_is_not_reported(tmp_path):
+    _, stats = _run_harness(tmp_path, seed=(250, "u"))
+
+    assert stats["pages"] == [250, 250]
+    assert stats["fetches"] == 1
+    assert stats["refreshed"] == []
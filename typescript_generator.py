@@ -1,16 +1,36 @@
-import re
+from naming import to_pascal_case
+from schema import Schema
+
+try:
+    from profiling import profiled
+except ImportError:  # generator copied without profiling.py
+    def profiled(name=None):
+        return lambda func: func
+
 
 class TypeScriptGenerator:
-    def __init__(self, metadata: dict):
+    DEFAULT_API_BASE_URL = "https://my.living-apps.de/rest"
+    # Default-TTL des Request-Caches im Service (pro App per setCacheTtl() änderbar)
+    CACHE_TTL_MS = 30_000
+    # Parallele Requests bei createMany/updateMany/deleteMany (pro Aufruf per options.concurrency änderbar)
+    BULK_CONCURRENCY = 6
+    # Bis zu so vielen referenzierten IDs werden Applookup-Ziele einzeln geladen, darüber die schlanke Gesamtliste
+    RESOLVE_BY_ID_LIMIT = 50
+
+    def __init__(self, metadata: dict, api_base_url: str = None, modular: bool = False):
         self.metadata = metadata
+        # modular=True: ein Types- und ein Service-Modul pro Entity + Barrels (app.ts, livingAppsService.ts)
+        self.modular = modular
         self.apps = metadata["apps"]
+        # Default für API_BASE_URL im Service (zur Laufzeit per VITE_LIVINGAPPS_API_BASE überschreibbar)
+        self.api_base_url = api_base_url or self.DEFAULT_API_BASE_URL
+        # Schema + Namen werden einmal pro Metadata-Load berechnet (geteilt mit ReactComponentGenerator)
+        self.schema = Schema.for_metadata(metadata)
+        self.names = self.schema.names
 
     def _to_pascal_case(self, text: str) -> str:
-        """Macht aus 'workout_logs' -> 'WorkoutLogs'"""
-        # Umlaute ersetzen
-        text = text.replace("ä", "ae").replace("ö", "oe").replace("ü", "ue").replace("ß", "ss")
-        # Alles was kein Buchstabe/Zahl ist zu Space, dann Capitalize
-        return "".join(word.capitalize() for word in re.sub(r"[^a-zA-Z0-9]", " ", text).split())
+        """Macht aus 'workout_logs' -> 'WorkoutLogs' (siehe naming.py)"""
+        return to_pascal_case(text)
 
     def _map_type(self, control: dict) -> str:
         """Wandelt Living Apps Typen in TypeScript Typen um"""
@@ -22,95 +42,135 @@ class TypeScriptGenerator:
             return "boolean"
         elif ftype == "date/date" or ftype == "date/datetimeminute":
             return "string" # API liefert ISO Strings
-        elif ftype == "lookup/select" and "lookup_data" in control:
-            # Wir generieren einen exakten Union Type: 'option1' | 'option2'
-            options = [f"'{k}'" for k in control["lookup_data"].keys()]
-            if not options: return "string"
-            return " | ".join(options)
+        # lookup/select mit Optionen bekommt einen benannten Typ (siehe _iter_lookup_types)
 
         # Fallback für Text, Files, AppLookups (die sind URLs)
         return "string"
 
+    @staticmethod
+    def _ts_string(value) -> str:
+        """Python-Wert als TypeScript String-Literal in einfachen Quotes"""
+        return "'" + str(value).replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+    def _iter_lookup_types(self, app_key: str):
+        """
+        Pro lookup/select-Feld: KEYS-Array (as const), abgeleiteter Key-Typ und Label-Map.
+        Felder und Dialog-Casts referenzieren nur den Typnamen statt die Optionen zu wiederholen.
+        """
+        for ctrl in self.schema[app_key].lookup_controls:
+            keys = ", ".join(self._ts_string(k) for k in ctrl.lookup_data)
+            yield f"export const {ctrl.lookup_keys_const} = [{keys}] as const;"
+            yield f"export type {ctrl.lookup_type} = typeof {ctrl.lookup_keys_const}[number];"
+            yield f"export const {ctrl.lookup_labels_const}: Record<{ctrl.lookup_type}, string> = {{"
+            for key, label in ctrl.lookup_data.items():
+                yield f"  {self._ts_string(key)}: {self._ts_string(label)},"
+            yield "};"
+            yield ""
+
+    def _iter_interface(self, app_key: str):
+        """Lookup-Typen + Interface einer App (gemeinsam für app.ts und die Entity-Module)"""
+        interface_name = self.names[app_key].pascal
+
+        yield from self._iter_lookup_types(app_key)
+        yield f"export interface {interface_name} {{"
+        yield "  record_id: string;"
+        yield "  createdat: string;"
+        yield "  updatedat: string | null;"
+        yield "  fields: {"
+
+        # Alle Controls (Felder) durchgehen — Lookup-Ziele sind im Schema bereits aufgelöst
+        for ctrl_key, ctrl in self.schema[app_key].controls.items():
+            ts_type = ctrl.lookup_type or self._map_type(ctrl.raw)
+
+            # Smart Comment Logic
+            comment = ""
+            fulltype = ctrl.fulltype
+
+            if ctrl.is_date:
+                comment = " // Format: YYYY-MM-DD oder ISO String"
+
+            elif fulltype == "applookup/select" and "lookup_app" in ctrl.raw:
+                target_name = self.names[ctrl.target].pascal if ctrl.target else "UnknownApp"
+                comment = f" // applookup -> URL zu '{target_name}' Record"
+
+            # Zeile hinzufügen (immer optional mit ?)
+            yield f"    {ctrl_key}?: {ts_type};{comment}"
+
+        yield "  };"
+        yield "}"
+        yield ""
+
+        # Schlanke Variante für Applookup-Listen: nur record_id + Anzeigefeld
+        lookup_fields = " | ".join(f"'{f}'" for f in self.schema[app_key].lookup_fields) or "never"
+        yield f"export interface {self.names[app_key].lookup_type} {{"
+        yield "  record_id: string;"
+        yield f"  fields: Pick<{interface_name}['fields'], {lookup_fields}>;"
+        yield "}"
+        yield ""
+
+    @profiled("generate_types")
     def generate_types(self) -> str:
         """Erzeugt src/types/app.ts mit Smart Comments für App-Lookups"""
-        lines = ["// AUTOMATICALLY GENERATED TYPES - DO NOT EDIT", ""]
+        return "\n".join(self.iter_types())
 
-        # 1. Helper Map aufbauen: App ID -> App Name
-        app_id_to_name = {}
-        for key, data in self.apps.items():
-            # Name bereinigen (PascalCase für Kommentar)
-            clean_name = self._to_pascal_case(key)
-            app_id_to_name[data["app_id"]] = clean_name
+    def iter_types(self):
+        """Streaming-Variante von generate_types: liefert src/types/app.ts Zeile für Zeile"""
+        yield "// AUTOMATICALLY GENERATED TYPES - DO NOT EDIT"
+        yield ""
 
-        # 2. Interfaces für jede App generieren
-        for app_key, app_data in self.apps.items():
-            interface_name = self._to_pascal_case(app_key)
-
-            lines.append(f"export interface {interface_name} {{")
-            lines.append("  record_id: string;")
-            lines.append("  createdat: string;")
-            lines.append("  updatedat: string | null;")
-            lines.append("  fields: {")
-
-            # Alle Controls (Felder) durchgehen
-            for ctrl_key, ctrl_data in app_data["controls"].items():
-                ts_type = self._map_type(ctrl_data)
-
-                # Smart Comment Logic
-                comment = ""
-                fulltype = ctrl_data.get("fulltype", "")
-
-                if "date" in fulltype:
-                    comment = " // Format: YYYY-MM-DD oder ISO String"
-
-                elif fulltype == "applookup/select" and "lookup_app" in ctrl_data:
-                    # Versuche herauszufinden, auf welche App das zeigt
-                    try:
-                        target_id = ctrl_data["lookup_app"].split("/")[-1]
-                        target_name = app_id_to_name.get(target_id, "UnknownApp")
-                        comment = f" // applookup -> URL zu '{target_name}' Record"
-                    except:
-                        comment = " // applookup -> URL zum Record"
-
-                # Zeile hinzufügen (immer optional mit ?)
-                lines.append(f"    {ctrl_key}?: {ts_type};{comment}")
-
-            lines.append("  };")
-            lines.append("}")
-            lines.append("")
-
-        # 3. App IDs Konstante exportieren
-        lines.append("export const APP_IDS = {")
+        # 1. Interfaces für jede App generieren
+        for app_key in self.apps:
+            yield from self._iter_interface(app_key)
+
+        # 2. App IDs Konstante exportieren
+        yield "export const APP_IDS = {"
         for app_key, app_data in self.apps.items():
             # Konstanten-Name: WORKOUT_LOGS statt WorkoutLogs
-            const_name = app_key.upper().replace("-", "_").replace("&", "").replace(" ", "_")
-            # Doppelte Underscores bereinigen
-            const_name = re.sub(r"_+", "_", const_name)
-
-            lines.append(f"  {const_name}: '{app_data['app_id']}',")
-        lines.append("} as const;")
-        lines.append("")
+            const_name = self.names[app_key].const
+            yield f"  {const_name}: '{app_data['app_id']}',"
+        yield "} as const;"
+        yield ""
 
-        # 4. Helper Types für Create-Operationen (Omit record_id etc.)
-        lines.append("// Helper Types for creating new records")
+        # 3. Helper Types für Create-Operationen (Omit record_id etc.)
+        yield "// Helper Types for creating new records"
         for app_key in self.apps.keys():
-            interface_name = self._to_pascal_case(app_key)
-            lines.append(f"export type Create{interface_name} = {interface_name}['fields'];")
-
-        return "\n".join(lines)
+            interface_name = self.names[app_key].pascal
+            yield f"export type Create{interface_name} = {interface_name}['fields'];"
 
+    @profiled("generate_service")
     def generate_service(self) -> str:
         """Erzeugt src/services/livingAppsService.ts (Full Featured)"""
+        return "\n".join(self.iter_service())
+
+    def iter_service(self):
+        """Streaming-Variante von generate_service: liefert den Service Zeile für Zeile"""
 
         # Header & Helper Functions (Statisch)
-        lines = [
+        yield from [
             "// AUTOMATICALLY GENERATED SERVICE",
             "import { APP_IDS } from '@/types/app';",
             # Dynamische Imports der Typen
-            f"import type {{ {', '.join([self._to_pascal_case(k) for k in self.apps.keys()])} }} from '@/types/app';",
+            f"import type {{ {', '.join(name for k in self.apps for name in (self.names[k].pascal, self.names[k].lookup_type))} }} from '@/types/app';",
             "",
+        ]
+        yield from self._iter_service_helpers(export_call_api=False)
+        yield "export class LivingAppsService {"
+
+        # Methoden generieren
+        for app_key in self.apps:
+            yield f"  // --- {app_key.upper()} ---"
+            yield from self._iter_entity_methods(app_key, "  static async ", f"APP_IDS.{self.names[app_key].const}")
+            yield ""
+
+        yield "}"
+
+    def _iter_service_helpers(self, export_call_api: bool):
+        yield from [
             "// Base Configuration",
-            "const API_BASE_URL = 'https://my.living-apps.de/rest';",
+            "// VITE_LIVINGAPPS_API_BASE überschreibt die URL, z.B. '/api/rest' für den Vite Dev-Proxy",
+            f"const API_BASE_URL: string = import.meta.env.VITE_LIVINGAPPS_API_BASE ?? '{self.api_base_url}';",
+            "// Record-URLs in applookup-Feldern zeigen immer auf die echte API",
+            f"const RECORD_BASE_URL = '{self.DEFAULT_API_BASE_URL}';",
             "",
             "// --- HELPER FUNCTIONS ---",
             "export function extractRecordId(url: string | null | undefined): string | null {",
@@ -121,67 +181,962 @@ class TypeScriptGenerator:
             "}",
             "",
             "export function createRecordUrl(appId: string, recordId: string): string {",
-            "  return `https://my.living-apps.de/rest/apps/${appId}/records/${recordId}`;",
+            "  return `${RECORD_BASE_URL}/apps/${appId}/records/${recordId}`;",
+            "}",
+            "",
+            "export class ApiError extends Error {",
+            "  status: number;",
+            "  constructor(status: number, message: string) {",
+            "    super(message);",
+            "    this.status = status;",
+            "  }",
+            "}",
+            "",
+            "// 401: Sitzung abgelaufen oder abgemeldet — gecachte und gespeicherte Daten gehören niemandem mehr",
+            "async function ensureOk(response: Response) {",
+            "  if (response.ok) return;",
+            "  if (response.status === 401) {",
+            "    invalidateCache();",
+            "    clearPersistentCache().catch(() => { /* Persistenz ist optional */ });",
+            "  }",
+            "  throw new ApiError(response.status, await response.text());",
             "}",
             "",
-            "async function callApi(method: string, endpoint: string, data?: any) {",
+            "async function fetchApi(method: string, endpoint: string, data?: any, signal?: AbortSignal) {",
             "  const response = await fetch(`${API_BASE_URL}${endpoint}`, {",
             "    method,",
             "    headers: { 'Content-Type': 'application/json' },",
             "    credentials: 'include',  // Nutze Session Cookies für Auth",
-            "    body: data ? JSON.stringify(data) : undefined",
+            "    body: data ? JSON.stringify(data) : undefined,",
+            "    signal,",
             "  });",
-            "  if (!response.ok) throw new Error(await response.text());",
+            "  await ensureOk(response);",
             "  // DELETE returns often empty body or simple status",
             "  if (method === 'DELETE') return true;",
             "  return response.json();",
             "}",
             "",
-            "export class LivingAppsService {",
+        ]
+        yield from self._iter_request_cache()
+        yield from self._iter_persistence()
+        yield from self._iter_record_stream(export=export_call_api)
+        yield from self._iter_bulk_queue(export=export_call_api)
+        yield from [
+            "// Wendet eine erfolgreiche Einzel-Mutation auf eine gecachte {id: record}-Liste an (null = nicht möglich)",
+            "function patchRecordMap(records: Record<string, any>, method: string, endpoint: string, data: any, response: any): Record<string, any> | null {",
+            "  const recordId = endpoint.match(/\\/records\\/([a-f0-9]{24})$/i)?.[1];",
+            "  const now = new Date().toISOString();",
+            "  if (method === 'DELETE' && recordId) {",
+            "    const rest = { ...records };",
+            "    delete rest[recordId];",
+            "    return rest;",
+            "  }",
+            "  if (method === 'PATCH' && recordId && records[recordId]) {",
+            "    const current = records[recordId];",
+            "    return { ...records, [recordId]: { ...current, updatedat: response?.updatedat ?? now, fields: { ...current.fields, ...data?.fields } } };",
+            "  }",
+            "  if (method === 'POST' && !recordId) {",
+            "    const id = response?.id ?? extractRecordId(response?.url);",
+            "    if (id) return { ...records, [id]: { createdat: response?.createdat ?? now, updatedat: null, fields: data?.fields ?? {} } };",
+            "  }",
+            "  return null;",
+            "}",
+            "",
+            "// GETs laufen über den Cache, Mutationen invalidieren die betroffene App",
+            ("export " if export_call_api else "") + "async function callApi(method: string, endpoint: string, data?: any, signal?: AbortSignal) {",
+            "  if (method === 'GET') return cachedGet(endpoint, signal);",
+            "  const appId = appIdOf(endpoint);",
+            "  let response: any;",
+            "  try {",
+            "    response = await fetchApi(method, endpoint, data, signal);",
+            "  } catch (error) {",
+            "    // Auch bei Fehlern: der Server-Stand ist danach unklar",
+            "    invalidateCache(appId ?? undefined);",
+            "    throw error;",
+            "  }",
+            "  // Gecachte Liste der App lokal nachziehen statt neu laden (erst nach der Antwort lesen —",
+            "  // parallele Mutationen, z.B. aus runBulk, bauen so aufeinander auf)",
+            "  const listEndpoint = `/apps/${appId}/records`;",
+            "  const cached = appId ? responseCache.get(listEndpoint) : undefined;",
+            "  invalidateCache(appId ?? undefined);",
+            "  const patched = cached?.data !== undefined ? patchRecordMap(cached.data, method, endpoint, data, response) : null;",
+            "  if (patched) {",
+            "    responseCache.set(listEndpoint, { data: patched, fetchedAt: cached!.fetchedAt });",
+            "    persistResponse(listEndpoint, patched);",
+            "  }",
+            "  return response;",
+            "}",
+            "",
         ]
 
-        # Methoden generieren
-        for app_key, app_data in self.apps.items():
-            class_name = self._to_pascal_case(app_key) # Plural Interface Name (z.B. Workouts)
-            const_name = app_key.upper().replace("-", "_").replace("&", "").replace(" ", "_")
-            const_name = re.sub(r"_+", "_", const_name)
-
-            # Singular Name für Methoden (z.B. getWorkout statt getWorkoutsEntry)
-            # Einfache Heuristik: Wenn es auf 's' endet, weg damit. Sonst 'Entry' anhängen.
-            singular_name = class_name[:-1] if class_name.endswith("s") else f"{class_name}Entry"
-
-            lines.append(f"  // --- {app_key.upper()} ---")
-
-            # GET ALL
-            lines.append(f"  static async get{class_name}(): Promise<{class_name}[]> {{")
-            lines.append(f"    const data = await callApi('GET', `/apps/${{APP_IDS.{const_name}}}/records`);")
-            lines.append("    return Object.entries(data).map(([id, rec]: [string, any]) => ({")
-            lines.append("      record_id: id, ...rec")
-            lines.append("    }));")
-            lines.append("  }")
-
-            # GET ONE
-            lines.append(f"  static async get{singular_name}(id: string): Promise<{class_name} | undefined> {{")
-            lines.append(f"    const data = await callApi('GET', `/apps/${{APP_IDS.{const_name}}}/records/${{id}}`);")
-            lines.append("    return { record_id: data.id, ...data };")
-            lines.append("  }")
-
-            # CREATE
-            lines.append(f"  static async create{singular_name}(fields: {class_name}['fields']) {{")
-            lines.append(f"    return callApi('POST', `/apps/${{APP_IDS.{const_name}}}/records`, {{ fields }});")
-            lines.append("  }")
-
-            # UPDATE
-            lines.append(f"  static async update{singular_name}(id: string, fields: Partial<{class_name}['fields']>) {{")
-            lines.append(f"    return callApi('PATCH', `/apps/${{APP_IDS.{const_name}}}/records/${{id}}`, {{ fields }});")
-            lines.append("  }")
-
-            # DELETE
-            lines.append(f"  static async delete{singular_name}(id: string) {{")
-            lines.append(f"    return callApi('DELETE', `/apps/${{APP_IDS.{const_name}}}/records/${{id}}`);")
-            lines.append("  }")
-
-            lines.append("")
-
-        lines.append("}")
-        return "\n".join(lines)
\ No newline at end of file
+    def _iter_record_stream(self, export: bool):
+        """
+        streamRecords(): liest die {id: record}-Antwort inkrementell (ReadableStream) und liefert
+        [id, record]-Blöcke, sobald sie vollständig angekommen sind — erste Seite ohne auf den
+        ganzen Download zu warten. Blockgröße wächst von firstChunk bis chunkSize. Der Download
+        läuft als Request des Caches: die fertige Liste landet in responseCache und IndexedDB,
+        parallele Aufrufer teilen ihn, gecachte Listen werden ohne Request geliefert.
+        """
+        yield from [
+            "// --- STREAMING ---",
+            "// Zerlegt die {id: record}-Antwort beim Herunterladen in einzelne Einträge",
+            "class RecordMapParser {",
+            "  private buffer = '';",
+            "  private pos = 0;",
+            "  private depth = 0;",
+            "  private start = 0;",
+            "  private inString = false;",
+            "  private escaped = false;",
+            "",
+            "  feed(text: string): [string, any][] {",
+            "    const entries: [string, any][] = [];",
+            "    this.buffer += text;",
+            "    let consumed = 0;",
+            "    for (; this.pos < this.buffer.length; this.pos++) {",
+            "      const ch = this.buffer[this.pos];",
+            "      if (this.inString) {",
+            "        if (this.escaped) this.escaped = false;",
+            "        else if (ch === '\\\\') this.escaped = true;",
+            "        else if (ch === '\"') this.inString = false;",
+            "      } else if (ch === '\"') {",
+            "        this.inString = true;",
+            "      } else if (ch === '{' || ch === '[') {",
+            "        if (++this.depth === 1) this.start = this.pos + 1;",
+            "      } else if (ch === ',' && this.depth === 1) {",
+            "        this.start = this.pos + 1;",
+            "      } else if ((ch === '}' || ch === ']') && --this.depth === 1) {",
+            "        // Ein Record ist komplett: '<id>: {...}' parsen",
+            "        const entry = JSON.parse('{' + this.buffer.slice(this.start, this.pos + 1) + '}');",
+            "        entries.push(Object.entries(entry)[0] as [string, any]);",
+            "        consumed = this.start = this.pos + 1;",
+            "      }",
+            "    }",
+            "    // Verarbeiteten Teil einmal pro Aufruf abschneiden (nicht pro Record)",
+            "    this.buffer = this.buffer.slice(consumed);",
+            "    this.pos -= consumed;",
+            "    this.start -= consumed;",
+            "    return entries;",
+            "  }",
+            "}",
+            "",
+            "// Lädt eine Liste gestreamt: onEntries bekommt die Einträge, sobald sie angekommen sind",
+            "// (behalten wird nichts — was aufbewahrt wird, entscheidet der Aufrufer)",
+            "async function fetchRecordEntries(endpoint: string, signal: AbortSignal, onEntries: (entries: [string, any][]) => void): Promise<void> {",
+            "  const response = await fetch(`${API_BASE_URL}${endpoint}`, {",
+            "    headers: { 'Content-Type': 'application/json' },",
+            "    credentials: 'include',",
+            "    signal,",
+            "  });",
+            "  await ensureOk(response);",
+            "  if (!response.body) {",
+            "    onEntries(Object.entries(await response.json()));",
+            "    return;",
+            "  }",
+            "  const reader = response.body.getReader();",
+            "  const decoder = new TextDecoder();",
+            "  const parser = new RecordMapParser();",
+            "  try {",
+            "    for (;;) {",
+            "      const { done, value } = await reader.read();",
+            "      if (done) break;",
+            "      const entries = parser.feed(decoder.decode(value, { stream: true }));",
+            "      if (entries.length) onEntries(entries);",
+            "    }",
+            "  } finally {",
+            "    reader.cancel().catch(() => {});",
+            "  }",
+            "}",
+            "",
+            ("export " if export else "") + "async function* streamRecords(endpoint: string, chunkSize = 1000, firstChunk = 100, signal?: AbortSignal): AsyncGenerator<[string, any][]> {",
+            "  let size = Math.min(firstChunk, chunkSize);",
+            "  await hydrated(endpoint);",
+            "  const entry = responseCache.get(endpoint);",
+            "  if (entry?.data !== undefined || entry?.pending) {",
+            "    // Im Cache (auch aus IndexedDB, veraltete werden im Hintergrund abgeglichen) oder schon",
+            "    // unterwegs (z.B. zweite Seite, Dropdown): denselben Request mitbenutzen",
+            "    const entries = Object.entries(await cachedGet(endpoint, signal));",
+            "    for (let i = 0; i < entries.length; i += size, size = Math.min(size * 2, chunkSize)) {",
+            "      signal?.throwIfAborted();",
+            "      yield entries.slice(i, i + size);",
+            "    }",
+            "    return;",
+            "  }",
+            "",
+            "  // Eigener Request über den Cache (Dedupe, Generation, IndexedDB, onCacheRefresh) —",
+            "  // die Einträge kommen schon während des Downloads hier an",
+            "  let arrived: [string, any][] = [];",
+            "  let wake: (() => void) | null = null;",
+            "  revalidate(responseCache, endpoint, async requestSignal => {",
+            "    const records: Record<string, any> = {};",
+            "    await fetchRecordEntries(endpoint, requestSignal, entries => {",
+            "      for (const [id, record] of entries) records[id] = record;",
+            "      arrived = arrived.concat(entries);",
+            "      wake?.();",
+            "    });",
+            "    return records;",
+            "  }).catch(() => { /* Fehler bekommt der Aufrufer über joinPending */ });",
+            "  // Abbruch nur über das Signal des Aufrufers (der geteilte Request endet erst, wenn kein",
+            "  // anderer Aufrufer mehr wartet). Hört der Aufrufer vorzeitig auf (z.B. nach einer Seite),",
+            "  // lädt die Liste zu Ende in den Cache — weitere Seiten kommen dann ohne Request.",
+            "  let settled = false;",
+            "  let failed = false;",
+            "  let failure: unknown;",
+            "  joinPending(responseCache, endpoint, responseCache.get(endpoint)!, signal).then(",
+            "    () => { settled = true; wake?.(); },",
+            "    error => { settled = failed = true; failure = error; wake?.(); },",
+            "  );",
+            "  for (;;) {",
+            "    while (arrived.length >= size) {",
+            "      const chunk = arrived.slice(0, size);",
+            "      arrived = arrived.slice(size);",
+            "      size = Math.min(size * 2, chunkSize);",
+            "      yield chunk;",
+            "    }",
+            "    if (settled) break;",
+            "    await new Promise<void>(resolve => { wake = resolve; });",
+            "    wake = null;",
+            "  }",
+            "  if (failed) throw failure;",
+            "  if (arrived.length) yield arrived;",
+            "}",
+            "",
+        ]
+        yield from self._iter_record_count(export)
+        yield from self._iter_record_projection(export)
+        yield from self._iter_record_resolver(export)
+
+    def _iter_record_count(self, export: bool):
+        """
+        countRecords(): Anzahl der Records einer App für KPI-Karten. Die REST-API hat keinen
+        Count-Endpoint — ist die Liste im Cache, wird sie gezählt, sonst zählt scanRecordCount()
+        die Einträge beim Herunterladen, ohne Records zu parsen oder zu behalten (gecacht über
+        cachedDerived, persistiert unter <endpoint>#count).
+        """
+        yield from [
+            "// --- COUNT ---",
+            "async function scanRecordCount(endpoint: string, signal: AbortSignal): Promise<number> {",
+            "  const response = await fetch(`${API_BASE_URL}${endpoint}`, {",
+            "    headers: { 'Content-Type': 'application/json' },",
+            "    credentials: 'include',",
+            "    signal,",
+            "  });",
+            "  await ensureOk(response);",
+            "  if (!response.body) return Object.keys(await response.json()).length;",
+            "  const reader = response.body.getReader();",
+            "  const decoder = new TextDecoder();",
+            "  let count = 0;",
+            "  let depth = 0;",
+            "  let inString = false;",
+            "  let escaped = false;",
+            "  for (;;) {",
+            "    const { done, value } = await reader.read();",
+            "    if (done) break;",
+            "    const text = decoder.decode(value, { stream: true });",
+            "    for (let i = 0; i < text.length; i++) {",
+            "      const ch = text[i];",
+            "      if (inString) {",
+            "        if (escaped) escaped = false;",
+            "        else if (ch === '\\\\') escaped = true;",
+            "        else if (ch === '\"') inString = false;",
+            "      } else if (ch === '\"') {",
+            "        inString = true;",
+            "      } else if (ch === '{' || ch === '[') {",
+            "        depth++;",
+            "      } else if ((ch === '}' || ch === ']') && --depth === 1) {",
+            "        count++;",
+            "      }",
+            "    }",
+            "  }",
+            "  return count;",
+            "}",
+            "",
+            ("export " if export else "") + "async function countRecords(endpoint: string, signal?: AbortSignal): Promise<number> {",
+            "  // Liste schon geladen oder unterwegs (z.B. durch eine Seite): zählen statt neu anfragen",
+            "  await hydrated(endpoint);",
+            "  const list = responseCache.get(endpoint);",
+            "  if (list?.data !== undefined || list?.pending) return Object.keys(await cachedGet(endpoint, signal)).length;",
+            "  return cachedDerived(`${endpoint}#count`, requestSignal => scanRecordCount(endpoint, requestSignal), signal);",
+            "}",
+            "",
+        ]
+
+    def _iter_record_projection(self, export: bool):
+        """
+        projectRecords(): Records mit nur den angegebenen Feldern (z.B. record_id + Anzeigefeld für
+        Applookup-Dropdowns). Die REST-API kennt keine Feldauswahl — die Antwort wird gestreamt und
+        jeder Record sofort auf die Felder reduziert; gecacht wird nur die schlanke Liste (derivedCache),
+        die volle Liste entsteht auf diesem Weg nie. Hat eine Seite die volle Liste schon geladen
+        (oder lädt sie gerade), wird daraus reduziert.
+        """
+        yield from [
+            "// --- PROJECTION ---",
+            "function pickFields(record: any, fields: string[]): Record<string, any> {",
+            "  const picked: Record<string, any> = {};",
+            "  for (const key of fields) {",
+            "    if (record.fields?.[key] !== undefined) picked[key] = record.fields[key];",
+            "  }",
+            "  return picked;",
+            "}",
+            "",
+            ("export " if export else "") + "async function projectRecords(endpoint: string, fields: string[], signal?: AbortSignal): Promise<{ record_id: string; fields: any }[]> {",
+            "  await hydrated(endpoint);",
+            "  const list = responseCache.get(endpoint);",
+            "  if (list?.data !== undefined || list?.pending) {",
+            "    const cached = await cachedGet(endpoint, signal);",
+            "    return Object.entries(cached).map(([id, rec]) => ({ record_id: id, fields: pickFields(rec, fields) }));",
+            "  }",
+            "  return cachedDerived(`${endpoint}#${fields.join(',')}`, async requestSignal => {",
+            "    const records: { record_id: string; fields: any }[] = [];",
+            "    await fetchRecordEntries(endpoint, requestSignal, entries => {",
+            "      for (const [id, rec] of entries) records.push({ record_id: id, fields: pickFields(rec, fields) });",
+            "    });",
+            "    return records;",
+            "  }, signal);",
+            "}",
+            "",
+        ]
+
+    def _iter_record_resolver(self, export: bool):
+        """
+        resolveRecords(): nur die referenzierten Records einer App (z.B. für Anzeigenamen in Tabellen).
+        Kein Multi-Get in der API — die IDs werden dedupliziert und über den Get-One-Endpoint mit
+        begrenzter Parallelität (runBulk) geladen, jeder Record im Request-Cache. Liegt die Liste schon
+        im Cache oder sind es mehr als RESOLVE_BY_ID_LIMIT IDs, wird aus der (schlanken) Liste gelesen.
+        """
+        yield from [
+            "// --- RESOLVER ---",
+            f"const RESOLVE_BY_ID_LIMIT = {self.RESOLVE_BY_ID_LIMIT};",
+            "",
+            ("export " if export else "") + "async function resolveRecords(appId: string, ids: string[], fields: string[], signal?: AbortSignal): Promise<{ record_id: string; fields: any }[]> {",
+            "  const unique = [...new Set(ids)];",
+            "  if (!unique.length) return [];",
+            "  const listEndpoint = `/apps/${appId}/records`;",
+            "  await hydrated(listEndpoint);",
+            "  const list = responseCache.get(listEndpoint);",
+            "  const slim = derivedCache.get(`${listEndpoint}#${fields.join(',')}`);",
+            "  const listed = list?.data !== undefined || list?.pending || slim?.data !== undefined || slim?.pending;",
+            "  if (!listed && unique.length <= RESOLVE_BY_ID_LIMIT) {",
+            "    const results = await runBulk(unique, (id, bulkSignal) => cachedGet(`${listEndpoint}/${id}`, bulkSignal), { signal, retries: 2 });",
+            "    // Gelöschte/unbekannte IDs (404) fehlen im Ergebnis",
+            "    return results",
+            "      .filter(result => result.ok && result.value)",
+            "      .map(result => ({ record_id: unique[result.index], fields: pickFields(result.value, fields) }));",
+            "  }",
+            "  const wanted = new Set(unique);",
+            "  const records = await projectRecords(listEndpoint, fields, signal);",
+            "  return records.filter((record: { record_id: string }) => wanted.has(record.record_id));",
+            "}",
+            "",
+        ]
+
+    def _iter_bulk_queue(self, export: bool):
+        """
+        runBulk(): begrenzte Parallelität für Massen-Mutationen (LivingApps hat keinen Bulk-Endpoint).
+        Ergebnis pro Eintrag in Eingabe-Reihenfolge; 429/5xx/Netzwerkfehler werden mit Backoff wiederholt.
+        """
+        yield from [
+            "// --- BULK ---",
+            "export interface BulkOptions {",
+            "  concurrency?: number;",
+            "  retries?: number;",
+            "  onProgress?: (done: number, total: number) => void;",
+            "  // Abbruch: laufende Requests werden abgebrochen, noch nicht gestartete als 'aborted' gemeldet",
+            "  signal?: AbortSignal;",
+            "}",
+            "",
+            "export interface BulkResult {",
+            "  index: number;",
+            "  ok: boolean;",
+            "  value?: any;",
+            "  error?: string;",
+            "}",
+            "",
+            "function isTransient(error: unknown): boolean {",
+            "  // fetch() wirft TypeError bei Netzwerkfehlern",
+            "  if (error instanceof ApiError) return error.status === 429 || error.status >= 500;",
+            "  return error instanceof TypeError;",
+            "}",
+            "",
+            ("export " if export else "") + "async function runBulk<T>(items: T[], worker: (item: T, signal?: AbortSignal) => Promise<any>, options: BulkOptions = {}): Promise<BulkResult[]> {",
+            f"  const {{ concurrency = {self.BULK_CONCURRENCY}, retries = 3, onProgress, signal }} = options;",
+            "  const results: BulkResult[] = new Array(items.length);",
+            "  let next = 0;",
+            "  let done = 0;",
+            "  async function lane() {",
+            "    while (next < items.length && !signal?.aborted) {",
+            "      const index = next++;",
+            "      for (let attempt = 0; ; attempt++) {",
+            "        try {",
+            "          results[index] = { index, ok: true, value: await worker(items[index], signal) };",
+            "          break;",
+            "        } catch (error) {",
+            "          if (attempt >= retries || signal?.aborted || !isTransient(error)) {",
+            "            results[index] = { index, ok: false, error: error instanceof Error ? error.message : String(error) };",
+            "            break;",
+            "          }",
+            "          await new Promise(resolve => setTimeout(resolve, 250 * 2 ** attempt));",
+            "        }",
+            "      }",
+            "      onProgress?.(++done, items.length);",
+            "    }",
+            "  }",
+            "  await Promise.all(Array.from({ length: Math.min(concurrency, items.length) }, lane));",
+            "  for (let index = next; index < items.length; index++) {",
+            "    results[index] = { index, ok: false, error: 'aborted' };",
+            "  }",
+            "  return results;",
+            "}",
+            "",
+        ]
+
+    def _iter_persistence(self):
+        """
+        IndexedDB unter dem Request-Cache: Listen-Antworten (mit updatedat je Record) und daraus
+        abgeleitete Ergebnisse (Anzahl, schlanke Lookup-Listen — je unter eigenem Key) werden pro App
+        gespeichert und beim Start als veraltete Cache-Einträge geladen — Seiten rendern sofort, der
+        Abgleich mit dem Server läuft über stale-while-revalidate. SCHEMA_HASH (Struktur der Metadaten)
+        verwirft den Bestand nach Schema-Änderungen. Die Datenbank ist pro Benutzer/API-Key getrennt
+        (setCacheScope); ein Index der gespeicherten Keys in localStorage erspart Apps ohne Bestand
+        das Warten auf IndexedDB.
+        """
+        yield from [
+            "// --- PERSISTENZ (IndexedDB) ---",
+            f"const SCHEMA_HASH = '{self.schema.hash}';",
+            "const PERSIST_DB = 'livingapps-cache';",
+            "const PERSIST_STORE = 'responses';",
+            "const SCOPE_STORAGE_KEY = 'livingapps-cache-scope';",
+            "// Länger wartet der erste Request nicht auf IndexedDB",
+            "const HYDRATION_TIMEOUT_MS = 250;",
+            "",
+            "function readStorage(key: string): string | null {",
+            "  try {",
+            "    return localStorage.getItem(key);",
+            "  } catch {",
+            "    return null;  // kein localStorage (Tests, gesperrte Cookies)",
+            "  }",
+            "}",
+            "",
+            "function writeStorage(key: string, value: string) {",
+            "  try {",
+            "    localStorage.setItem(key, value);",
+            "  } catch { /* ohne localStorage: Index fehlt, Persistenz funktioniert trotzdem */ }",
+            "}",
+            "",
+            "// Benutzer/API-Key nur als Hash im Datenbanknamen (FNV-1a)",
+            "function hashScope(value: string): string {",
+            "  let hash = 0x811c9dc5;",
+            "  for (let i = 0; i < value.length; i++) hash = Math.imul(hash ^ value.charCodeAt(i), 0x01000193);",
+            "  return (hash >>> 0).toString(16).padStart(8, '0');",
+            "}",
+            "",
+            "// Bestand pro Benutzer getrennt: ohne setCacheScope() gilt der zuletzt gesetzte (bzw. pro API-URL)",
+            "let cacheScope = readStorage(SCOPE_STORAGE_KEY) ?? hashScope(API_BASE_URL);",
+            "",
+            "function dbName(): string {",
+            "  return `${PERSIST_DB}-${cacheScope}`;",
+            "}",
+            "",
+            "// Keys, die in IndexedDB liegen — synchron lesbar, damit Apps ohne Bestand nicht auf hydrate() warten",
+            "function readPersistedKeys(): Set<string> {",
+            "  try {",
+            "    return new Set(JSON.parse(readStorage(`${dbName()}:keys`) ?? '[]'));",
+            "  } catch {",
+            "    return new Set();",
+            "  }",
+            "}",
+            "",
+            "let persistedKeys = readPersistedKeys();",
+            "",
+            "function writePersistedKeys() {",
+            "  writeStorage(`${dbName()}:keys`, JSON.stringify([...persistedKeys]));",
+            "}",
+            "",
+            "// Gespeichert werden volle Listen (Seiten) und daraus abgeleitete Ergebnisse unter eigenem Key",
+            "// (<endpoint>#count, <endpoint>#<felder>) — Anzahl und Dropdowns brauchen die volle Liste nicht",
+            "function isPersistedKey(key: string): boolean {",
+            "  return /^\\/apps\\/[a-f0-9]{24}\\/records(#.+)?$/i.test(key);",
+            "}",
+            "",
+            "function idbRequest<T>(request: IDBRequest<T>): Promise<T> {",
+            "  return new Promise((resolve, reject) => {",
+            "    request.onsuccess = () => resolve(request.result);",
+            "    request.onerror = () => reject(request.error);",
+            "  });",
+            "}",
+            "",
+            "let dbPromise: Promise<IDBDatabase | null> | null = null;",
+            "",
+            "function openDb(): Promise<IDBDatabase | null> {",
+            "  dbPromise ??= new Promise(resolve => {",
+            "    try {",
+            "      const request = indexedDB.open(dbName(), 1);",
+            "      request.onupgradeneeded = () => request.result.createObjectStore(PERSIST_STORE);",
+            "      request.onsuccess = () => resolve(request.result);",
+            "      request.onerror = () => resolve(null);",
+            "      request.onblocked = () => resolve(null);",
+            "    } catch {",
+            "      resolve(null);  // kein IndexedDB (privater Modus, Tests): nur In-Memory-Cache",
+            "    }",
+            "  });",
+            "  return dbPromise;",
+            "}",
+            "",
+            "async function hydrate(): Promise<void> {",
+            "  const db = await openDb();",
+            "  if (!db) return;",
+            "  const store = db.transaction(PERSIST_STORE, 'readonly').objectStore(PERSIST_STORE);",
+            "  const [keys, values] = await Promise.all([idbRequest(store.getAllKeys()), idbRequest(store.getAll())]);",
+            "  if (values.some(value => value.schema !== SCHEMA_HASH)) {",
+            "    // Metadaten haben sich geändert: gespeicherte Records passen nicht mehr zu den Typen",
+            "    db.transaction(PERSIST_STORE, 'readwrite').objectStore(PERSIST_STORE).clear();",
+            "    persistedKeys = new Set();",
+            "    writePersistedKeys();",
+            "    return;",
+            "  }",
+            "  // Index an den tatsächlichen Bestand angleichen (z.B. nach gelöschtem localStorage) —",
+            "  // in dieser Sitzung schon vom Server geladene Listen wurden inzwischen ebenfalls gespeichert",
+            "  persistedKeys = new Set(keys.map(String));",
+            "  for (const cache of [responseCache, derivedCache]) {",
+            "    for (const [key, entry] of cache) {",
+            "      if (entry.fetchedAt > 0 && isPersistedKey(key)) persistedKeys.add(key);",
+            "    }",
+            "  }",
+            "  writePersistedKeys();",
+            "  keys.forEach((key, i) => {",
+            "    // fetchedAt 0: sofort lieferbar, wird beim ersten Zugriff im Hintergrund neu geladen",
+            "    const cache = String(key).includes('#') ? derivedCache : responseCache;",
+            "    if (!cache.has(String(key))) cache.set(String(key), { data: values[i].data, fetchedAt: 0 });",
+            "  });",
+            "}",
+            "",
+            "function startHydration(): Promise<void> {",
+            "  return Promise.race([",
+            "    hydrate().catch(() => { /* defekter Bestand: ohne Persistenz weiter */ }),",
+            "    new Promise<void>(resolve => setTimeout(resolve, HYDRATION_TIMEOUT_MS)),",
+            "  ]);",
+            "}",
+            "",
+            "let hydration = startHydration();",
+            "",
+            "// Auf IndexedDB nur warten, wenn für die App etwas gespeichert ist — sonst sofort zum Server",
+            "function hydrated(key: string): Promise<void> {",
+            "  const appId = appIdOf(key);",
+            "  for (const persisted of persistedKeys) {",
+            "    if (appIdOf(persisted) === appId) return hydration;",
+            "  }",
+            "  return Promise.resolve();",
+            "}",
+            "",
+            "function persistResponse(endpoint: string, data: any) {",
+            "  if (!persistedKeys.has(endpoint)) {",
+            "    persistedKeys.add(endpoint);",
+            "    writePersistedKeys();",
+            "  }",
+            "  openDb().then(db => {",
+            "    db?.transaction(PERSIST_STORE, 'readwrite').objectStore(PERSIST_STORE)",
+            "      .put({ schema: SCHEMA_HASH, savedAt: Date.now(), data }, endpoint);",
+            "  }).catch(() => { /* Persistenz ist optional */ });",
+            "}",
+            "",
+            "/** Löscht die gespeicherten Listen (z.B. beim Logout, damit der nächste Benutzer sie nicht sieht). */",
+            "export async function clearPersistentCache() {",
+            "  persistedKeys = new Set();",
+            "  writePersistedKeys();",
+            "  const db = await openDb();",
+            "  if (db) await idbRequest(db.transaction(PERSIST_STORE, 'readwrite').objectStore(PERSIST_STORE).clear());",
+            "}",
+            "",
+            "/**",
+            " * Trennt den gespeicherten Bestand nach Benutzer bzw. API-Key, z.B. setCacheScope(user.id) nach dem Login.",
+            " * Wechselt er, werden Cache und Bestand des vorherigen Benutzers gelöscht und der neue geladen.",
+            " */",
+            "export async function setCacheScope(scope: string) {",
+            "  const next = hashScope(`${API_BASE_URL}|${scope}`);",
+            "  if (next === cacheScope) return;",
+            "  invalidateCache();",
+            "  await clearPersistentCache().catch(() => { /* Persistenz ist optional */ });",
+            "  dbPromise?.then(db => db?.close());",
+            "  dbPromise = null;",
+            "  cacheScope = next;",
+            "  writeStorage(SCOPE_STORAGE_KEY, next);",
+            "  persistedKeys = readPersistedKeys();",
+            "  hydration = startHydration();",
+            "}",
+            "",
+            "// Gleiche Record-IDs mit gleichem createdat/updatedat: keine Änderung seit dem letzten Stand",
+            "// (abgeleitete Ergebnisse — Anzahl, schlanke Listen — werden direkt verglichen)",
+            "function sameData(previous: any, next: any): boolean {",
+            "  if (typeof next !== 'object' || next === null || Array.isArray(next)) {",
+            "    return JSON.stringify(previous) === JSON.stringify(next);",
+            "  }",
+            "  return sameRecords(previous, next);",
+            "}",
+            "",
+            "function sameRecords(previous: Record<string, any>, next: Record<string, any>): boolean {",
+            "  const ids = Object.keys(next);",
+            "  if (Object.keys(previous).length !== ids.length) return false;",
+            "  return ids.every(id =>",
+            "    previous[id]?.updatedat === next[id]?.updatedat && previous[id]?.createdat === next[id]?.createdat",
+            "  );",
+            "}",
+            "",
+            "const refreshListeners = new Set<(appId: string) => void>();",
+            "",
+            "/** Meldet Listen, die im Hintergrund neue Server-Daten bekommen haben (z.B. nach dem Start aus IndexedDB). */",
+            "export function onCacheRefresh(listener: (appId: string) => void): () => void {",
+            "  refreshListeners.add(listener);",
+            "  return () => { refreshListeners.delete(listener); };",
+            "}",
+            "",
+        ]
+
+    def _iter_request_cache(self):
+        """
+        Cache vor callApi: In-Flight-Dedupe, TTL pro App, stale-while-revalidate.
+        Jede Invalidierung erhöht die Generation der App — Antworten, die während
+        einer Mutation unterwegs waren, landen dadurch nicht mehr im Cache.
+        Geteilte Requests werden erst abgebrochen, wenn alle wartenden Aufrufer abbrechen.
+        """
+        yield from [
+            "// --- REQUEST CACHE ---",
+            "// Gleiche GETs teilen sich einen Request; frische Antworten (< TTL) kommen sofort aus dem Cache,",
+            "// abgelaufene ebenfalls (stale-while-revalidate) und werden im Hintergrund neu geladen.",
+            f"const DEFAULT_CACHE_TTL_MS = {self.CACHE_TTL_MS};",
+            "const cacheTtlByApp = new Map<string, number>();",
+            "const cacheGeneration = new Map<string, number>();",
+            "let globalGeneration = 0;",
+            "interface CacheEntry {",
+            "  data?: any;",
+            "  fetchedAt: number;",
+            "  pending?: Promise<any>;",
+            "  controller?: AbortController;",
+            "  waiters?: number;  // Aufrufer mit AbortSignal, die noch auf pending warten",
+            "}",
+            "const responseCache = new Map<string, CacheEntry>();",
+            "// Aus einer Liste abgeleitete Ergebnisse (Anzahl, Projektionen) — Key beginnt mit dem Endpoint",
+            "const derivedCache = new Map<string, CacheEntry>();",
+            "",
+            "function appIdOf(endpoint: string): string | null {",
+            "  const match = endpoint.match(/^\\/apps\\/([a-f0-9]{24})/i);",
+            "  return match ? match[1] : null;",
+            "}",
+            "",
+            "/** TTL für eine App überschreiben, z.B. setCacheTtl(APP_IDS.KURSE, 5 * 60_000). 0 = immer neu laden. */",
+            "export function setCacheTtl(appId: string, ttlMs: number) {",
+            "  cacheTtlByApp.set(appId, ttlMs);",
+            "}",
+            "",
+            "/** Verwirft gecachte Antworten einer App (oder alle ohne appId). */",
+            "export function invalidateCache(appId?: string) {",
+            "  if (!appId) {",
+            "    responseCache.clear();",
+            "    derivedCache.clear();",
+            "    globalGeneration++;",
+            "    return;",
+            "  }",
+            "  for (const cache of [responseCache, derivedCache]) {",
+            "    for (const endpoint of [...cache.keys()]) {",
+            "      if (appIdOf(endpoint) === appId) cache.delete(endpoint);",
+            "    }",
+            "  }",
+            "  cacheGeneration.set(appId, (cacheGeneration.get(appId) ?? 0) + 1);",
+            "}",
+            "",
+            "function generationOf(appId: string): string {",
+            "  return `${globalGeneration}:${cacheGeneration.get(appId) ?? 0}`;",
+            "}",
+            "",
+            "type CacheMap = typeof responseCache;",
+            "type Loader = (signal: AbortSignal) => Promise<any>;",
+            "",
+            "function revalidate(cache: CacheMap, key: string, load: Loader): Promise<any> {",
+            "  const appId = appIdOf(key) ?? '';",
+            "  const generation = generationOf(appId);",
+            "  const entry = cache.get(key) ?? { fetchedAt: 0 };",
+            "  const controller = new AbortController();",
+            "  const pending = load(controller.signal).then(",
+            "    data => {",
+            "      if (generationOf(appId) === generation) {",
+            "        const previous = entry.data;",
+            "        cache.set(key, { data, fetchedAt: Date.now() });",
+            "        if (isPersistedKey(key)) {",
+            "          persistResponse(key, data);",
+            "          // Hintergrund-Abgleich (z.B. nach dem Start aus IndexedDB): nur echte Änderungen melden",
+            "          if (previous !== undefined && !sameData(previous, data)) {",
+            "            refreshListeners.forEach(listener => listener(appId));",
+            "          }",
+            "        }",
+            "      }",
+            "      return data;",
+            "    },",
+            "    error => {",
+            "      const current = cache.get(key);",
+            "      if (current?.pending === pending) {",
+            "        if (current.data === undefined) cache.delete(key);",
+            "        else current.pending = undefined;",
+            "      }",
+            "      throw error;",
+            "    },",
+            "  );",
+            "  entry.pending = pending;",
+            "  entry.controller = controller;",
+            "  entry.waiters = 0;",
+            "  cache.set(key, entry);",
+            "  return pending;",
+            "}",
+            "",
+            "// Wartet auf einen (evtl. geteilten) Request; bricht ihn ab, wenn der letzte wartende Aufrufer abbricht",
+            "function joinPending(cache: CacheMap, key: string, entry: CacheEntry, signal?: AbortSignal): Promise<any> {",
+            "  const pending = entry.pending!;",
+            "  if (!signal) {",
+            "    entry.waiters = Infinity;  // Aufrufer ohne Signal: Request läuft in jedem Fall zu Ende",
+            "    return pending;",
+            "  }",
+            "  if (signal.aborted) return Promise.reject(signal.reason);",
+            "  entry.waiters = (entry.waiters ?? 0) + 1;",
+            "  return new Promise((resolve, reject) => {",
+            "    const onAbort = () => {",
+            "      entry.waiters = (entry.waiters ?? 1) - 1;",
+            "      if (entry.waiters === 0 && entry.pending === pending) {",
+            "        entry.controller?.abort(signal.reason);",
+            "        entry.pending = undefined;",
+            "        if (entry.data === undefined && cache.get(key) === entry) cache.delete(key);",
+            "      }",
+            "      reject(signal.reason);",
+            "    };",
+            "    signal.addEventListener('abort', onAbort, { once: true });",
+            "    pending.then(resolve, reject).finally(() => signal.removeEventListener('abort', onAbort));",
+            "  });",
+            "}",
+            "",
+            "function cachedLoad(cache: CacheMap, key: string, load: Loader, signal?: AbortSignal): Promise<any> {",
+            "  const entry = cache.get(key);",
+            "  if (!entry || entry.data === undefined) {",
+            "    if (!entry?.pending) revalidate(cache, key, load).catch(() => { /* Fehler bekommen die Aufrufer über joinPending */ });",
+            "    return joinPending(cache, key, cache.get(key)!, signal);",
+            "  }",
+            "  const ttl = cacheTtlByApp.get(appIdOf(key) ?? '') ?? DEFAULT_CACHE_TTL_MS;",
+            "  if (Date.now() - entry.fetchedAt >= ttl && !entry.pending) {",
+            "    revalidate(cache, key, load).catch(() => { /* stale data stays until the next attempt */ });",
+            "  }",
+            "  return Promise.resolve(entry.data);",
+            "}",
+            "",
+            "async function cachedGet(endpoint: string, signal?: AbortSignal): Promise<any> {",
+            "  await hydrated(endpoint);",
+            "  return cachedLoad(responseCache, endpoint, requestSignal => fetchApi('GET', endpoint, undefined, requestSignal), signal);",
+            "}",
+            "",
+            "function cachedDerived(key: string, load: Loader, signal?: AbortSignal): Promise<any> {",
+            "  return cachedLoad(derivedCache, key, load, signal);",
+            "}",
+            "",
+        ]
+
+    def _iter_entity_methods(self, app_key: str, declare: str, app_id: str):
+        """
+        CRUD-Methoden einer App. declare ist der Präfix inkl. Einrückung:
+        '  static async ' (Klasse) oder 'export async function ' (Entity-Modul).
+        """
+        names = self.names[app_key]
+        class_name = names.pascal # Plural Interface Name (z.B. Workouts)
+        # Singular Name für Methoden (z.B. getWorkout statt getWorkoutsEntry)
+        singular_name = names.singular
+        indent = declare[:len(declare) - len(declare.lstrip())]
+        body = indent + "  "
+        end = indent + "}"
+
+        # GET ALL
+        yield f"{declare}get{class_name}(signal?: AbortSignal): Promise<{class_name}[]> {{"
+        yield f"{body}const data = await callApi('GET', `/apps/${{{app_id}}}/records`, undefined, signal);"
+        yield f"{body}return Object.entries(data).map(([id, rec]: [string, any]) => ({{"
+        yield f"{body}  record_id: id, ...rec"
+        yield f"{body}}}));"
+        yield end
+
+        # GET ONE
+        yield f"{declare}get{singular_name}(id: string, signal?: AbortSignal): Promise<{class_name} | undefined> {{"
+        yield f"{body}const data = await callApi('GET', `/apps/${{{app_id}}}/records/${{id}}`, undefined, signal);"
+        yield f"{body}return {{ record_id: data.id, ...data }};"
+        yield end
+
+        # CREATE
+        yield f"{declare}create{singular_name}(fields: {class_name}['fields'], signal?: AbortSignal) {{"
+        yield f"{body}return callApi('POST', `/apps/${{{app_id}}}/records`, {{ fields }}, signal);"
+        yield end
+
+        # UPDATE
+        yield f"{declare}update{singular_name}(id: string, fields: Partial<{class_name}['fields']>, signal?: AbortSignal) {{"
+        yield f"{body}return callApi('PATCH', `/apps/${{{app_id}}}/records/${{id}}`, {{ fields }}, signal);"
+        yield end
+
+        # DELETE
+        yield f"{declare}delete{singular_name}(id: string, signal?: AbortSignal) {{"
+        yield f"{body}return callApi('DELETE', `/apps/${{{app_id}}}/records/${{id}}`, undefined, signal);"
+        yield end
+
+        # BULK: Warteschlange mit begrenzter Parallelität, Ergebnis pro Eintrag
+        yield f"{declare}create{class_name}Many(items: {class_name}['fields'][], options?: BulkOptions): Promise<BulkResult[]> {{"
+        yield f"{body}return runBulk(items, (fields, signal) => callApi('POST', `/apps/${{{app_id}}}/records`, {{ fields }}, signal), options);"
+        yield end
+
+        yield f"{declare}update{class_name}Many(items: {{ id: string; fields: Partial<{class_name}['fields']> }}[], options?: BulkOptions): Promise<BulkResult[]> {{"
+        yield f"{body}return runBulk(items, ({{ id, fields }}, signal) => callApi('PATCH', `/apps/${{{app_id}}}/records/${{id}}`, {{ fields }}, signal), options);"
+        yield end
+
+        yield f"{declare}delete{class_name}Many(ids: string[], options?: BulkOptions): Promise<BulkResult[]> {{"
+        yield f"{body}return runBulk(ids, (id, signal) => callApi('DELETE', `/apps/${{{app_id}}}/records/${{id}}`, undefined, signal), options);"
+        yield end
+
+        # COUNT: nur die Anzahl (für KPI-Karten), ohne die Records zu laden
+        yield f"{declare}count{class_name}(signal?: AbortSignal): Promise<number> {{"
+        yield f"{body}return countRecords(`/apps/${{{app_id}}}/records`, signal);"
+        yield end
+
+        # LOOKUP: nur record_id + Anzeigefeld (Applookup-Dropdowns, Anzeigenamen)
+        lookup_fields = ", ".join(f"'{f}'" for f in self.schema[app_key].lookup_fields)
+        yield f"{declare}get{class_name}Lookup(signal?: AbortSignal): Promise<{names.lookup_type}[]> {{"
+        yield f"{body}return projectRecords(`/apps/${{{app_id}}}/records`, [{lookup_fields}], signal);"
+        yield end
+
+        # RESOLVE: nur die angegebenen IDs (z.B. in einer Tabelle referenziert), einzeln gecacht
+        yield f"{declare}get{class_name}LookupByIds(ids: string[], signal?: AbortSignal): Promise<{names.lookup_type}[]> {{"
+        yield f"{body}return resolveRecords({app_id}, ids, [{lookup_fields}], signal);"
+        yield end
+
+        # ITER: Records blockweise, während die Antwort noch lädt
+        generator_declare = declare.rstrip() + "* " if declare.endswith("function ") else declare + "*"
+        yield f"{generator_declare}iter{class_name}(chunkSize = 1000, firstChunk = 100, signal?: AbortSignal): AsyncGenerator<{class_name}[]> {{"
+        yield f"{body}for await (const chunk of streamRecords(`/apps/${{{app_id}}}/records`, chunkSize, firstChunk, signal)) {{"
+        yield f"{body}  yield chunk.map(([id, rec]) => ({{ record_id: id, ...rec }}));"
+        yield f"{body}}}"
+        yield end
+
+        # PAGE: liefert, sobald die Seite (+1 Block für hasMore) da ist; der Rest lädt in den Cache,
+        # weitere Seiten sind dann Ausschnitte der gecachten Liste
+        yield f"{declare}get{class_name}Page(page: number, pageSize = 100, signal?: AbortSignal): Promise<{{ records: {class_name}[]; hasMore: boolean }}> {{"
+        yield f"{body}let index = 0;"
+        yield f"{body}let records: {class_name}[] = [];"
+        yield f"{body}for await (const chunk of streamRecords(`/apps/${{{app_id}}}/records`, pageSize, pageSize, signal)) {{"
+        yield f"{body}  if (index === page + 1) return {{ records, hasMore: true }};"
+        yield f"{body}  if (index === page) records = chunk.map(([id, rec]) => ({{ record_id: id, ...rec }}));"
+        yield f"{body}  index++;"
+        yield f"{body}}}"
+        yield f"{body}return {{ records, hasMore: false }};"
+        yield end
+
+    # ================================================================
+    # Modularer Output: ein Modul pro Entity + Barrels (tree-shakable)
+    # ================================================================
+
+    def _app_id_const(self, app_key: str) -> str:
+        return f"{self.names[app_key].const}_APP_ID"
+
+    def iter_entity_types(self, app_key: str):
+        """src/types/entities/<Entity>.ts — App-ID, Lookup-Typen, Interface, Create-Typ"""
+        interface_name = self.names[app_key].pascal
+        yield "// AUTOMATICALLY GENERATED TYPES - DO NOT EDIT"
+        yield ""
+        yield f"export const {self._app_id_const(app_key)} = '{self.apps[app_key]['app_id']}';"
+        yield ""
+        yield from self._iter_interface(app_key)
+        yield f"export type Create{interface_name} = {interface_name}['fields'];"
+
+    def iter_types_barrel(self):
+        """src/types/app.ts im modularen Modus: re-exportiert die Entity-Module, APP_IDS bleibt erhalten"""
+        yield "// AUTOMATICALLY GENERATED TYPES - DO NOT EDIT"
+        yield "// Barrel für Kompatibilität — die Typen liegen in src/types/entities/*"
+        for app_key in self.apps:
+            yield f"import {{ {self._app_id_const(app_key)} }} from './entities/{self.names[app_key].pascal}';"
+        yield ""
+        for app_key in self.apps:
+            yield f"export * from './entities/{self.names[app_key].pascal}';"
+        yield ""
+        yield "export const APP_IDS = {"
+        for app_key in self.apps:
+            yield f"  {self.names[app_key].const}: {self._app_id_const(app_key)},"
+        yield "} as const;"
+
+    def iter_service_api(self):
+        """src/services/api.ts — Basis-URL, callApi und URL-Helper, geteilt von allen Entity-Services"""
+        yield "// AUTOMATICALLY GENERATED SERVICE"
+        yield ""
+        yield from self._iter_service_helpers(export_call_api=True)
+
+    def iter_entity_service(self, app_key: str):
+        """src/services/entities/<Entity>.ts — CRUD als einzeln importierbare Funktionen"""
+        pascal = self.names[app_key].pascal
+        app_id_const = self._app_id_const(app_key)
+        yield "// AUTOMATICALLY GENERATED SERVICE"
+        yield "import { callApi, streamRecords, countRecords, projectRecords, resolveRecords, runBulk } from '@/services/api';"
+        yield "import type { BulkOptions, BulkResult } from '@/services/api';"
+        yield f"import {{ {app_id_const} }} from '@/types/entities/{pascal}';"
+        yield f"import type {{ {pascal}, {self.names[app_key].lookup_type} }} from '@/types/entities/{pascal}';"
+        yield ""
+        for line in self._iter_entity_methods(app_key, "export async function ", app_id_const):
+            yield line
+            if line == "}":
+                yield ""
+
+    def iter_service_barrel(self):
+        """
+        src/services/livingAppsService.ts im modularen Modus: LivingAppsService bleibt als
+        Objekt erhalten (zieht alle Entities ins Bundle) — neue Seiten importieren direkt
+        aus '@/services/entities/<Entity>'.
+        """
+        yield "// AUTOMATICALLY GENERATED SERVICE"
+        yield "// Barrel für Kompatibilität — für kleinere Route-Chunks direkt aus '@/services/entities/*' importieren"
+        for app_key in self.apps:
+            names = self.names[app_key]
+            yield f"import * as {names.service_ns} from './entities/{names.pascal}';"
+        yield ""
+        yield "export { extractRecordId, createRecordUrl, invalidateCache, setCacheTtl, onCacheRefresh, clearPersistentCache, setCacheScope, ApiError } from './api';"
+        yield "export type { BulkOptions, BulkResult } from './api';"
+        for app_key in self.apps:
+            yield f"export * from './entities/{self.names[app_key].pascal}';"
+        yield ""
+        yield "export const LivingAppsService = {"
+        for app_key in self.apps:
+            yield f"  ...{self.names[app_key].service_ns},"
+        yield "};"
+
+    def iter_files(self):
+        """Liefert (Dateipfad, Zeilen) für Types und Service — Gegenstück zu ReactComponentGenerator.iter_files"""
+        if not self.modular:
+            yield "src/types/app.ts", self.iter_types()
+            yield "src/services/livingAppsService.ts", self.iter_service()
+            return
+
+        for app_key in self.apps:
+            yield f"src/types/entities/{self.names[app_key].pascal}.ts", self.iter_entity_types(app_key)
+        yield "src/types/app.ts", self.iter_types_barrel()
+        yield "src/services/api.ts", self.iter_service_api()
+        for app_key in self.apps:
+            yield f"src/services/entities/{self.names[app_key].pascal}.ts", self.iter_entity_service(app_key)
+        yield "src/services/livingAppsService.ts", self.iter_service_barrel()
+
+
+def write_streamed(files, base_dir: str = ".", on_written=None, buffer_size: int = 1 << 16) -> list:
+    """
+    Schreibt (Dateipfad, Zeilen)-Paare direkt in gepufferte Dateien.
+
+    Jede Datei wird fertig geschrieben, bevor die nächste erzeugt wird — es liegt
+    nie mehr als eine Datei im Speicher. on_written(path) wird pro Datei aufgerufen.
+    """
+    from pathlib import Path
+
+    written = []
+    for rel_path, chunks in files:
+        path = Path(base_dir) / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", buffering=buffer_size) as f:
+            first = True
+            for chunk in chunks:
+                if not first:
+                    f.write("\n")
+                f.write(chunk)
+                first = False
+        written.append(rel_path)
+        if on_written:
+            on_written(rel_path)
+    return written
@@ -16,8 +16,9 @@ export default defineConfig({
     host: true,
     allowedHosts: [".e2b.app"],
     proxy: {
+      // LIVINGAPPS_PROXY_TARGET=http://localhost:8787 routes through dev_proxy.py (record/replay cache)
       '/api/rest': {
-        target: 'https://my.living-apps.de',
+        target: process.env.LIVINGAPPS_PROXY_TARGET ?? 'https://my.living-apps.de',
         changeOrigin: true,
         secure: true,
         rewrite: (path) => path.replace(/^\/api\/rest/, '/rest'),